@@ -0,0 +1 @@
+"""Micro-benchmarks, run from the repository root: ``python -m benchmarks.<name>``."""
@@ -0,0 +1,51 @@
+import json
+import timeit
+
+from vasiniyo_chat_bot.module.dto import Action
+from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import decode_payload
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
+
+USER_ID = 7_123_456_789
+TARGET_ID = 6_987_654_321
+
+SAMPLES = [
+    (Action.ROLL_RANDOM_D6, {Field.USER_ID: USER_ID}),
+    (Action.ROLL_D6, {Field.USER_ID: USER_ID, Field.DICE_VALUE: 6}),
+    (Action.OPEN_STEAL_MENU, {Field.USER_ID: USER_ID, Field.PAGE: 12}),
+    (
+        Action.STEAL_TITLE,
+        {Field.USER_ID: USER_ID, Field.TITLE_BAG_ID: 99_999, Field.TARGET_USER_ID: 1},
+    ),
+    (
+        Action.GIFT_TITLE_MENU,
+        {Field.USER_ID: USER_ID, Field.TARGET_USER_ID: TARGET_ID, Field.PAGE: 300},
+    ),
+    (Action.CAPTCHA_UPDATE, {Field.USER_ID: USER_ID}),
+    (Action.ANIME, {Field.USER_ID: USER_ID, Field.ANIME_GENRE: 12}),
+    (Action.EXCHANGE_TITLE, {Field.USER_ID: -1, Field.TITLE_BAG_ID: 0}),
+]
+
+
+def json_payload(action: Action, fields: dict[Field, int]) -> str:
+    return json.dumps(
+        {Field.ACTION_TYPE.value: action.value}
+        | {field.value: value for field, value in fields.items()}
+    )
+
+
+def benchmark(number: int = 100_000):
+    print(f"{'action':<26}{'json':>6}{'codec':>7}{'json us':>10}{'codec us':>10}")
+    for action, fields in SAMPLES:
+        legacy = json_payload(action, fields)
+        encoded = encode_payload(action, fields)
+        json_time = timeit.timeit(lambda: decode_payload(legacy), number=number)
+        codec_time = timeit.timeit(lambda: decode_payload(encoded), number=number)
+        print(
+            f"{action.name:<26}{len(legacy):>6}{len(encoded):>7}"
+            f"{json_time / number * 1e6:>10.2f}{codec_time / number * 1e6:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
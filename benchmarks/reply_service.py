@@ -0,0 +1,56 @@
+import random
+import timeit
+
+from vasiniyo_chat_bot.module.reply.dto import LongMessage
+from vasiniyo_chat_bot.module.reply.dto import MessageType
+from vasiniyo_chat_bot.module.reply.dto import TextTrigger
+from vasiniyo_chat_bot.module.reply.dto import TriggerReplies
+from vasiniyo_chat_bot.module.reply.fuzzy_match import fuzzy_match
+from vasiniyo_chat_bot.module.reply.reply_service import ReplyService
+
+WORDS = ["привет", "пока", "кот", "собака", "бот", "ghbdtn", "hello", "мир", "чай"]
+
+
+def text_trigger(request: str, response: str) -> TextTrigger:
+    return TextTrigger(
+        response_type=MessageType.TEXT,
+        request=request,
+        responses=[response],
+        chance=1.0,
+        to_target=False,
+        fuzzy=True,
+        exact_match=False,
+    )
+
+
+def random_keys(rnd: random.Random, count: int) -> list[str]:
+    return [
+        " ".join(rnd.choice(WORDS) + rnd.choice(["", "а", "ы"]) for _ in range(n))
+        for n in (rnd.randint(1, 3) for _ in range(count))
+    ]
+
+
+def benchmark(triggers: int = 1000, number: int = 200):
+    rnd = random.Random(1)
+    keys = random_keys(rnd, triggers)
+    service = ReplyService(
+        LongMessage([], 4096),
+        TriggerReplies([text_trigger(key, "ok") for key in keys], []),
+    )
+    messages = [" ".join(random_keys(rnd, 6)) for _ in range(number)]
+
+    def per_trigger():
+        for message in messages:
+            for key in keys:
+                fuzzy_match.test_match(message, [key])
+
+    before = timeit.timeit(per_trigger, number=1) / number
+    after = timeit.timeit(
+        lambda: [service.handle_text_replies(m) for m in messages], number=1
+    )
+    print(f"{'per trigger':<22}{before * 1e3:>10.2f} ms")
+    print(f"{'compiled index':<22}{after / number * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,40 @@
+from pathlib import Path
+import sqlite3
+import tempfile
+import timeit
+
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+
+
+def count(conn: sqlite3.Connection) -> int:
+    return conn.execute("select count(*) from items").fetchone()[0]
+
+
+def benchmark(number: int = 5_000):
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = str(Path(directory) / "benchmark.db")
+        with sqlite3.connect(database_path) as conn:
+            conn.execute("create table items (value integer)")
+
+        def connect_per_call():
+            conn = sqlite3.connect(database_path)
+            try:
+                count(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
+        repository = SqliteRepository(SqliteDatabaseSettings(database_path))
+        before = timeit.timeit(connect_per_call, number=number)
+        after = timeit.timeit(lambda: repository.transaction(count), number=number)
+        SqliteConnectionManager.close_all()
+    print(f"{'connect per call':<22}{before / number * 1e6:>10.2f} us")
+    print(f"{'persistent':<22}{after / number * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    benchmark()
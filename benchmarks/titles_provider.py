@@ -0,0 +1,23 @@
+from pathlib import Path
+import timeit
+
+import toml
+
+from vasiniyo_chat_bot.config import CustomTitlesReader
+from vasiniyo_chat_bot.module.titles.titles_provider import TitlesProvider
+
+EXAMPLE_CONFIG = Path(__file__).parent.parent / "instances/bot-example/config.toml"
+
+
+def benchmark(number: int = 100_000):
+    custom_titles = CustomTitlesReader(toml.load(EXAMPLE_CONFIG)).load()
+    build = timeit.timeit(lambda: TitlesProvider(custom_titles), number=10) / 10
+    provider = TitlesProvider(custom_titles)
+    draw = timeit.timeit(provider.next_title, number=number) / number
+    print(f"{'titles':<22}{provider.size:>10}")
+    print(f"{'index build':<22}{build * 1e3:>10.2f} ms")
+    print(f"{'next_title':<22}{draw * 1e6:>10.2f} us")
+
+
+if __name__ == "__main__":
+    benchmark()
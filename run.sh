@@ -8,18 +8,21 @@
 
 usage() {
     cat <<EOF
-Usage: $(basename "$0") --instance <name> [--runtime <local|docker>] [--test]
+Usage: $(basename "$0") --instance <name> [--runtime <local|docker>] [--test] [--webhook]
 
 Options:
   -r, --runtime   runtime mode (default: docker)
   -i, --instance  instance name (required)
       --test      enable test mode
+  -w, --webhook   receive updates via webhook instead of long polling
+                  (WEBHOOK_URL, WEBHOOK_SECRET_TOKEN, WEBHOOK_PORT from .env-instance)
       --stop      stop docker container
   -h, --help      display this help and exit
 
 Examples:
   $(basename "$0") --runtime local --instance bot-example --test
   $(basename "$0") -r docker -i bot-example
+  $(basename "$0") -r docker -i bot-example --webhook
   $(basename "$0") --stop bot-example
 EOF
     exit 1
@@ -65,6 +68,10 @@ while [[ $# -gt 0 ]]; do
             TEST_MODE="true"
             shift
             ;;
+        -w|--webhook)
+            UPDATE_MODE="webhook"
+            shift
+            ;;
         --stop)
             STOP_CONTAINER=1
             shift
@@ -128,7 +135,7 @@ if [[ "$RUNTIME_MODE" == "local" ]]; then
   "$python" -m pip install --upgrade pip
   "$python" -m pip install -r "$SCRIPT_DIR/requirements.txt"
   "$python" -m pip install -e "$SCRIPT_DIR"
-  export TEST_MODE CONFIG_PATH DATABASE_PATH
+  export TEST_MODE CONFIG_PATH DATABASE_PATH UPDATE_MODE
   set -a
   test -f "$ENV_FILE" && source "$ENV_FILE"
   set +a
@@ -145,6 +152,10 @@ if [ $? -ne 0 ]; then
 fi
 echo "Stopping old $CONTAINER_NAME..." && docker stop "$CONTAINER_NAME" 2>/dev/null
 echo "Removing old $CONTAINER_NAME..." && docker rm "$CONTAINER_NAME" 2>/dev/null
+if [[ "$UPDATE_MODE" == "webhook" ]]; then
+  WEBHOOK_PORT="$(test -f "$ENV_FILE" && sed -n 's/^WEBHOOK_PORT=//p' "$ENV_FILE")"
+  PUBLISH_PORT="-p ${WEBHOOK_PORT:-8080}:${WEBHOOK_PORT:-8080}"
+fi
 docker run -d \
            --rm \
            --name "$CONTAINER_NAME" \
@@ -152,7 +163,9 @@ docker run -d \
            -v "$CONFIG_PATH:/config.toml:ro" \
            -v "$DATA_PATH:/data" \
            -v "$LOG_FILE:/logs/logs.log" \
+           $PUBLISH_PORT \
            -e TEST_MODE="$TEST_MODE" \
+           -e UPDATE_MODE="$UPDATE_MODE" \
            -e CONFIG_PATH="/config.toml" \
            -e DATABASE_PATH="/data/database.db" \
            "$CONTAINER_NAME:latest"
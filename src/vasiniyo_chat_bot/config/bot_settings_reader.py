@@ -24,6 +24,7 @@ class BotSettings:
     language: str
     mods: list[str]
     commands: dict[CommandKey, CommandInfo]
+    update_workers: int
 
 
 class BotSettingsReader:
@@ -81,6 +82,7 @@ class BotSettingsReader:
             language=self._section.get("lang", "ru"),
             mods=mods_section,
             commands=command_mods | inner_mods,
+            update_workers=self._section.get("update_workers", 4),
         )
 
     @staticmethod
@@ -15,6 +15,7 @@ from vasiniyo_chat_bot.config.captcha_reader import CaptchaReader
 from vasiniyo_chat_bot.config.daily_size_reader import DailySizeReader
 from vasiniyo_chat_bot.config.database_reader import DatabaseReader
 from vasiniyo_chat_bot.config.dto import Config
+from vasiniyo_chat_bot.config.webhook_reader import WebhookReader
 from vasiniyo_chat_bot.safely_bot_utils import safe_wrapper
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ def load_all(path: str):
         event=EventReader(toml_config).load(),
         bot_settings=bot_settings,
         database=DatabaseReader(toml_config).load(),
+        webhook=WebhookReader(toml_config).load(),
     )
 
 
@@ -5,13 +5,45 @@ from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSetti
 
 
 class DatabaseReader:
+    _journal_modes = ["delete", "truncate", "persist", "memory", "wal", "off"]
+    _synchronous = ["off", "normal", "full", "extra"]
+    _temp_stores = ["default", "file", "memory"]
+
     def __init__(self, section: dict[str, any]) -> None:
         self._section = section
 
     def load(self) -> DatabaseSettings:
-        database_type = self._section.get("database", {}).get("type", "sqlite")
+        database = self._section.get("database", {})
+        database_type = database.get("type", "sqlite")
         if database_type.lower() == "sqlite":
             return SqliteDatabaseSettings(
-                database_path=os.environ.get("DATABASE_PATH", "data/database.db")
+                database_path=os.environ.get("DATABASE_PATH", "data/database.db"),
+                journal_mode=self._choice(
+                    database, "journal_mode", "wal", self._journal_modes
+                ),
+                synchronous=self._choice(
+                    database, "synchronous", "normal", self._synchronous
+                ),
+                cache_size=int(database.get("cache_size", -16000)),
+                mmap_size=int(database.get("mmap_size", 64 << 20)),
+                temp_store=self._choice(
+                    database, "temp_store", "memory", self._temp_stores
+                ),
+                busy_timeout=int(database.get("busy_timeout", 5000)),
+                wal_autocheckpoint=int(database.get("wal_autocheckpoint", 1000)),
+                checkpoint_on_close=bool(database.get("checkpoint_on_close", True)),
+                write_executor=bool(database.get("write_executor", True)),
+                write_batch_window_ms=float(database.get("write_batch_window_ms", 5)),
+                write_batch_size=int(database.get("write_batch_size", 64)),
+                durable_tasks=bool(database.get("durable_tasks", True)),
             )
         raise ValueError(f"Unknown database type: {database_type}")
+
+    @staticmethod
+    def _choice(
+        database: dict[str, any], key: str, default: str, allowed: list[str]
+    ) -> str:
+        value = str(database.get(key, default)).lower()
+        if value not in allowed:
+            raise ValueError(f"Unknown {key}: {value}, expected one of {allowed}")
+        return value
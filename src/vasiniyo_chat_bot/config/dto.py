@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from vasiniyo_chat_bot.config.bot_settings_reader import BotSettings
+from vasiniyo_chat_bot.config.webhook_reader import WebhookSettings
 from vasiniyo_chat_bot.module.captcha.dto import Captcha
 from vasiniyo_chat_bot.module.daily_size.dto import DailySizeSettings
 from vasiniyo_chat_bot.module.drink.dto import Drinks
@@ -26,3 +27,4 @@ class Config:
     event: Event
     bot_settings: BotSettings
     database: DatabaseSettings
+    webhook: WebhookSettings | None
@@ -1,12 +1,18 @@
+from itertools import product
 import logging
+import re
+import sys
 
 from vasiniyo_chat_bot.module.reply.dto import MessageType
 from vasiniyo_chat_bot.module.reply.dto import StickerTrigger
 from vasiniyo_chat_bot.module.reply.dto import TextTrigger
+from vasiniyo_chat_bot.module.reply.dto import Trigger
 from vasiniyo_chat_bot.module.reply.dto import TriggerReplies
 
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
 
 class ReplyReader:
     def __init__(
@@ -31,6 +37,15 @@ class ReplyReader:
             ),
         ]
         sticker_replies = self._build_sticker_to_sticker(stickers)
+        logger.info(
+            "reply_triggers_compiled",
+            extra={
+                "text_triggers": len(text_replies),
+                "sticker_triggers": len(sticker_replies),
+                "size_bytes": self._size_of(text_replies)
+                + self._size_of(sticker_replies),
+            },
+        )
         return TriggerReplies(
             text_replies=text_replies, sticker_replies=sticker_replies
         )
@@ -60,12 +75,7 @@ class ReplyReader:
         exact_match=False,
         chance: float = 1.0,
     ) -> list[TextTrigger]:
-        expanded = {
-            req.replace(f"{{{category[0]}}}", value): self._to_list(res)
-            for req, res in self._section.get(key, {}).items()
-            for category in self._section.get("categories", {}).items()
-            for value in category[1]
-        }
+        expanded = self._expand_templates(self._section.get(key, {}))
         return [
             TextTrigger(
                 response_type=MessageType.TEXT,
@@ -97,12 +107,26 @@ class ReplyReader:
         ]
 
     def _expand_templates(self, template_dict: dict) -> dict[str, list[str]]:
-        return {
-            req.replace(f"{{{category[0]}}}", value): self._to_list(res)
-            for req, res in template_dict.items()
-            for category in self._section.get("categories", {}).items()
-            for value in category[1]
-        }
+        """
+        Expands every ``{category}`` placeholder of a request template over
+        the values of that category. Only the categories a template refers
+        to are expanded, templates without placeholders are kept as is, and
+        equal requests are deduplicated with the later template winning.
+        """
+        categories = self._section.get("categories", {})
+        expanded = {}
+        for req, res in template_dict.items():
+            names = [
+                name
+                for name in dict.fromkeys(_PLACEHOLDER.findall(req))
+                if name in categories
+            ]
+            for values in product(*(categories[name] for name in names)):
+                request = req
+                for name, value in zip(names, values):
+                    request = request.replace(f"{{{name}}}", value)
+                expanded[request] = self._to_list(res)
+        return expanded
 
     def _load_stickers(self) -> dict[str, str]:
         stickers = {}
@@ -133,6 +157,16 @@ class ReplyReader:
             stickers[sticker_name] = file_id
         return stickers
 
+    @staticmethod
+    def _size_of(triggers: list[Trigger]) -> int:
+        return sum(
+            sys.getsizeof(trigger)
+            + sys.getsizeof(trigger.request)
+            + sys.getsizeof(trigger.responses)
+            + sum(sys.getsizeof(response) for response in trigger.responses)
+            for trigger in triggers
+        )
+
     @staticmethod
     def _to_list(value: str | list[str]) -> list[str]:
         return [value] if isinstance(value, str) else value
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+import os
+import secrets
+
+
+@dataclass(frozen=True)
+class WebhookSettings:
+    url: str
+    path: str
+    host: str
+    port: int
+    secret_token: str
+    max_body_size: int
+
+
+class WebhookReader:
+    def __init__(self, section: dict[str, any]) -> None:
+        self._section = section
+
+    def load(self) -> WebhookSettings | None:
+        webhook = self._section.get("webhook", {})
+        mode = os.environ.get("UPDATE_MODE") or webhook.get("mode", "polling")
+        if mode.lower() == "polling":
+            return None
+        if mode.lower() != "webhook":
+            raise ValueError(f"Unknown update mode: {mode}")
+        url = os.environ.get("WEBHOOK_URL") or webhook.get("url")
+        if not url:
+            raise ValueError("WEBHOOK_URL is not set for webhook mode")
+        path = "/" + webhook.get("path", "webhook").strip("/")
+        return WebhookSettings(
+            url=url.rstrip("/") + path,
+            path=path,
+            host=webhook.get("host", "0.0.0.0"),
+            port=int(os.environ.get("WEBHOOK_PORT") or webhook.get("port", 8080)),
+            secret_token=(
+                os.environ.get("WEBHOOK_SECRET_TOKEN") or secrets.token_urlsafe(32)
+            ),
+            max_body_size=webhook.get("max_body_size", 1 << 20),
+        )
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+import sqlite3
+from sqlite3 import Connection
+import threading
+import time
+from typing import Callable
+from typing import TypeVar
+
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.sqlite_writer import SqliteWriter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SqliteConnectionManager:
+    """Keeps one long-lived connection per thread for a database file.
+
+    Transactions started while another one is open on the same thread join
+    the outer transaction, so nested repository calls commit together.
+
+    Every connection gets the pragma profile of the settings. In WAL mode the
+    log is truncated by a checkpoint when the manager is closed.
+
+    A connection idle for longer than ``health_check_after`` seconds is probed
+    with ``select 1`` before reuse and reopened if the probe fails.
+    Connections of finished threads are closed when new ones are opened.
+
+    With ``write_executor`` enabled, writes are group-committed by a single
+    ``SqliteWriter`` thread instead of running on the caller's thread.
+    """
+
+    _managers: dict[str, SqliteConnectionManager] = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(
+        self, settings: SqliteDatabaseSettings, health_check_after: float = 60
+    ) -> None:
+        self._settings = settings
+        self._database_path = settings.database_path
+        self._health_check_after = health_check_after
+        self._local = threading.local()
+        self._connections: dict[threading.Thread, Connection] = {}
+        self._lock = threading.Lock()
+        self._writer: SqliteWriter | None = None
+
+    @classmethod
+    def for_database(cls, settings: SqliteDatabaseSettings) -> SqliteConnectionManager:
+        with cls._managers_lock:
+            manager = cls._managers.get(settings.database_path)
+            if manager is None:
+                manager = cls(settings)
+                cls._managers[settings.database_path] = manager
+            return manager
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._managers_lock:
+            managers = list(cls._managers.values())
+            cls._managers.clear()
+        for manager in managers:
+            manager.close()
+
+    def transaction(self, block: Callable[[Connection], T]) -> T:
+        exists_conn = getattr(self._local, "tx", None)
+        if exists_conn:
+            return block(exists_conn)
+        conn = self.connection()
+        try:
+            self._local.tx = conn
+            try:
+                result = block(conn)
+                conn.commit()
+                return result
+            except:
+                conn.rollback()
+                raise
+        finally:
+            self._local.tx = None
+
+    def submit_write(self, block: Callable[[Connection], T]) -> Future[T]:
+        if not self._settings.write_executor or getattr(self._local, "tx", None):
+            future = Future()
+            try:
+                future.set_result(self.transaction(block))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        with self._lock:
+            if self._writer is None:
+                self._writer = SqliteWriter(
+                    self,
+                    self._settings.write_batch_window_ms / 1000,
+                    self._settings.write_batch_size,
+                )
+        return self._writer.submit(block)
+
+    def run_batch(
+        self, blocks: list[Callable[[Connection], object]]
+    ) -> list[tuple[bool, object]]:
+        conn = self.connection()
+        outcomes = []
+        try:
+            self._local.tx = conn
+            conn.execute("begin immediate")
+            for block in blocks:
+                conn.execute("savepoint batch_write")
+                try:
+                    outcomes.append((True, block(conn)))
+                except Exception as e:
+                    conn.execute("rollback to batch_write")
+                    outcomes.append((False, e))
+                conn.execute("release batch_write")
+            conn.commit()
+            return outcomes
+        except:
+            conn.rollback()
+            raise
+        finally:
+            self._local.tx = None
+
+    def connection(self) -> Connection:
+        conn = getattr(self._local, "persistent", None)
+        now = time.monotonic()
+        if conn is not None and now - self._local.used_at > self._health_check_after:
+            conn = self._checked(conn)
+        if conn is None:
+            conn = self._open()
+        self._local.used_at = now
+        return conn
+
+    def report(self) -> dict[str, str | int]:
+        conn = self.connection()
+        effective = {
+            name: conn.execute(f"pragma {name}").fetchone()[0]
+            for name in self._settings.pragmas()
+        }
+        logger.info(
+            "sqlite_settings", extra={"database": self._database_path, **effective}
+        )
+        return effective
+
+    def checkpoint(self, mode: str = "passive") -> tuple[int, int, int]:
+        return self.connection().execute(f"pragma wal_checkpoint({mode})").fetchone()
+
+    def close(self) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.stop()
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        if connections and self._checkpoints_on_close():
+            try:
+                busy, log, checkpointed = (
+                    connections[0].execute("pragma wal_checkpoint(truncate)").fetchone()
+                )
+                logger.info(
+                    "sqlite_checkpoint",
+                    extra={
+                        "database": self._database_path,
+                        "busy": busy,
+                        "log": log,
+                        "checkpointed": checkpointed,
+                    },
+                )
+            except sqlite3.Error:
+                logger.exception(
+                    "sqlite_checkpoint_failed", extra={"database": self._database_path}
+                )
+        for conn in connections:
+            conn.close()
+        logger.info(
+            "sqlite_connections_closed",
+            extra={"database": self._database_path, "count": len(connections)},
+        )
+
+    def _checked(self, conn: Connection) -> Connection | None:
+        try:
+            conn.execute("select 1").fetchone()
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(
+                "sqlite_connection_unhealthy",
+                extra={"database": self._database_path, "reason": str(e)},
+            )
+            self._forget(threading.current_thread())
+            return None
+
+    def _open(self) -> Connection:
+        conn = sqlite3.connect(self._database_path, check_same_thread=False)
+        for name, value in self._settings.pragmas().items():
+            conn.execute(f"pragma {name} = {value}")
+        with self._lock:
+            for thread in [t for t in self._connections if not t.is_alive()]:
+                self._connections.pop(thread).close()
+            self._connections[threading.current_thread()] = conn
+        self._local.persistent = conn
+        return conn
+
+    def _checkpoints_on_close(self) -> bool:
+        return (
+            self._settings.checkpoint_on_close and self._settings.journal_mode == "wal"
+        )
+
+    def _forget(self, thread: threading.Thread) -> None:
+        with self._lock:
+            conn = self._connections.pop(thread, None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local.persistent = None
@@ -1,4 +1,8 @@
+from .captcha_users_dao import CaptchaUsersDao
+from .chat_users_dao import ChatUsersDao
 from .events_dao import EventsDao
 from .likes_dao import LikesDao
+from .pending_titles_dao import PendingTitlesDao
+from .scheduled_tasks_dao import ScheduledTasksDao
 from .titles_bag_dao import TitlesBagDAO
 from .titles_states_dao import TitlesStatesDAO
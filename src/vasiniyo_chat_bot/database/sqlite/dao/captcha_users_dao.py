@@ -0,0 +1,46 @@
+from sqlite3 import Connection
+
+from vasiniyo_chat_bot.database.sqlite.entity import CaptchaUserEntity
+from vasiniyo_chat_bot.database.sqlite.util import SQLiteDao
+
+
+class CaptchaUsersDao:
+    @staticmethod
+    def save(conn: Connection, captcha_user: CaptchaUserEntity) -> None:
+        SQLiteDao.execute(
+            conn,
+            """
+            insert or replace into captcha_users
+            (chat_id, user_id, failed_attempts, time_left, answer)
+            values (?, ?, ?, ?, ?)
+            """,
+            (
+                captcha_user.chat_id,
+                captcha_user.user_id,
+                captcha_user.failed_attempts,
+                captcha_user.time_left,
+                captcha_user.answer,
+            ),
+        )
+
+    @staticmethod
+    def find(conn: Connection, chat_id: int, user_id: int) -> CaptchaUserEntity | None:
+        row = SQLiteDao.fetchone(
+            conn,
+            """
+            select chat_id, user_id, failed_attempts, time_left, answer
+            from captcha_users
+            where chat_id = ?
+            and user_id = ?
+            """,
+            (chat_id, user_id),
+        )
+        return CaptchaUserEntity(*row) if row else None
+
+    @staticmethod
+    def delete(conn: Connection, chat_id: int, user_id: int) -> None:
+        SQLiteDao.execute(
+            conn,
+            "delete from captcha_users where chat_id = ? and user_id = ?",
+            (chat_id, user_id),
+        )
@@ -0,0 +1,53 @@
+from sqlite3 import Connection
+
+from vasiniyo_chat_bot.database.sqlite.entity import ChatUserEntity
+from vasiniyo_chat_bot.database.sqlite.util import SQLiteDao
+
+
+class ChatUsersDao:
+    @staticmethod
+    def save(
+        conn: Connection,
+        chat_id: int,
+        user_id: int,
+        username: str | None,
+        full_name: str,
+        is_member: bool | None,
+    ) -> None:
+        SQLiteDao.execute(
+            conn,
+            """
+            insert into chat_users (chat_id, user_id, username, full_name, last_seen, is_member)
+            values (?, ?, ?, ?, strftime('%s', 'now'), ?)
+            on conflict (chat_id, user_id)
+            do update set
+                username = excluded.username,
+                full_name = excluded.full_name,
+                last_seen = excluded.last_seen,
+                is_member = coalesce(excluded.is_member, is_member)
+            """,
+            (chat_id, user_id, username, full_name, is_member),
+        )
+
+    @staticmethod
+    def find(conn: Connection, chat_id: int, user_id: int) -> ChatUserEntity | None:
+        row = SQLiteDao.fetchone(
+            conn,
+            """
+            select chat_id, user_id, username, full_name, last_seen, is_member
+            from chat_users
+            where chat_id = ?
+            and user_id = ?
+            """,
+            (chat_id, user_id),
+        )
+        if not row:
+            return None
+        return ChatUserEntity(
+            chat_id=row[0],
+            user_id=row[1],
+            username=row[2],
+            full_name=row[3],
+            last_seen=row[4],
+            is_member=None if row[5] is None else bool(row[5]),
+        )
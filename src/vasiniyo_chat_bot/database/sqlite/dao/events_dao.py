@@ -49,14 +49,13 @@ class EventsDao:
         return SQLiteDao.fetchall(
             conn,
             """
-            select winner_user_id, winner_count
-            from (select distinct winner_user_id,
-                                  count(*) over (partition by winner_user_id) as winner_count
-                  from events
-                  where chat_id = ?
-                  and event_id = ?)
-            order by winner_count desc
-            limit ?            
+            select user_id, n
+            from win_counts
+            where chat_id = ?
+            and event_id = ?
+            and n > 0
+            order by n desc, user_id
+            limit ?
             """,
             (chat_id, event_id, limit),
         )
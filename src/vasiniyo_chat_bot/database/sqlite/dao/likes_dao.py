@@ -32,13 +32,12 @@ class LikesDao:
         return SQLiteDao.fetchall(
             conn,
             """
-            select to_user_id, like_count
-            from (select distinct to_user_id,
-                                  count(*) over (partition by to_user_id) as like_count
-                  from likes
-                  where chat_id = ?)
-            order by like_count desc
-            limit ?            
+            select user_id, n
+            from like_counts
+            where chat_id = ?
+            and n > 0
+            order by n desc, user_id
+            limit ?
             """,
             (chat_id, limit),
         )
@@ -50,11 +49,11 @@ class LikesDao:
         result_row = SQLiteDao.fetchone(
             conn,
             """
-            select count(to_user_id)
-            from likes 
-            where chat_id = ? 
-            and to_user_id = ?
+            select n
+            from like_counts
+            where chat_id = ?
+            and user_id = ?
             """,
             (chat_id, to_user_id),
         )
-        return result_row[0] if result_row else None
+        return result_row[0] if result_row else 0
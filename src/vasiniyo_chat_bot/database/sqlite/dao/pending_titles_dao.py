@@ -0,0 +1,48 @@
+from sqlite3 import Connection
+
+from vasiniyo_chat_bot.database.sqlite.util import SQLiteDao
+
+
+class PendingTitlesDao:
+    @staticmethod
+    def save(
+        conn: Connection, chat_id: int, user_id: int, day: int, title: str
+    ) -> None:
+        SQLiteDao.execute(
+            conn,
+            """
+            insert into pending_titles (chat_id, user_id, day, title)
+            values (?, ?, ?, ?)
+            on conflict (chat_id, user_id)
+            do update set day = excluded.day, title = excluded.title
+            """,
+            (chat_id, user_id, day, title),
+        )
+
+    @staticmethod
+    def find(conn: Connection, chat_id: int, user_id: int, day: int) -> str | None:
+        row = SQLiteDao.fetchone(
+            conn,
+            """
+            select title from pending_titles
+            where chat_id = ?
+            and user_id = ?
+            and day = ?
+            """,
+            (chat_id, user_id, day),
+        )
+        return row[0] if row else None
+
+    @staticmethod
+    def delete(conn: Connection, chat_id: int, user_id: int) -> None:
+        SQLiteDao.execute(
+            conn,
+            "delete from pending_titles where chat_id = ? and user_id = ?",
+            (chat_id, user_id),
+        )
+
+    @staticmethod
+    def delete_before(conn: Connection, day: int) -> int:
+        return SQLiteDao.execute(
+            conn, "delete from pending_titles where day < ?", (day,)
+        ).rowcount
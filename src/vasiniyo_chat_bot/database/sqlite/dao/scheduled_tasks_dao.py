@@ -0,0 +1,54 @@
+import json
+from sqlite3 import Connection
+
+from vasiniyo_chat_bot.database.sqlite.entity import ScheduledTaskEntity
+from vasiniyo_chat_bot.database.sqlite.util import SQLiteDao
+
+
+class ScheduledTasksDao:
+    @staticmethod
+    def save(conn: Connection, task: ScheduledTaskEntity) -> None:
+        SQLiteDao.execute(
+            conn,
+            """
+            insert or replace into scheduled_tasks
+            (task_id, kind, args, timestamps, started_at, ends_at)
+            values (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                task.task_id,
+                task.kind,
+                json.dumps(task.args, separators=(",", ":")),
+                json.dumps(task.timestamps, separators=(",", ":")),
+                task.started_at,
+                task.started_at + max(task.timestamps, default=0),
+            ),
+        )
+
+    @staticmethod
+    def delete(conn: Connection, task_id: str) -> None:
+        SQLiteDao.execute(
+            conn, "delete from scheduled_tasks where task_id = ?", (task_id,)
+        )
+
+    @staticmethod
+    def find_all(conn: Connection) -> list[ScheduledTaskEntity]:
+        rows = SQLiteDao.fetchall(
+            conn,
+            """
+            select task_id, kind, args, timestamps, started_at
+            from scheduled_tasks
+            order by ends_at
+            """,
+            (),
+        )
+        return [
+            ScheduledTaskEntity(
+                task_id=row[0],
+                kind=row[1],
+                args=json.loads(row[2]),
+                timestamps=json.loads(row[3]),
+                started_at=row[4],
+            )
+            for row in rows
+        ]
@@ -162,3 +162,139 @@ class TitlesBagDAO:
             )
             for row in result_set
         ]
+
+    @staticmethod
+    def page_inventory(
+        conn: Connection,
+        chat_id: int,
+        user_id: int,
+        cursor: tuple[str, int] | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        op, order = (">", "asc") if forward else ("<", "desc")
+        keyset = f"and (user_title, id) {op} (?, ?)" if cursor else ""
+        result_set = SQLiteDao.fetchall(
+            conn,
+            f"""
+            select id, chat_id, user_id, user_title, is_inventory
+            from titles_bag
+            where chat_id = ?
+            and user_id = ?
+            and is_inventory = 1
+            {keyset}
+            order by user_title {order}, id {order}
+            limit ?
+            """,
+            (chat_id, user_id, *(cursor or ()), limit),
+        )
+        return [TitlesBagDAO._to_entity(row) for row in result_set]
+
+    @staticmethod
+    def page_user_titles(
+        conn: Connection,
+        chat_id: int,
+        user_id: int,
+        cursor: tuple[bool, str, int] | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        op, order = (">", "asc") if forward else ("<", "desc")
+        keyset = f"and (is_inventory, user_title, id) {op} (?, ?, ?)" if cursor else ""
+        result_set = SQLiteDao.fetchall(
+            conn,
+            f"""
+            select id, chat_id, user_id, user_title, is_inventory
+            from titles_bag
+            where chat_id = ?
+            and user_id = ?
+            {keyset}
+            order by is_inventory {order}, user_title {order}, id {order}
+            limit ?
+            """,
+            (chat_id, user_id, *(cursor or ()), limit),
+        )
+        return [TitlesBagDAO._to_entity(row) for row in result_set]
+
+    @staticmethod
+    def count_titles(conn: Connection, chat_id: int, user_id: int) -> int:
+        result_row = SQLiteDao.fetchone(
+            conn,
+            """
+            select n
+            from title_counts
+            where chat_id = ?
+            and user_id = ?
+            """,
+            (chat_id, user_id),
+        )
+        return result_row[0] if result_row else 0
+
+    @staticmethod
+    def page_title_counts(
+        conn: Connection,
+        chat_id: int,
+        exclude_user_id: int,
+        cursor: tuple[int, int] | None,
+        forward: bool,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        if cursor is None:
+            return SQLiteDao.fetchall(
+                conn,
+                """
+                select user_id, n
+                from title_counts
+                where chat_id = ?
+                and user_id != ?
+                and n > 0
+                order by n desc, user_id asc
+                limit ?
+                """,
+                (chat_id, exclude_user_id, limit),
+            )
+        if forward:
+            same_count, other_counts = "user_id > ?", "n < ? and n > 0"
+            same_order, other_order = "user_id asc", "n desc, user_id asc"
+        else:
+            same_count, other_counts = "user_id < ?", "n > ?"
+            same_order, other_order = "user_id desc", "n asc, user_id desc"
+        n, user_id = cursor
+        return SQLiteDao.fetchall(
+            conn,
+            f"""
+            select user_id, n from (
+                select user_id, n
+                from title_counts
+                where chat_id = ?
+                and user_id != ?
+                and n = ?
+                and {same_count}
+                order by {same_order}
+                limit ?
+            )
+            union all
+            select user_id, n from (
+                select user_id, n
+                from title_counts
+                where chat_id = ?
+                and user_id != ?
+                and {other_counts}
+                order by {other_order}
+                limit ?
+            )
+            limit ?
+            """,
+            (chat_id, exclude_user_id, n, user_id, limit)
+            + (chat_id, exclude_user_id, n, limit, limit),
+        )
+
+    @staticmethod
+    def _to_entity(row: tuple) -> TitlesBagEntity:
+        return TitlesBagEntity(
+            id=row[0],
+            chat_id=row[1],
+            user_id=row[2],
+            user_title=row[3],
+            is_inventory=row[4],
+        )
@@ -1,4 +1,7 @@
+from .captcha_user_entity import CaptchaUserEntity
+from .chat_user_entity import ChatUserEntity
 from .event_entity import EventEntity
 from .like_entity import LikeEntity
+from .scheduled_task_entity import ScheduledTaskEntity
 from .title_bag_entity import TitlesBagEntity
 from .title_entity import TitlesStateEntity
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CaptchaUserEntity:
+    chat_id: int
+    user_id: int
+    failed_attempts: int
+    time_left: int
+    answer: str
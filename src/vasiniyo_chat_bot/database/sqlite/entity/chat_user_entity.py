@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ChatUserEntity:
+    chat_id: int
+    user_id: int
+    username: str | None
+    full_name: str
+    last_seen: int
+    is_member: bool | None
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ScheduledTaskEntity:
+    task_id: str
+    kind: str
+    args: list
+    timestamps: list[float]
+    started_at: float
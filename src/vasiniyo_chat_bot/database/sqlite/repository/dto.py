@@ -6,3 +6,26 @@ from vasiniyo_chat_bot.config.dto import DatabaseSettings
 @dataclass(frozen=True)
 class SqliteDatabaseSettings(DatabaseSettings):
     database_path: str
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    cache_size: int = -16000
+    mmap_size: int = 64 << 20
+    temp_store: str = "memory"
+    busy_timeout: int = 5000
+    wal_autocheckpoint: int = 1000
+    checkpoint_on_close: bool = True
+    write_executor: bool = True
+    write_batch_window_ms: float = 5
+    write_batch_size: int = 64
+    durable_tasks: bool = True
+
+    def pragmas(self) -> dict[str, str | int]:
+        return {
+            "busy_timeout": self.busy_timeout,
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+            "temp_store": self.temp_store,
+            "wal_autocheckpoint": self.wal_autocheckpoint,
+        }
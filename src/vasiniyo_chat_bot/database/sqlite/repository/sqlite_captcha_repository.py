@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import astuple
+import logging
+
+from vasiniyo_chat_bot.database.sqlite.dao.captcha_users_dao import CaptchaUsersDao
+from vasiniyo_chat_bot.database.sqlite.entity import CaptchaUserEntity
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+from vasiniyo_chat_bot.module.captcha.captcha_repository import CaptchaRepository
+from vasiniyo_chat_bot.module.captcha.dto import CaptchaUser
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteCaptchaRepository(SqliteRepository, CaptchaRepository):
+    """Captcha users kept in memory and written through to SQLite.
+
+    Users missing from memory, e.g. after a restart, are read back from
+    the database.
+    """
+
+    def __init__(
+        self, captcha_users_dao: CaptchaUsersDao, settings: SqliteDatabaseSettings
+    ):
+        super().__init__(settings)
+        self._captcha_users_dao = captcha_users_dao
+
+    def save(self, chat_id: int, user_id: int, user: CaptchaUser) -> CaptchaUser:
+        entity = CaptchaUserEntity(*astuple(user))
+        self.submit_write(
+            lambda conn: self._captcha_users_dao.save(conn, entity)
+        ).add_done_callback(self._log_failure)
+        return super().save(chat_id, user_id, user)
+
+    def find(self, chat_id: int, user_id: int) -> CaptchaUser | None:
+        if user := super().find(chat_id, user_id):
+            return user
+        entity = self.transaction(
+            lambda conn: self._captcha_users_dao.find(conn, chat_id, user_id)
+        )
+        if not entity:
+            return None
+        return super().save(chat_id, user_id, CaptchaUser(*astuple(entity)))
+
+    def remove(self, chat_id: int, user_id: int) -> CaptchaUser | None:
+        user = self.find(chat_id, user_id)
+        self.write(lambda conn: self._captcha_users_dao.delete(conn, chat_id, user_id))
+        super().remove(chat_id, user_id)
+        return user
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if error := future.exception():
+            logger.error("captcha_user_write_failed", extra={"reason": str(error)})
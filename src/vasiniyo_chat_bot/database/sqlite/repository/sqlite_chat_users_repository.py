@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+
+from vasiniyo_chat_bot.database.sqlite.dao.chat_users_dao import ChatUsersDao
+from vasiniyo_chat_bot.database.sqlite.entity import ChatUserEntity
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+from vasiniyo_chat_bot.module.chat_users_repository import ChatUsersRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteChatUsersRepository(SqliteRepository, ChatUsersRepository):
+    def __init__(self, chat_users_dao: ChatUsersDao, settings: SqliteDatabaseSettings):
+        super().__init__(settings)
+        self._chat_users_dao = chat_users_dao
+
+    def save(
+        self,
+        chat_id: int,
+        user_id: int,
+        username: str | None,
+        full_name: str,
+        is_member: bool | None,
+    ) -> None:
+        self.submit_write(
+            lambda conn: self._chat_users_dao.save(
+                conn, chat_id, user_id, username, full_name, is_member
+            )
+        ).add_done_callback(self._log_failure)
+
+    def find(self, chat_id: int, user_id: int) -> ChatUserEntity | None:
+        return self.transaction(
+            lambda conn: self._chat_users_dao.find(conn, chat_id, user_id)
+        )
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if error := future.exception():
+            logger.error("chat_user_save_failed", extra={"reason": str(error)})
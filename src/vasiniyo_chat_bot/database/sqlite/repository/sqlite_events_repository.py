@@ -18,7 +18,7 @@ class SqliteEventsRepository(SqliteRepository, EventsRepository):
         self._eventsDao = events_dao
 
     def insert_winner(self, chat_id: int, user_id: int, event_id: int) -> int:
-        return self.transaction(
+        return self.write(
             lambda conn: self._eventsDao.save(conn, chat_id, user_id, event_id)
         ).winner_user_id
 
@@ -22,7 +22,7 @@ class SqliteLikesRepository(SqliteRepository, LikesRepository):
             self._likesDao.save(conn, chat_id, from_user_id, to_user_id)
             return self._likesDao.count_by_chat_and_to_user(conn, chat_id, to_user_id)
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def get_leaderboard(self, chat_id: int, limit: int) -> Leaderboard:
         def _tx(conn: Connection):
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+
+from vasiniyo_chat_bot.database.sqlite.dao.pending_titles_dao import PendingTitlesDao
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+from vasiniyo_chat_bot.module.titles.pending_titles_repository import (
+    PendingTitlesRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SqlitePendingTitlesRepository(SqliteRepository, PendingTitlesRepository):
+    def __init__(
+        self, pending_titles_dao: PendingTitlesDao, settings: SqliteDatabaseSettings
+    ):
+        super().__init__(settings)
+        self._pending_titles_dao = pending_titles_dao
+
+    def save(self, chat_id: int, user_id: int, day: int, title: str) -> None:
+        self.submit_write(
+            lambda conn: self._pending_titles_dao.save(
+                conn, chat_id, user_id, day, title
+            )
+        ).add_done_callback(self._log_failure)
+
+    def find(self, chat_id: int, user_id: int, day: int) -> str | None:
+        return self.transaction(
+            lambda conn: self._pending_titles_dao.find(conn, chat_id, user_id, day)
+        )
+
+    def delete(self, chat_id: int, user_id: int) -> None:
+        self.write(lambda conn: self._pending_titles_dao.delete(conn, chat_id, user_id))
+
+    def delete_before(self, day: int) -> None:
+        self.submit_write(
+            lambda conn: self._pending_titles_dao.delete_before(conn, day)
+        ).add_done_callback(self._log_evicted)
+
+    @staticmethod
+    def _log_evicted(future: Future) -> None:
+        if future.exception():
+            SqlitePendingTitlesRepository._log_failure(future)
+        else:
+            logger.info("pending_titles_evicted", extra={"rows": future.result()})
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if error := future.exception():
+            logger.error("pending_title_write_failed", extra={"reason": str(error)})
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import sqlite3
+from concurrent.futures import Future
 from sqlite3 import Connection
-import threading
 from typing import Callable
 from typing import TypeVar
 
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
 from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
 
 T = TypeVar("T")
@@ -14,23 +14,13 @@ R = TypeVar("R", bound="SqliteRepository")
 
 class SqliteRepository:
     def __init__(self, settings: SqliteDatabaseSettings) -> None:
-        self._database_name = settings.database_path
-        self._tx_connection = threading.local()
+        self._connections = SqliteConnectionManager.for_database(settings)
 
     def transaction(self, block: Callable[[Connection], T]) -> T:
-        exists_conn = getattr(self._tx_connection, "conn", None)
-        if exists_conn:
-            return block(exists_conn)
-        conn = sqlite3.connect(self._database_name)
-        try:
-            self._tx_connection.conn = conn
-            try:
-                result = block(conn)
-                conn.commit()
-                return result
-            except:
-                conn.rollback()
-                raise
-        finally:
-            conn.close()
-            del self._tx_connection.conn
+        return self._connections.transaction(block)
+
+    def write(self, block: Callable[[Connection], T]) -> T:
+        return self.submit_write(block).result()
+
+    def submit_write(self, block: Callable[[Connection], T]) -> Future[T]:
+        return self._connections.submit_write(block)
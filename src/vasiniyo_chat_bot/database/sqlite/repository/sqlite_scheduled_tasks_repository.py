@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+
+from vasiniyo_chat_bot.database.sqlite.dao.scheduled_tasks_dao import ScheduledTasksDao
+from vasiniyo_chat_bot.database.sqlite.entity import ScheduledTaskEntity
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+from vasiniyo_chat_bot.module.scheduled_tasks_repository import ScheduledTasksRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteScheduledTasksRepository(SqliteRepository, ScheduledTasksRepository):
+    def __init__(
+        self, scheduled_tasks_dao: ScheduledTasksDao, settings: SqliteDatabaseSettings
+    ):
+        super().__init__(settings)
+        self._scheduled_tasks_dao = scheduled_tasks_dao
+
+    def save(self, task: ScheduledTaskEntity) -> None:
+        self.submit_write(
+            lambda conn: self._scheduled_tasks_dao.save(conn, task)
+        ).add_done_callback(self._log_failure)
+
+    def delete(self, task_id: str) -> None:
+        self.submit_write(
+            lambda conn: self._scheduled_tasks_dao.delete(conn, task_id)
+        ).add_done_callback(self._log_failure)
+
+    def find_all(self) -> list[ScheduledTaskEntity]:
+        return self.transaction(self._scheduled_tasks_dao.find_all)
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        if error := future.exception():
+            logger.error("scheduled_task_write_failed", extra={"reason": str(error)})
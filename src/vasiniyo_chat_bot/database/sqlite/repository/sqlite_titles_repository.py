@@ -40,13 +40,13 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             )
             return titles_entity.user_title
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def update_attempt(self, chat_id: int, user_id: int) -> None:
         def _tx(conn: Connection) -> None:
             self._update_attempt(conn, chat_id, user_id)
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def find_user_title(self, chat_id: int, user_id: int) -> str | None:
         def _tx(conn: Connection) -> str | None:
@@ -79,12 +79,70 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             ),
         )
 
+    def get_inventory_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        def _tx(conn: Connection) -> list[TitlesBagEntity]:
+            boundary = self._boundary(conn, chat_id, cursor_id)
+            return self._titles_bag_dao.page_inventory(
+                conn,
+                chat_id,
+                user_id,
+                (boundary.user_title, boundary.id) if boundary else None,
+                forward,
+                limit,
+            )
+
+        return self.transaction(_tx)
+
+    def get_steal_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        def _tx(conn: Connection) -> list[TitlesBagEntity]:
+            titles, users_cursor = [], None
+            boundary = self._boundary(conn, chat_id, cursor_id)
+            if boundary:
+                users_cursor = (
+                    self._titles_bag_dao.count_titles(conn, chat_id, boundary.user_id),
+                    boundary.user_id,
+                )
+                if boundary.user_id != user_id:
+                    titles += self._titles_bag_dao.page_user_titles(
+                        conn,
+                        chat_id,
+                        boundary.user_id,
+                        (boundary.is_inventory, boundary.user_title, boundary.id),
+                        forward,
+                        limit,
+                    )
+            for owner_id, _ in self._titles_bag_dao.page_title_counts(
+                conn, chat_id, user_id, users_cursor, forward, limit
+            ):
+                if len(titles) >= limit:
+                    break
+                titles += self._titles_bag_dao.page_user_titles(
+                    conn, chat_id, owner_id, None, forward, limit - len(titles)
+                )
+            return titles[:limit]
+
+        return self.transaction(_tx)
+
     def get_title_after_touch(self, chat_id: int, user_id: int) -> str | None:
         def _tx(conn: Connection):
             self._update_attempt(conn, chat_id, user_id)
             return self._titles_bag_dao.find_current(conn, chat_id, user_id).user_title
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def get_rolls_remaining(self, chat_id: int, user_id: int) -> tuple[bool, int]:
         def _tx(conn: Connection) -> tuple[bool, int]:
@@ -117,7 +175,7 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             )
             return entity.user_title
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def rotate_title(self, chat_id: int, user_id: int, title: str) -> str:
         def _tx(conn: Connection) -> str:
@@ -135,7 +193,7 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             self._update_attempt(conn, chat_id, user_id)
             return entity.user_title
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def steal_logic(
         self, chat_id: int, user_id: int, title_id: int
@@ -185,7 +243,7 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
                 (next_target_title.user_id, next_target_title.user_title),
             )
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def exists(self, chat_id: int, user_id: int, title_bag_id: int):
         def _tx(conn: Connection) -> bool:
@@ -217,7 +275,7 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             )
             return entity.user_title
 
-        return self.transaction(_tx)
+        return self.write(_tx)
 
     def exchange_title(
         self, chat_id: int, user_id: int, title_bag_id: int
@@ -234,7 +292,15 @@ class SqliteTitlesRepository(SqliteRepository, TitlesRepository):
             )
             return entity.user_title, extra_rolls
 
-        return self.transaction(_tx)
+        return self.write(_tx)
+
+    def _boundary(
+        self, conn: Connection, chat_id: int, cursor_id: int | None
+    ) -> TitlesBagEntity | None:
+        if cursor_id is None:
+            return None
+        boundary = self._titles_bag_dao.find_by_id(conn, cursor_id)
+        return boundary if boundary and boundary.chat_id == chat_id else None
 
     def _update_attempt(self, conn: Connection, chat_id: int, user_id: int) -> None:
         if self._titles_states_dao.is_day_passed(conn, chat_id, user_id):
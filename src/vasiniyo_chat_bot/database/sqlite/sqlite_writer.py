@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+import logging
+from queue import Empty
+from queue import SimpleQueue
+import threading
+import time
+from typing import Callable
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+    from vasiniyo_chat_bot.database.sqlite.connection_manager import (
+        SqliteConnectionManager,
+    )
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SqliteWriter:
+    """Single writer thread that group-commits submitted write transactions.
+
+    Writes arriving within ``window`` seconds of the first one (up to
+    ``max_batch``) share one transaction and one commit. Each write runs in
+    its own savepoint, so a failing write is rolled back without its
+    neighbours. Futures resolve only after the batch is committed.
+    """
+
+    def __init__(
+        self, connections: SqliteConnectionManager, window: float, max_batch: int
+    ) -> None:
+        self._connections = connections
+        self._window = window
+        self._max_batch = max_batch
+        self._queue: SimpleQueue[tuple[Callable, Future] | None] = SimpleQueue()
+        self.batches = 0
+        self.writes = 0
+        self._thread = threading.Thread(
+            target=self._run, name="SqliteWriter", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, block: Callable[[Connection], T]) -> Future[T]:
+        future = Future()
+        self._queue.put((block, future))
+        return future
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        logger.info(
+            "sqlite_writer_stopped",
+            extra={"batches": self.batches, "writes": self.writes},
+        )
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                try:
+                    job = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except Empty:
+                    break
+                if job is None:
+                    running = False
+                    break
+                batch.append(job)
+            self._commit(batch)
+
+    def _commit(self, batch: list[tuple[Callable, Future]]) -> None:
+        try:
+            outcomes = self._connections.run_batch([block for block, _ in batch])
+        except Exception as e:
+            logger.exception("sqlite_group_commit_failed", extra={"size": len(batch)})
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        self.batches += 1
+        self.writes += len(batch)
+        for (_, future), (ok, value) in zip(batch, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
@@ -1,18 +1,41 @@
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
 import logging
+from threading import Condition
 from threading import Event
 from threading import Thread
 import time
 from typing import Callable
 import uuid
 
+from vasiniyo_chat_bot.database.sqlite.entity import ScheduledTaskEntity
+from vasiniyo_chat_bot.module.scheduled_tasks_repository import ScheduledTasksRepository
+
 logger = logging.getLogger(__name__)
 
 EVENTS = {}
+DEADLINES: list[tuple[float, int, str]] = []
 TICK_JOB_RUNNING = False
 TICK_THREAD = None
 TICK_THREAD_STOP = Event()
 
+ACTION_WORKERS = 8
+LAG_WARNING = 1.0
+LAG_REPORT_EVERY = 1000
+LAG = {"actions": 0, "total": 0.0, "max": 0.0}
+
+clock = time.monotonic
+
+_WAKEUP = Condition()
+_SEQUENCE = itertools.count()
+_STALE_DEADLINES = 0
+_WORKERS: ThreadPoolExecutor | None = None
+
+TASK_STORE: ScheduledTasksRepository | None = None
+TASK_KINDS: dict[str, Callable[[str, list], tuple[Callable[[], None], dict]]] = {}
+
 
 def add_task(
     timestamps,
@@ -23,6 +46,7 @@ def add_task(
         "on_cancel" : Callable[[], None],
         str : Callable[[], None],
     ],
+    descriptor: tuple[str, list] | None = None,
 ):
     """
     Queue a sequence of timestamped actions to be executed over time.
@@ -40,6 +64,9 @@ def add_task(
             - "on_cancel": callable
                 -> executes on the task cancel
             -  Or custom timestamp-based overrides: {timestamp: callable}
+        descriptor (tuple, optional): (kind, args) that rebuilds the actions
+            through the builder registered with register_kind. With a store
+            set by use_store the task is persisted and survives restarts.
 
     Returns:
         str: A UUID key identifying the registered task.
@@ -59,109 +86,285 @@ def add_task(
         conditional_funcs = {}
 
     sorted_ts = sorted(timestamps)
-    sub_events = deque()
-
-    for i, ts in enumerate(sorted_ts):
-        if i == 0 and "on_start" in conditional_funcs:
-            action = conditional_funcs["on_start"]
-        elif i == len(sorted_ts) - 1 and "on_success" in conditional_funcs:
-            action = conditional_funcs["on_success"]
-        elif ts in conditional_funcs:
-            action = conditional_funcs[ts]
-        else:
-            action = default
-        sub_events.append({"timestamp": ts, "action": action})
-
-    EVENTS[key] = {
-        "offset": 0,
-        "cancelled": False,
-        "sub_events": sub_events,
-        "conditional_funcs": conditional_funcs,
-    }
+    sub_events = _sub_events(sorted_ts, default, conditional_funcs)
+    if not sub_events:
+        return key
+
+    persistent = descriptor is not None and TASK_STORE is not None
+    if persistent:
+        kind, args = descriptor
+        TASK_STORE.save(ScheduledTaskEntity(key, kind, args, sorted_ts, time.time()))
+    _register(key, clock(), sub_events, conditional_funcs, persistent)
     start_ticking_if_needed()
     return key
 
 
-def cancel_task(key, silently=False):
-    if key in EVENTS:
-        EVENTS[key]["cancelled"] = True
-        cond = EVENTS[key].get("conditional_funcs", {})
-        logger.debug("⛔ Canceling task", extra={"task": key})
-        if silently:
-            return
+def register_kind(
+    kind: str, build: Callable[[str, list], tuple[Callable[[], None], dict]]
+) -> None:
+    """
+    Register how to rebuild (default, conditional_funcs) of persisted tasks
+    of the given kind from their task id and descriptor args.
+    """
+    TASK_KINDS[kind] = build
 
-        if "on_cancel" in cond:
-            func = cond["on_cancel"]
-            logger.debug(
-                "Executing on_cancel",
-                extra={"func": getattr(func, "__name__", repr(func))},
-            )
-            try:
-                func()
-            except Exception:
-                logger.exception("on_cancel hook failed", extra={"task": key})
 
+def use_store(store: ScheduledTasksRepository | None) -> None:
+    global TASK_STORE
+    TASK_STORE = store
 
-def tick():
-    remove_keys = []
 
-    for key, event in list(EVENTS.items()):
-        if event["cancelled"]:
-            remove_keys.append(key)
-            continue
+def recover() -> int:
+    """
+    Reschedule the persisted tasks after a restart.
+
+    Actions missed while the bot was down are not replayed one by one: the
+    latest overdue action of each task runs right away and the task goes on
+    from there. Tasks that are past their last timestamp only run that one.
 
-        if not event["sub_events"]:
-            remove_keys.append(key)
+    Returns:
+        int: The number of recovered tasks.
+    """
+    if TASK_STORE is None:
+        return 0
+    now = time.time()
+    recovered = 0
+    for task in TASK_STORE.find_all():
+        build = TASK_KINDS.get(task.kind)
+        if build is None:
+            logger.warning(
+                "scheduled_task_kind_unknown",
+                extra={"task": task.task_id, "kind": task.kind},
+            )
+            TASK_STORE.delete(task.task_id)
             continue
+        default, conditional_funcs = build(task.task_id, task.args)
+        elapsed = max(0.0, now - task.started_at)
+        sub_events = _sub_events(task.timestamps, default, conditional_funcs)
+        overdue = [e for e in sub_events if e["timestamp"] <= elapsed]
+        pending = [e for e in sub_events if e["timestamp"] > elapsed]
+        _register(
+            task.task_id,
+            clock() - elapsed,
+            deque(overdue[-1:] + pending),
+            conditional_funcs,
+            persistent=True,
+        )
+        recovered += 1
+    logger.info("scheduled_tasks_recovered", extra={"tasks": recovered})
+    start_ticking_if_needed()
+    return recovered
 
-        offset = event["offset"]
 
-        while event["sub_events"] and event["sub_events"][0]["timestamp"] <= offset:
-            next_event = event["sub_events"].popleft()
-            try:
-                next_event["action"]()
-            except:
-                logger.exception("Event failed", extra={"task": key})
+def cancel_task(key, silently=False):
+    global _STALE_DEADLINES
+    with _WAKEUP:
+        event = EVENTS.pop(key, None)
+        if event is None:
+            return
+        event["cancelled"] = True
+        if event["scheduled"]:
+            _STALE_DEADLINES += 1
+            _compact_deadlines()
+    if event["persistent"] and TASK_STORE:
+        TASK_STORE.delete(key)
+    cond = event.get("conditional_funcs", {})
+    logger.debug("⛔ Canceling task", extra={"task": key})
+    if silently:
+        return
+
+    if "on_cancel" in cond:
+        func = cond["on_cancel"]
+        logger.debug(
+            "Executing on_cancel", extra={"func": getattr(func, "__name__", repr(func))}
+        )
+        try:
+            func()
+        except Exception:
+            logger.exception("on_cancel hook failed", extra={"task": key})
 
-        event["offset"] += 1
 
-        if not event["sub_events"]:
-            remove_keys.append(key)
+def tick(workers: ThreadPoolExecutor | None = None):
+    """
+    Run every action that is due by now, inline or on the given workers.
+    A task is not scheduled again until its due actions have finished,
+    so actions of one task never run concurrently.
 
-    for key in remove_keys:
-        EVENTS.pop(key, None)
-        logger.debug("Removed entire event", extra={"task": key})
+    Returns:
+        float | None: The deadline of the next pending action, if any.
+    """
+    global _STALE_DEADLINES
+    now = clock()
+    due = []
+    with _WAKEUP:
+        while DEADLINES and DEADLINES[0][0] <= now:
+            _, _, key = heapq.heappop(DEADLINES)
+            event = EVENTS.get(key)
+            if event is None:
+                _STALE_DEADLINES = max(0, _STALE_DEADLINES - 1)
+                continue
+            event["scheduled"] = False
+            due.append((key, event))
+
+    for key, event in due:
+        if workers is None:
+            _run_due(key, event)
+        else:
+            workers.submit(_run_due, key, event)
 
-    if not EVENTS:
-        stop_ticking()
+    with _WAKEUP:
+        return DEADLINES[0][0] if DEADLINES else None
 
 
 def start_ticking_if_needed():
     global TICK_JOB_RUNNING, TICK_THREAD
-    if TICK_JOB_RUNNING:
-        return
-    if not EVENTS:
-        return
+    with _WAKEUP:
+        if TICK_JOB_RUNNING:
+            _WAKEUP.notify()
+            return
+        if not EVENTS:
+            return
 
-    logger.debug("Started ticking thread for event_queue")
-    TICK_JOB_RUNNING = True
-    TICK_THREAD_STOP.clear()
+        logger.debug("Started ticking thread for event_queue")
+        TICK_JOB_RUNNING = True
+        TICK_THREAD_STOP.clear()
+        workers = _action_workers()
 
     def loop():
         while not TICK_THREAD_STOP.is_set():
-            tick()
-            time.sleep(1)
-
-    TICK_THREAD = Thread(target=loop, daemon=True)
+            tick(workers)
+            with _WAKEUP:
+                if not EVENTS:
+                    stop_ticking()
+                    return
+                timeout = DEADLINES[0][0] - clock() if DEADLINES else None
+                if timeout is None or timeout > 0:
+                    _WAKEUP.wait(timeout)
+
+    TICK_THREAD = Thread(target=loop, name="EventQueue", daemon=True)
     TICK_THREAD.start()
 
 
 def stop_ticking():
     global TICK_JOB_RUNNING
-    TICK_THREAD_STOP.set()
-    TICK_JOB_RUNNING = False
+    with _WAKEUP:
+        TICK_THREAD_STOP.set()
+        TICK_JOB_RUNNING = False
+        _WAKEUP.notify_all()
     logger.debug("Stopped ticking thread since no events remain")
 
 
 def is_thread_running():
     return TICK_JOB_RUNNING
+
+
+def lag_metrics() -> dict[str, float | int]:
+    """
+    How late actions started compared to their deadlines.
+    """
+    with _WAKEUP:
+        actions = LAG["actions"]
+        return {
+            "actions": actions,
+            "avg_lag_ms": LAG["total"] / actions * 1000 if actions else 0.0,
+            "max_lag_ms": LAG["max"] * 1000,
+            "pending_tasks": len(EVENTS),
+        }
+
+
+def _run_due(key: str, event: dict) -> None:
+    sub_events = event["sub_events"]
+    now = clock()
+    while (
+        sub_events
+        and not event["cancelled"]
+        and event["started"] + sub_events[0]["timestamp"] <= now
+    ):
+        next_event = sub_events.popleft()
+        event["offset"] = next_event["timestamp"]
+        _record_lag(key, now - event["started"] - next_event["timestamp"])
+        try:
+            next_event["action"]()
+        except:
+            logger.exception("Event failed", extra={"task": key})
+    with _WAKEUP:
+        if event["cancelled"] or EVENTS.get(key) is not event:
+            return
+        if sub_events:
+            _schedule(key, event["started"] + sub_events[0]["timestamp"])
+        else:
+            EVENTS.pop(key, None)
+            _WAKEUP.notify()
+            logger.debug("Removed entire event", extra={"task": key})
+    if not sub_events and event["persistent"] and TASK_STORE:
+        TASK_STORE.delete(key)
+
+
+def _record_lag(key: str, lag: float) -> None:
+    with _WAKEUP:
+        LAG["actions"] += 1
+        LAG["total"] += lag
+        LAG["max"] = max(LAG["max"], lag)
+        report = LAG["actions"] % LAG_REPORT_EVERY == 0
+    if lag > LAG_WARNING:
+        logger.warning("event_queue_action_late", extra={"task": key, "lag": lag})
+    if report:
+        logger.info("event_queue_lag", extra=lag_metrics())
+
+
+def _action_workers() -> ThreadPoolExecutor:
+    global _WORKERS
+    if _WORKERS is None:
+        _WORKERS = ThreadPoolExecutor(ACTION_WORKERS, thread_name_prefix="EventAction")
+    return _WORKERS
+
+
+def _sub_events(
+    sorted_ts: list, default: Callable[[], None], conditional_funcs: dict
+) -> deque:
+    sub_events = deque()
+    for i, ts in enumerate(sorted_ts):
+        if i == 0 and "on_start" in conditional_funcs:
+            action = conditional_funcs["on_start"]
+        elif i == len(sorted_ts) - 1 and "on_success" in conditional_funcs:
+            action = conditional_funcs["on_success"]
+        elif ts in conditional_funcs:
+            action = conditional_funcs[ts]
+        else:
+            action = default
+        sub_events.append({"timestamp": ts, "action": action})
+    return sub_events
+
+
+def _register(
+    key: str,
+    started: float,
+    sub_events: deque,
+    conditional_funcs: dict,
+    persistent: bool,
+) -> None:
+    with _WAKEUP:
+        EVENTS[key] = {
+            "started": started,
+            "offset": 0,
+            "cancelled": False,
+            "scheduled": False,
+            "sub_events": sub_events,
+            "conditional_funcs": conditional_funcs,
+            "persistent": persistent,
+        }
+        _schedule(key, started + sub_events[0]["timestamp"])
+
+
+def _schedule(key: str, deadline: float) -> None:
+    EVENTS[key]["scheduled"] = True
+    heapq.heappush(DEADLINES, (deadline, next(_SEQUENCE), key))
+    _WAKEUP.notify()
+
+
+def _compact_deadlines() -> None:
+    global _STALE_DEADLINES
+    if _STALE_DEADLINES > 64 and _STALE_DEADLINES * 2 > len(DEADLINES):
+        DEADLINES[:] = [entry for entry in DEADLINES if entry[2] in EVENTS]
+        heapq.heapify(DEADLINES)
+        _STALE_DEADLINES = 0
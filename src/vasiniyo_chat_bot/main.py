@@ -5,21 +5,43 @@ import sys
 import time
 
 from requests.exceptions import RequestException
+from telebot import TeleBot
 from telebot.types import BotCommand
 from urllib3.exceptions import HTTPError
 
 from vasiniyo_chat_bot.config.config import load_all
+from vasiniyo_chat_bot.config.webhook_reader import WebhookSettings
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
+from vasiniyo_chat_bot.database.sqlite.dao import ScheduledTasksDao
 from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_scheduled_tasks_repository import (
+    SqliteScheduledTasksRepository,
+)
+from vasiniyo_chat_bot.event_queue import recover
 from vasiniyo_chat_bot.event_queue import start_ticking_if_needed
+from vasiniyo_chat_bot.event_queue import use_store
 from vasiniyo_chat_bot.logger.logger import LogFormatter
 from vasiniyo_chat_bot.migration import sqlite_migration
 from vasiniyo_chat_bot.telegram.dispatcher import BotFeatureRegistry
+from vasiniyo_chat_bot.telegram.update_executor import ChatShardedExecutor
+from vasiniyo_chat_bot.telegram.webhook_server import WebhookServer
 
 logger = logging.getLogger(__name__)
 
+# chat_member is not delivered unless requested; it carries title changes
+# made by admins by hand
+ALLOWED_UPDATES = [
+    "message",
+    "callback_query",
+    "inline_query",
+    "my_chat_member",
+    "chat_member",
+]
+
 
 def sigint_handler(_, __):
     logger.info("stop_polling")
+    SqliteConnectionManager.close_all()
     sys.exit(0)
 
 
@@ -55,27 +77,61 @@ def main():
             )
     if isinstance(config_.database, SqliteDatabaseSettings):
         sqlite_migration.apply_migrations(config_.database.database_path)
+        SqliteConnectionManager.for_database(config_.database).report()
+        if config_.database.durable_tasks:
+            use_store(
+                SqliteScheduledTasksRepository(ScheduledTasksDao(), config_.database)
+            )
     bot = config_.bot_settings.bot
+    bot.worker_pool.close()
+    bot.worker_pool = ChatShardedExecutor(bot, config_.bot_settings.update_workers)
     factory = BotFeatureRegistry(config_)
+    for update_listener in factory.update_listeners():
+        bot.set_update_listener(update_listener)
+    bot.my_chat_member_handler()(factory.my_chat_member_handler())
+    bot.chat_member_handler()(factory.chat_member_handler())
     for handler in factory.message_handlers():
         bot.message_handler(**handler.kwargs)(handler.handler)
     for handler in factory.callback_query_handlers():
         bot.callback_query_handler(**handler.kwargs)(handler.handler)
     if inline_handler := factory.inline_handler():
         bot.inline_handler(**inline_handler.kwargs)(inline_handler.handler)
+    recover()
     my_commands = factory.my_commands()
     bot.set_my_commands(
         [BotCommand(title, desc) for title, desc in my_commands.items()]
     )
     for command in sorted(my_commands.keys()):
         logger.info("command_enabled", extra={"command": command})
-    bot.delete_webhook(drop_pending_updates=True)
     if "test" in config_.bot_settings.mods:
         logger.info("test_mode_enabled")
+    if config_.webhook:
+        _run_webhook(bot, config_.webhook)
+    else:
+        bot.delete_webhook(drop_pending_updates=True)
+        _run_polling(bot)
+
+
+def _run_webhook(bot: TeleBot, settings: WebhookSettings):
+    server = WebhookServer(bot, settings)
+    bot.set_webhook(
+        url=settings.url,
+        secret_token=settings.secret_token,
+        drop_pending_updates=True,
+        allowed_updates=ALLOWED_UPDATES,
+    )
+    logger.info("webhook_set", extra={"url": settings.url})
+    try:
+        server.serve_forever()
+    finally:
+        server.shutdown()
+
+
+def _run_polling(bot: TeleBot):
     while True:
         try:
             logger.info("start_polling")
-            bot.polling()
+            bot.polling(allowed_updates=ALLOWED_UPDATES)
         except KeyboardInterrupt:
             logger.info("bot_stopped", extra={"reason": "Stopped by user"})
             break
@@ -1,4 +1,4 @@
-def sqlite():
+def sqlite_scripts():
     from importlib.resources import files
 
     return files("vasiniyo_chat_bot.migration.sqlite").iterdir()
@@ -0,0 +1,8 @@
+create index if not exists idx_likes_chat_to_user
+on likes (chat_id, to_user_id);
+
+create index if not exists idx_events_chat_event_played
+on events (chat_id, event_id, last_played, winner_user_id);
+
+create index if not exists idx_titles_bag_chat_user
+on titles_bag (chat_id, user_id, is_inventory, user_title);
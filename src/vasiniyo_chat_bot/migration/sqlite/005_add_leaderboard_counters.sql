@@ -0,0 +1,78 @@
+create table like_counts (
+    chat_id int,
+    user_id int,
+    n int not null default 0,
+    primary key (chat_id, user_id)
+);
+
+create index idx_like_counts_top
+on like_counts (chat_id, n desc, user_id);
+
+create table win_counts (
+    chat_id int,
+    event_id int,
+    user_id int,
+    n int not null default 0,
+    primary key (chat_id, event_id, user_id)
+);
+
+create index idx_win_counts_top
+on win_counts (chat_id, event_id, n desc, user_id);
+
+insert into like_counts (chat_id, user_id, n)
+select chat_id, to_user_id, count(*)
+from likes
+group by chat_id, to_user_id;
+
+insert into win_counts (chat_id, event_id, user_id, n)
+select chat_id, event_id, winner_user_id, count(*)
+from events
+group by chat_id, event_id, winner_user_id;
+
+create trigger trg_likes_insert_count
+after insert on likes
+begin
+    insert into like_counts (chat_id, user_id, n)
+    values (new.chat_id, new.to_user_id, 1)
+    on conflict (chat_id, user_id) do update set n = n + 1;
+end;
+
+create trigger trg_likes_update_count
+after update of to_user_id on likes
+when old.to_user_id is not new.to_user_id
+begin
+    update like_counts
+    set n = n - 1
+    where chat_id = old.chat_id
+    and user_id = old.to_user_id;
+    insert into like_counts (chat_id, user_id, n)
+    values (new.chat_id, new.to_user_id, 1)
+    on conflict (chat_id, user_id) do update set n = n + 1;
+end;
+
+create trigger trg_likes_delete_count
+after delete on likes
+begin
+    update like_counts
+    set n = n - 1
+    where chat_id = old.chat_id
+    and user_id = old.to_user_id;
+end;
+
+create trigger trg_events_insert_count
+after insert on events
+begin
+    insert into win_counts (chat_id, event_id, user_id, n)
+    values (new.chat_id, new.event_id, new.winner_user_id, 1)
+    on conflict (chat_id, event_id, user_id) do update set n = n + 1;
+end;
+
+create trigger trg_events_delete_count
+after delete on events
+begin
+    update win_counts
+    set n = n - 1
+    where chat_id = old.chat_id
+    and event_id = old.event_id
+    and user_id = old.winner_user_id;
+end;
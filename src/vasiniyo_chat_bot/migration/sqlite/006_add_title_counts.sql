@@ -0,0 +1,44 @@
+create table title_counts (
+    chat_id int,
+    user_id int,
+    n int not null default 0,
+    primary key (chat_id, user_id)
+);
+
+create index idx_title_counts_top
+on title_counts (chat_id, n desc, user_id);
+
+insert into title_counts (chat_id, user_id, n)
+select chat_id, user_id, count(*)
+from titles_bag
+group by chat_id, user_id;
+
+create trigger trg_titles_bag_insert_count
+after insert on titles_bag
+begin
+    insert into title_counts (chat_id, user_id, n)
+    values (new.chat_id, new.user_id, 1)
+    on conflict (chat_id, user_id) do update set n = n + 1;
+end;
+
+create trigger trg_titles_bag_update_count
+after update of chat_id, user_id on titles_bag
+when old.chat_id is not new.chat_id or old.user_id is not new.user_id
+begin
+    update title_counts
+    set n = n - 1
+    where chat_id = old.chat_id
+    and user_id = old.user_id;
+    insert into title_counts (chat_id, user_id, n)
+    values (new.chat_id, new.user_id, 1)
+    on conflict (chat_id, user_id) do update set n = n + 1;
+end;
+
+create trigger trg_titles_bag_delete_count
+after delete on titles_bag
+begin
+    update title_counts
+    set n = n - 1
+    where chat_id = old.chat_id
+    and user_id = old.user_id;
+end;
@@ -0,0 +1,9 @@
+create table chat_users (
+    chat_id int,
+    user_id int,
+    username text,
+    full_name text,
+    last_seen int default (strftime('%s', 'now')),
+    is_member boolean,
+    primary key (chat_id, user_id)
+);
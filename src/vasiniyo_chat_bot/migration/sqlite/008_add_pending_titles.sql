@@ -0,0 +1,9 @@
+create table pending_titles (
+    chat_id int,
+    user_id int,
+    day int,
+    title text not null,
+    primary key (chat_id, user_id)
+);
+
+create index idx_pending_titles_day on pending_titles (day);
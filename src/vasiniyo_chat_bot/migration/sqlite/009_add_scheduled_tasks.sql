@@ -0,0 +1,19 @@
+create table scheduled_tasks (
+    task_id text primary key,
+    kind text not null,
+    args text not null,
+    timestamps text not null,
+    started_at real not null,
+    ends_at real not null
+);
+
+create index idx_scheduled_tasks_ends_at on scheduled_tasks (ends_at);
+
+create table captcha_users (
+    chat_id int,
+    user_id int,
+    failed_attempts int not null,
+    time_left int not null,
+    answer text not null,
+    primary key (chat_id, user_id)
+);
@@ -21,7 +21,11 @@ def apply_migrations(database_path):
         applied = _get_applied_versions(conn)
         try:
             files = sorted(
-                [file for file in migration.sqlite() if file.name.endswith(".sql")],
+                [
+                    file
+                    for file in migration.sqlite_scripts()
+                    if file.name.endswith(".sql")
+                ],
                 key=lambda f: int(f.name.split("_")[0]),
             )
         except Exception:
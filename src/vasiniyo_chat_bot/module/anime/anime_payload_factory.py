@@ -1,11 +1,10 @@
 from dataclasses import dataclass
-import json
 
 from vasiniyo_chat_bot.module.anime.dto import AnimeGenre
 from vasiniyo_chat_bot.module.dto import Action
 from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
 from vasiniyo_chat_bot.safely_bot_utils import extract_field
-from vasiniyo_chat_bot.safely_bot_utils import parse_json
 
 
 @dataclass(frozen=True)
@@ -16,19 +15,10 @@ class AnimePayload:
 
 
 class AnimePayloadFactory:
-    _valid_payload_actions = {Action.ANIME.value}
+    actions = frozenset({Action.ANIME})
 
     @staticmethod
-    def has_anime_payload(data: str) -> bool:
-        payload = parse_json(data)
-        return (
-            payload.get(Field.ACTION_TYPE.value)
-            in AnimePayloadFactory._valid_payload_actions
-        )
-
-    @staticmethod
-    def get_payload(data: str) -> AnimePayload:
-        payload = parse_json(data)
+    def get_payload(payload: dict[str, int | str]) -> AnimePayload:
         action_value = payload.get(Field.ACTION_TYPE.value)
         action = Action._value2member_map_.get(action_value)
         return AnimePayload(
@@ -39,10 +29,6 @@ class AnimePayloadFactory:
 
     @staticmethod
     def anime_genre(user_id: int, genre: AnimeGenre) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.ANIME.value,
-                Field.USER_ID.value: user_id,
-                Field.ANIME_GENRE.value: genre.value,
-            }
+        return encode_payload(
+            Action.ANIME, {Field.USER_ID: user_id, Field.ANIME_GENRE: genre.value}
         )
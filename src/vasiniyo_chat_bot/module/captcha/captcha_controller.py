@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from dataclasses import replace
+from typing import Callable
 
 from vasiniyo_chat_bot.event_queue import EVENTS
 from vasiniyo_chat_bot.event_queue import add_task
 from vasiniyo_chat_bot.event_queue import cancel_task
 from vasiniyo_chat_bot.event_queue import logger
+from vasiniyo_chat_bot.event_queue import register_kind
 from vasiniyo_chat_bot.module.captcha.captcha_payload_factory import CaptchaPayload
 from vasiniyo_chat_bot.module.captcha.captcha_response_factory import (
     CaptchaResponseFactory,
@@ -42,6 +44,7 @@ class CaptchaController:
         self._captcha_service = captcha_service
         self._response_factory = response_factory
         self._renderer = renderer
+        register_kind("captcha", self._restore_captcha)
 
     def handle_new_user(self, ctx: UserContext):
         user = self._captcha_service.generate_captcha(ctx.chat_id, ctx.user_id)
@@ -57,19 +60,36 @@ class CaptchaController:
                 "answer": user.answer,
             },
         )
+        response = self._response_factory.captcha(user)
+        captcha_message_id = self._renderer.send(response, ctx)
+        default, conditional_funcs = self._captcha_actions(ctx)
         task_id = add_task(
             timestamps=timestamps,
-            default=lambda: self.update_captcha_message(ctx),
-            conditional_funcs={
-                "on_success": lambda: self.handle_captcha_failure(ctx, "Время вышло"),
-                "on_cancel": lambda: self.handle_captcha_failure(ctx, "Капча отменена"),
-            },
+            default=default,
+            conditional_funcs=conditional_funcs,
+            descriptor=(
+                "captcha",
+                [ctx.user_id, ctx.chat_id, ctx.message_id, captcha_message_id],
+            ),
         )
-        response = self._response_factory.captcha(user)
-        captcha_message_id = self._renderer.send(response, ctx)
         session = _CaptchaSession(task_id, captcha_message_id)
         self._captcha_queue[ctx.chat_id, ctx.user_id] = session
 
+    def _captcha_actions(self, ctx: UserContext) -> tuple[Callable[[], None], dict]:
+        return lambda: self.update_captcha_message(ctx), {
+            "on_success": lambda: self.handle_captcha_failure(ctx, "Время вышло"),
+            "on_cancel": lambda: self.handle_captcha_failure(ctx, "Капча отменена"),
+        }
+
+    def _restore_captcha(
+        self, task_id: str, args: list
+    ) -> tuple[Callable[[], None], dict]:
+        user_id, chat_id, message_id, captcha_message_id = args
+        ctx = UserContext(user_id, chat_id, message_id, None)
+        session = _CaptchaSession(task_id, captcha_message_id)
+        self._captcha_queue[ctx.chat_id, ctx.user_id] = session
+        return self._captcha_actions(ctx)
+
     def handle_verify_captcha(self, ctx: MessageContext):
         self._renderer.delete(ctx)
         if self._captcha_service.validate_captcha(ctx.chat_id, ctx.user_id, ctx.text):
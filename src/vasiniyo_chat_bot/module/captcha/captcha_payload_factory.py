@@ -1,10 +1,9 @@
 from dataclasses import dataclass
-import json
 
 from vasiniyo_chat_bot.module.dto import Action
 from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
 from vasiniyo_chat_bot.safely_bot_utils import extract_field
-from vasiniyo_chat_bot.safely_bot_utils import parse_json
 
 
 @dataclass(frozen=True)
@@ -14,19 +13,10 @@ class CaptchaPayload:
 
 
 class CaptchaPayloadFactory:
-    _valid_payload_actions = {Action.CAPTCHA_UPDATE.value}
+    actions = frozenset({Action.CAPTCHA_UPDATE})
 
     @staticmethod
-    def has_captcha_payload(data: str) -> bool:
-        payload = parse_json(data)
-        return (
-            payload.get(Field.ACTION_TYPE.value)
-            in CaptchaPayloadFactory._valid_payload_actions
-        )
-
-    @staticmethod
-    def get_payload(data: str) -> CaptchaPayload:
-        payload = parse_json(data)
+    def get_payload(payload: dict[str, int | str]) -> CaptchaPayload:
         action_value = payload.get(Field.ACTION_TYPE.value)
         action = Action._value2member_map_.get(action_value)
         return CaptchaPayload(
@@ -36,9 +26,4 @@ class CaptchaPayloadFactory:
 
     @staticmethod
     def update_captcha(user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.CAPTCHA_UPDATE.value,
-                Field.USER_ID.value: user_id,
-            }
-        )
+        return encode_payload(Action.CAPTCHA_UPDATE, {Field.USER_ID: user_id})
@@ -8,6 +8,7 @@ from captcha.image import ImageCaptcha
 
 from vasiniyo_chat_bot.module.captcha.dto import Captcha
 from vasiniyo_chat_bot.module.captcha.dto import CaptchaUser
+from vasiniyo_chat_bot.module.dto import Priority
 from vasiniyo_chat_bot.module.dto import Response
 from vasiniyo_chat_bot.module.titles.dto import CaptchaMenu
 
@@ -24,16 +25,16 @@ class CaptchaResponseFactory:
 
     def description(self, user: CaptchaUser):
         text = self._build_caption(user.time_left, user.failed_attempts)
-        return Response(text_units=text, menu=CaptchaMenu())
+        return Response(text_units=text, menu=CaptchaMenu(), priority=Priority.HIGH)
 
     def passed_captcha(self):
         text = self._captcha_properties.greeting_message
-        return Response(text_units=text)
+        return Response(text_units=text, priority=Priority.HIGH)
 
     @staticmethod
     def failed_captcha(reason: str):
         text = f"\n❌ {reason}"
-        return Response(text_units=text)
+        return Response(text_units=text, priority=Priority.HIGH)
 
     @staticmethod
     def no_access():
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from vasiniyo_chat_bot.database.sqlite.entity import ChatUserEntity
+
+
+class ChatUsersRepository(Protocol):
+    def save(
+        self,
+        chat_id: int,
+        user_id: int,
+        username: str | None,
+        full_name: str,
+        is_member: bool | None,
+    ) -> None: ...
+    def find(self, chat_id: int, user_id: int) -> ChatUserEntity | None: ...
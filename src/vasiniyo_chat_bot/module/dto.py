@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from enum import IntEnum
 from io import BytesIO
 
 
@@ -58,11 +59,18 @@ class InlineCodeTemplate(TextTemplate):
     text: str
 
 
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
 @dataclass(frozen=True)
 class Response:
     text_units: str | list[str | TextTemplate]
     menu: Menu | None = None
     picture: BytesIO | None = None
+    priority: Priority = Priority.NORMAL
 
 
 class Action(Enum):
@@ -90,6 +98,7 @@ class Field(Enum):
     TARGET_USER_ID = "4"
     TITLE_BAG_ID = "5"
     ANIME_GENRE = "6"
+    CURSOR = "7"
 
 
 @dataclass(frozen=True)
@@ -1,3 +1,4 @@
+from vasiniyo_chat_bot.module.dto import Priority
 from vasiniyo_chat_bot.module.dto import Response
 from vasiniyo_chat_bot.module.dto import UserTemplate
 from vasiniyo_chat_bot.module.like.dto import Leaderboard
@@ -20,7 +21,7 @@ class LikeResponseFactory:
     @staticmethod
     def leaderboard(leaderboard: Leaderboard) -> Response:
         text = LikeResponseFactory._get_leaderboard("🏆 Топ по лайкам:", leaderboard)
-        return Response(text_units=text)
+        return Response(text_units=text, priority=Priority.LOW)
 
     @staticmethod
     def _get_leaderboard(header, leaderboard: Leaderboard) -> list[str | UserTemplate]:
@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+
+from vasiniyo_chat_bot.module.dto import Action
+from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.safely_bot_utils import safe_wrapper
+
+# callback_data layout (base64url, no padding):
+#   version | action tag | (field tag, zigzag varint value)*
+# Legacy buttons carry a JSON object, which always starts with "{".
+VERSION = 1
+
+_FROM_URLSAFE = bytes.maketrans(b"-_", b"+/")
+_ACTION_FIELD = Field.ACTION_TYPE.value
+_ACTION_TAGS = {int(action.value, 16): action.value for action in Action}
+_FIELD_TAGS = {int(field.value): field.value for field in Field}
+
+
+def encode_payload(action: Action, fields: dict[Field, int | None]) -> str:
+    data = bytearray((VERSION, int(action.value, 16)))
+    for field, value in fields.items():
+        if value is None:
+            continue
+        data.append(int(field.value))
+        _write_varint(data, (value << 1) ^ (value >> 63))
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+@safe_wrapper(default={}, message="Failed to decode callback payload")
+def decode_payload(data: str) -> dict[str, int | str]:
+    if data[:1] == "{":
+        return json.loads(data)
+    raw = binascii.a2b_base64(
+        (data + "=" * (-len(data) % 4)).encode("ascii").translate(_FROM_URLSAFE)
+    )
+    if raw[0] != VERSION:
+        raise ValueError(f"Unsupported payload version: {raw[0]}")
+    payload = {_ACTION_FIELD: _ACTION_TAGS[raw[1]]}
+    value = shift = 0
+    field = None
+    for byte in raw[2:]:
+        if field is None:
+            field = _FIELD_TAGS[byte]
+            continue
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        payload[field] = (value >> 1) ^ -(value & 1)
+        value = shift = 0
+        field = None
+    return payload
+
+
+def _write_varint(data: bytearray, value: int):
+    while value > 0x7F:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
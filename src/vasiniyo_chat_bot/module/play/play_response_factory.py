@@ -3,6 +3,7 @@ import random
 
 from vasiniyo_chat_bot.module.dto import BoldTemplate
 from vasiniyo_chat_bot.module.dto import ItalicTemplate
+from vasiniyo_chat_bot.module.dto import Priority
 from vasiniyo_chat_bot.module.dto import Response
 from vasiniyo_chat_bot.module.dto import UserTemplate
 from vasiniyo_chat_bot.module.like.dto import Leaderboard
@@ -89,7 +90,7 @@ class PlayResponseFactory:
         text = PlayResponseFactory._get_leaderboard(
             "Сегодняшние результаты:", leaderboard
         )
-        return Response(text_units=text)
+        return Response(text_units=text, priority=Priority.LOW)
 
     @staticmethod
     def leaderboard(leaderboard: Leaderboard):
@@ -99,7 +100,7 @@ class PlayResponseFactory:
         text = PlayResponseFactory._get_leaderboard(
             "🏆 Топ победителей за всё время:", leaderboard
         )
-        return Response(text_units=text)
+        return Response(text_units=text, priority=Priority.LOW)
 
     @staticmethod
     def debug_daily_result(category: PlayCategory, leaderboard: Leaderboard):
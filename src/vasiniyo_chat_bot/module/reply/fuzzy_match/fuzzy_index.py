@@ -0,0 +1,65 @@
+from typing import Iterable
+
+from rapidfuzz import fuzz
+from rapidfuzz import process
+
+from .fuzzy_match import _en_ru_layout
+from .fuzzy_match import _ru_en_layout
+
+
+class FuzzyIndex:
+    """Trigger keys compiled once for fuzzy matching whole messages.
+
+    Keys are lowercased and grouped by word count. A message is lowercased
+    and converted through both keyboard layouts once; every window of words
+    is then scored against all keys of the same length in a single rapidfuzz
+    call, so the Python-level work depends on the message, not on the number
+    of keys. Matched keys are the same as ``find_matches`` gives for each key;
+    a layout variant that equals the message itself does not count as an
+    inverted match.
+    """
+
+    def __init__(self, keys: Iterable[str], similarity: int = 80) -> None:
+        self._similarity = similarity
+        self._keys_by_words: dict[int, list[str]] = {}
+        for key in dict.fromkeys(key.lower() for key in keys):
+            if words := len(key.split()):
+                self._keys_by_words.setdefault(words, []).append(key)
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._keys_by_words.values())
+
+    def match(self, message: str) -> dict[str, list[bool]]:
+        """
+        Returns the matched lowercased keys, each with the list of
+        ``is_inverted`` flags of the message variants it matched in.
+        """
+        if not self._keys_by_words:
+            return {}
+        message = message.lower()
+        variants = [(message, False)]
+        for layout in (_EN_RU, _RU_EN):
+            if (converted := message.translate(layout)) != message:
+                variants.append((converted, True))
+        matched: dict[str, list[bool]] = {}
+        for variant, inverted in variants:
+            words = variant.split()
+            for size, keys in self._keys_by_words.items():
+                found = set()
+                for i in range(len(words) - size + 1):
+                    window = " ".join(words[i : i + size])
+                    for key, _, _ in process.extract(
+                        window,
+                        keys,
+                        scorer=fuzz.ratio,
+                        score_cutoff=self._similarity,
+                        limit=None,
+                    ):
+                        found.add(key)
+                for key in found:
+                    matched.setdefault(key, []).append(inverted)
+        return matched
+
+
+_EN_RU = str.maketrans(_en_ru_layout)
+_RU_EN = str.maketrans(_ru_en_layout)
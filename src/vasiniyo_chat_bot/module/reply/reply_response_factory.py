@@ -1,3 +1,4 @@
+from vasiniyo_chat_bot.module.dto import Priority
 from vasiniyo_chat_bot.module.dto import Response
 from vasiniyo_chat_bot.module.reply.dto import StickerResult
 from vasiniyo_chat_bot.module.reply.dto import TextResult
@@ -6,8 +7,8 @@ from vasiniyo_chat_bot.module.reply.dto import TextResult
 class ReplyResponseFactory:
     @staticmethod
     def text(result: TextResult) -> Response:
-        return Response(result.text)
+        return Response(result.text, priority=Priority.HIGH)
 
     @staticmethod
     def sticker(sticker: StickerResult) -> Response:
-        return Response(sticker.file_id)
+        return Response(sticker.file_id, priority=Priority.HIGH)
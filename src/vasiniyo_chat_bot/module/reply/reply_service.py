@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from dataclasses import replace
 import math
 import random
 
@@ -7,14 +9,28 @@ from .dto import StickerResult
 from .dto import TextResult
 from .dto import Trigger
 from .dto import TriggerReplies
-from .fuzzy_match.fuzzy_match import choice_one_match
+from .fuzzy_match.fuzzy_index import FuzzyIndex
+
+
+@dataclass(frozen=True)
+class _CompiledTriggers:
+    """Triggers grouped at load time by how they match a message.
+
+    ``exact`` maps the request to exact-match and non-fuzzy triggers, so
+    those are found with a single lookup; ``fuzzy_triggers`` maps the
+    lowercased request of fuzzy triggers to the keys of ``fuzzy``.
+    """
+
+    exact: dict[str, list[Trigger]]
+    fuzzy: FuzzyIndex
+    fuzzy_triggers: dict[str, list[Trigger]]
 
 
 class ReplyService:
     def __init__(self, long_messages: LongMessage, triggers: TriggerReplies) -> None:
         self._long_message_settings = long_messages
-        self._text_triggers = triggers.text_replies
-        self._sticker_triggers = triggers.sticker_replies
+        self._text_triggers = self._compile(triggers.text_replies)
+        self._sticker_triggers = self._compile(triggers.sticker_replies)
 
     def handle_text_replies(self, text: str) -> TextResult | StickerResult | None:
         if self._is_long_message(text):
@@ -26,37 +42,51 @@ class ReplyService:
         return self._get_reply(file_id, self._sticker_triggers)
 
     @staticmethod
-    def _get_reply(text, triggers: list[Trigger]) -> TextResult | StickerResult | None:
-        possible_replies = []
-        reply = None
+    def _compile(triggers: list[Trigger]) -> _CompiledTriggers:
+        exact, fuzzy_triggers = {}, {}
         for trigger in triggers:
-            if trigger.chance < random.random():
-                continue
-            if trigger.exact_match:
-                if text == trigger.request:
-                    reply = random.choice(trigger.responses)
-            elif not trigger.fuzzy and text == trigger.request:
-                reply = random.choice(trigger.responses)
-            else:
-                answers = {trigger.request: trigger.responses}
-                matched_key, used_inverted = choice_one_match(text, answers.keys())
-                reply = random.choice(answers.get(matched_key) or [None])
-                if trigger.response_type == MessageType.TEXT and used_inverted:
-                    reply = f"{matched_key}?\n{reply}"
-            if not reply:
-                continue
-            if trigger.response_type == MessageType.TEXT:
-                possible_replies.append(
-                    TextResult(text=reply, to_reply=trigger.to_target)
-                )
+            if trigger.exact_match or not trigger.fuzzy:
+                exact.setdefault(trigger.request, []).append(trigger)
             else:
-                possible_replies.append(
-                    StickerResult(file_id=reply, to_reply=trigger.to_target)
-                )
+                fuzzy_triggers.setdefault(trigger.request.lower(), []).append(trigger)
+        return _CompiledTriggers(
+            exact=exact, fuzzy=FuzzyIndex(fuzzy_triggers), fuzzy_triggers=fuzzy_triggers
+        )
+
+    @staticmethod
+    def _get_reply(
+        text, triggers: _CompiledTriggers
+    ) -> TextResult | StickerResult | None:
+        possible_replies = []
+        for trigger in triggers.exact.get(text, ()):
+            if trigger.chance >= random.random():
+                possible_replies.append(ReplyService._to_result(trigger))
+        for matched_key, inverted in triggers.fuzzy.match(text).items():
+            for trigger in triggers.fuzzy_triggers[matched_key]:
+                if trigger.chance < random.random():
+                    continue
+                result = ReplyService._to_result(trigger)
+                if (
+                    result
+                    and trigger.response_type == MessageType.TEXT
+                    and random.choice(inverted)
+                ):
+                    result = replace(result, text=f"{matched_key}?\n{result.text}")
+                possible_replies.append(result)
+        possible_replies = [reply for reply in possible_replies if reply]
         if possible_replies:
             return random.choice(possible_replies)
         return None
 
+    @staticmethod
+    def _to_result(trigger: Trigger) -> TextResult | StickerResult | None:
+        if not trigger.responses:
+            return None
+        reply = random.choice(trigger.responses)
+        if trigger.response_type == MessageType.TEXT:
+            return TextResult(text=reply, to_reply=trigger.to_target)
+        return StickerResult(file_id=reply, to_reply=trigger.to_target)
+
     def _is_long_message(self, text: str) -> bool:
         return (
             random.random() < self.laplace_cdf(len(text))
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from vasiniyo_chat_bot.database.sqlite.entity import ScheduledTaskEntity
+
+
+class ScheduledTasksRepository(Protocol):
+    def save(self, task: ScheduledTaskEntity) -> None: ...
+    def delete(self, task_id: str) -> None: ...
+    def find_all(self) -> list[ScheduledTaskEntity]: ...
@@ -0,0 +1,203 @@
+from collections import OrderedDict
+from datetime import date
+import logging
+import threading
+from typing import Callable
+from typing import TypeVar
+
+from vasiniyo_chat_bot.database.sqlite.entity import TitlesBagEntity
+from vasiniyo_chat_bot.module.like.dto import Leaderboard
+from vasiniyo_chat_bot.module.titles.titles_repository import TitlesRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CachedTitlesRepository(TitlesRepository):
+    """Read-through cache of per-user titles state in front of a repository.
+
+    For every ``(chat_id, user_id)`` it keeps the current title, the rolls
+    state of the current day and the inventory. Mutations drop the affected
+    users after they are written; a read that overlaps a mutation is not
+    stored, so the cache never keeps state older than the last write.
+    """
+
+    def __init__(
+        self,
+        delegate: TitlesRepository,
+        max_size: int = 10_000,
+        report_every: int = 1000,
+    ) -> None:
+        self._delegate = delegate
+        self._max_size = max_size
+        self._report_every = report_every
+        self._entries: OrderedDict[tuple[int, int], dict[str, object]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+    def find_user_title(self, chat_id: int, user_id: int) -> str | None:
+        return self._read(
+            chat_id,
+            user_id,
+            "title",
+            lambda: self._delegate.find_user_title(chat_id, user_id),
+        )
+
+    def get_rolls_remaining(self, chat_id: int, user_id: int) -> tuple[bool, int]:
+        today = date.today()
+        rolls_day, rolls = self._read(
+            chat_id,
+            user_id,
+            "rolls",
+            lambda: (today, self._delegate.get_rolls_remaining(chat_id, user_id)),
+        )
+        if rolls_day != today:
+            self._invalidate((chat_id, user_id))
+            return self.get_rolls_remaining(chat_id, user_id)
+        return rolls
+
+    def get_user_titles_bag(self, chat_id: int, user_id: int) -> Leaderboard:
+        return self._read(
+            chat_id,
+            user_id,
+            "bag",
+            lambda: self._delegate.get_user_titles_bag(chat_id, user_id),
+        )
+
+    def get_inventory_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        return self._delegate.get_inventory_page(
+            chat_id, user_id, cursor_id, forward, limit
+        )
+
+    def get_steal_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]:
+        return self._delegate.get_steal_page(
+            chat_id, user_id, cursor_id, forward, limit
+        )
+
+    def get_user_titles(self, chat_id: int) -> list[TitlesBagEntity]:
+        return self._delegate.get_user_titles(chat_id)
+
+    def exists(self, chat_id: int, user_id: int, title_bag_id: int) -> bool:
+        return self._delegate.exists(chat_id, user_id, title_bag_id)
+
+    def get_users_by_chat(self, chat_id: int) -> set[int]:
+        return self._delegate.get_users_by_chat(chat_id)
+
+    def init_title(self, chat_id: int, user_id: int, user_title: str) -> str | None:
+        result = self._delegate.init_title(chat_id, user_id, user_title)
+        self._invalidate((chat_id, user_id))
+        return result
+
+    def update_attempt(self, chat_id: int, user_id: int) -> None:
+        self._delegate.update_attempt(chat_id, user_id)
+        self._invalidate((chat_id, user_id))
+
+    def get_title_after_touch(self, chat_id: int, user_id: int) -> str | None:
+        result = self._delegate.get_title_after_touch(chat_id, user_id)
+        self._invalidate((chat_id, user_id))
+        return result
+
+    def set_current(self, chat_id: int, user_id: int, title_bag_id: int) -> str | None:
+        result = self._delegate.set_current(chat_id, user_id, title_bag_id)
+        self._invalidate((chat_id, user_id))
+        return result
+
+    def rotate_title(self, chat_id: int, user_id: int, title: str) -> str:
+        result = self._delegate.rotate_title(chat_id, user_id, title)
+        self._invalidate((chat_id, user_id))
+        return result
+
+    def steal_logic(
+        self, chat_id: int, actor_id: int, title_id: int
+    ) -> tuple[tuple[int | None, str | None], tuple[int | None, str | None]]:
+        result = self._delegate.steal_logic(chat_id, actor_id, title_id)
+        (_, _), (target_id, _) = result
+        self._invalidate(
+            (chat_id, actor_id), *([(chat_id, target_id)] if target_id else [])
+        )
+        return result
+
+    def set_inventory(
+        self, chat_id: int, user_id: int, title_bag_id: int
+    ) -> str | None:
+        result = self._delegate.set_inventory(chat_id, user_id, title_bag_id)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == chat_id]
+        self._invalidate(*keys)
+        return result
+
+    def exchange_title(
+        self, chat_id: int, user_id: int, title_bag_id: int
+    ) -> tuple[str | None, int]:
+        result = self._delegate.exchange_title(chat_id, user_id, title_bag_id)
+        self._invalidate((chat_id, user_id))
+        return result
+
+    def _read(self, chat_id: int, user_id: int, field: str, load: Callable[[], T]) -> T:
+        key = (chat_id, user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and field in entry:
+                self._entries.move_to_end(key)
+                self._count(hit=True)
+                return entry[field]
+            self._count(hit=False)
+            generation = self._generation
+        value = load()
+        with self._lock:
+            if generation == self._generation:
+                self._entries.setdefault(key, {})[field] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        return value
+
+    def _invalidate(self, *keys: tuple[int, int]) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += len(keys)
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if (self.hits + self.misses) % self._report_every == 0:
+            logger.info(
+                "titles_cache_stats",
+                extra={
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "invalidations": self.invalidations,
+                    "size": len(self._entries),
+                },
+            )
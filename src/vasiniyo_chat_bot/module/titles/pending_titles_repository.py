@@ -0,0 +1,8 @@
+from typing import Protocol
+
+
+class PendingTitlesRepository(Protocol):
+    def save(self, chat_id: int, user_id: int, day: int, title: str) -> None: ...
+    def find(self, chat_id: int, user_id: int, day: int) -> str | None: ...
+    def delete(self, chat_id: int, user_id: int) -> None: ...
+    def delete_before(self, day: int) -> None: ...
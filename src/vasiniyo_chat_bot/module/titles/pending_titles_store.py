@@ -0,0 +1,74 @@
+from collections import OrderedDict
+import datetime
+import logging
+import threading
+from typing import Callable
+
+from vasiniyo_chat_bot.module.titles.pending_titles_repository import (
+    PendingTitlesRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PendingTitlesStore:
+    """Next titles offered to users in the rename menu, kept for one day.
+
+    Titles live in a bucket of the current day; the first access on a new
+    day drops the previous buckets at once. The bucket keeps at most
+    ``max_size`` users and evicts the least recently used ones. With a
+    repository the titles are also persisted, so evicted entries and
+    previews shown before a restart are read back instead of regenerated.
+    """
+
+    def __init__(
+        self, repository: PendingTitlesRepository | None = None, max_size: int = 10_000
+    ) -> None:
+        self._repository = repository
+        self._max_size = max_size
+        self._day: int | None = None
+        self._titles: OrderedDict[tuple[int, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, chat_id: int, user_id: int, generate: Callable[[], str]) -> str:
+        key = (chat_id, user_id)
+        day = self._today()
+        with self._lock:
+            if title := self._titles.get(key):
+                self._titles.move_to_end(key)
+                return title
+        title = self._repository and self._repository.find(chat_id, user_id, day)
+        if not title:
+            title = generate()
+            if self._repository:
+                self._repository.save(chat_id, user_id, day, title)
+        with self._lock:
+            title = self._titles.setdefault(key, title)
+            self._titles.move_to_end(key)
+            while len(self._titles) > self._max_size:
+                self._titles.popitem(last=False)
+        return title
+
+    def remove(self, chat_id: int, user_id: int) -> None:
+        # the row goes first, so a read missing memory cannot bring it back
+        if self._repository:
+            self._repository.delete(chat_id, user_id)
+        with self._lock:
+            self._titles.pop((chat_id, user_id), None)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def _today(self) -> int:
+        day = datetime.date.today().toordinal()
+        with self._lock:
+            if day == self._day:
+                return day
+            evicted = len(self._titles)
+            self._titles.clear()
+            self._day = day
+        if evicted:
+            logger.info("pending_titles_rotated", extra={"evicted": evicted})
+        if self._repository:
+            self._repository.delete_before(day)
+        return day
@@ -89,21 +89,23 @@ class TitlesController:
             case Action.OPEN_RENAME_MENU:
                 self._handle_back_to_rename_menu(ctx)
             case Action.OPEN_STEAL_MENU:
-                self._show_steal_menu(ctx, payload.page)
+                self._show_steal_menu(ctx, payload.page, payload.cursor)
             case Action.STEAL_TITLE:
                 self._handle_steal(ctx, payload.target_id, payload.title_bag_id)
             case Action.OPEN_TITLES_BAG:
-                self._handle_show_titles_bag(ctx, payload.page)
+                self._handle_show_titles_bag(ctx, payload.page, payload.cursor)
             case Action.SET_TITLE_BAG:
                 self._handle_swap_title(ctx, payload.title_bag_id)
             case Action.GIFT_RECIPIENTS_MENU:
                 self._handle_show_recipients_menu(ctx, payload.page)
             case Action.GIFT_TITLE_MENU:
-                self._handle_show_gift_title_menu(ctx, payload.target_id, payload.page)
+                self._handle_show_gift_title_menu(
+                    ctx, payload.target_id, payload.page, payload.cursor
+                )
             case Action.GIVE_TITLE:
                 self._give_title(ctx, payload.target_id, payload.title_bag_id)
             case Action.OPEN_EXCHANGE_TITLE_MENU:
-                self._exchange_title_menu(ctx, payload.page)
+                self._exchange_title_menu(ctx, payload.page, payload.cursor)
             case Action.EXCHANGE_TITLE:
                 self._handle_exchange_title(ctx, payload.title_bag_id)
 
@@ -166,9 +168,11 @@ class TitlesController:
         response = self._response_factory.rename_menu(menu)
         self._renderer.edit(response, ctx)
 
-    def _show_steal_menu(self, ctx: UserContext, page: int, page_size: int = 20):
+    def _show_steal_menu(
+        self, ctx: UserContext, page: int, cursor: int | None, page_size: int = 20
+    ):
         menu = self._titles_service.show_steal_menu(
-            ctx.chat_id, ctx.user_id, page, page_size
+            ctx.chat_id, ctx.user_id, page, page_size, cursor
         )
         if isinstance(menu, RenameMenu):
             response = self._response_factory.rename_menu(menu)
@@ -187,16 +191,20 @@ class TitlesController:
         response = self._response_factory.steal_menu(menu)
         self._renderer.edit(response, ctx)
 
-    def _handle_show_titles_bag(self, ctx: UserContext, page: int, page_size: int = 20):
+    def _handle_show_titles_bag(
+        self, ctx: UserContext, page: int, cursor: int | None, page_size: int = 20
+    ):
         titles_bag_menu = self._titles_service.handle_show_titles_bag(
-            ctx.chat_id, ctx.user_id, page, page_size
+            ctx.chat_id, ctx.user_id, page, page_size, cursor
         )
         response = self._response_factory.inventory(titles_bag_menu)
         self._renderer.edit(response, ctx)
 
-    def _exchange_title_menu(self, ctx: UserContext, page: int, page_size: int = 20):
+    def _exchange_title_menu(
+        self, ctx: UserContext, page: int, cursor: int | None, page_size: int = 20
+    ):
         titles_bag_menu = self._titles_service.handle_exchange_title(
-            ctx.chat_id, ctx.user_id, page, page_size
+            ctx.chat_id, ctx.user_id, page, page_size, cursor
         )
         response = self._response_factory.exchange_menu(titles_bag_menu)
         self._renderer.edit(response, ctx)
@@ -229,10 +237,15 @@ class TitlesController:
         self._renderer.edit(response, ctx)
 
     def _handle_show_gift_title_menu(
-        self, ctx: UserContext, target_id: int, page: int, page_size: int = 20
+        self,
+        ctx: UserContext,
+        target_id: int,
+        page: int,
+        cursor: int | None,
+        page_size: int = 20,
     ):
         menu = self._titles_service.get_gift_titles(
-            ctx.chat_id, ctx.user_id, target_id, page, page_size
+            ctx.chat_id, ctx.user_id, target_id, page, page_size, cursor
         )
         response = self._response_factory.gift_title_menu(menu)
         self._renderer.edit(response, ctx)
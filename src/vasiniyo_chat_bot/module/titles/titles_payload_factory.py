@@ -3,8 +3,8 @@ import json
 
 from vasiniyo_chat_bot.module.dto import Action
 from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
 from vasiniyo_chat_bot.safely_bot_utils import extract_field
-from vasiniyo_chat_bot.safely_bot_utils import parse_json
 
 
 @dataclass(frozen=True)
@@ -15,35 +15,29 @@ class TitlesPayload:
     page: int | None = None
     target_id: int | None = None
     title_bag_id: int | None = None
+    cursor: int | None = None
 
 
 class TitlesPayloadFactory:
-    _valid_payload_actions = {
-        Action.ROLL_RANDOM_D6.value,
-        Action.ROLL_D6.value,
-        Action.OPEN_RENAME_MENU.value,
-        Action.OPEN_STEAL_MENU.value,
-        Action.STEAL_TITLE.value,
-        Action.OPEN_TITLES_BAG.value,
-        Action.SET_TITLE_BAG.value,
-        Action.GIFT_RECIPIENTS_MENU.value,
-        Action.GIFT_TITLE_MENU.value,
-        Action.GIVE_TITLE.value,
-        Action.OPEN_EXCHANGE_TITLE_MENU.value,
-        Action.EXCHANGE_TITLE.value,
-    }
+    actions = frozenset(
+        {
+            Action.ROLL_RANDOM_D6,
+            Action.ROLL_D6,
+            Action.OPEN_RENAME_MENU,
+            Action.OPEN_STEAL_MENU,
+            Action.STEAL_TITLE,
+            Action.OPEN_TITLES_BAG,
+            Action.SET_TITLE_BAG,
+            Action.GIFT_RECIPIENTS_MENU,
+            Action.GIFT_TITLE_MENU,
+            Action.GIVE_TITLE,
+            Action.OPEN_EXCHANGE_TITLE_MENU,
+            Action.EXCHANGE_TITLE,
+        }
+    )
 
     @staticmethod
-    def has_titles_payload(data: str) -> bool:
-        payload = parse_json(data)
-        return (
-            payload.get(Field.ACTION_TYPE.value)
-            in TitlesPayloadFactory._valid_payload_actions
-        )
-
-    @staticmethod
-    def get_payload(data: str) -> TitlesPayload:
-        payload = parse_json(data)
+    def get_payload(payload: dict[str, int | str]) -> TitlesPayload:
         action_value = payload.get(Field.ACTION_TYPE.value)
         action = Action._value2member_map_.get(action_value)
         return TitlesPayload(
@@ -53,127 +47,98 @@ class TitlesPayloadFactory:
             page=extract_field(payload, Field.PAGE),
             target_id=extract_field(payload, Field.TARGET_USER_ID),
             title_bag_id=extract_field(payload, Field.TITLE_BAG_ID),
+            cursor=extract_field(payload, Field.CURSOR),
         )
 
     @staticmethod
-    def titles_bag_menu(page: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.OPEN_TITLES_BAG.value,
-                Field.USER_ID.value: user_id,
-                Field.PAGE.value: page,
-            }
+    def titles_bag_menu(page: int, user_id: int, cursor: int | None = None) -> str:
+        return encode_payload(
+            Action.OPEN_TITLES_BAG,
+            {Field.USER_ID: user_id, Field.PAGE: page, Field.CURSOR: cursor},
         )
 
     @staticmethod
     def set_title_bag(title_bag_id: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.SET_TITLE_BAG.value,
-                Field.USER_ID.value: user_id,
-                Field.TITLE_BAG_ID.value: title_bag_id,
-            }
+        return encode_payload(
+            Action.SET_TITLE_BAG,
+            {Field.USER_ID: user_id, Field.TITLE_BAG_ID: title_bag_id},
         )
 
     @staticmethod
-    def exchange_menu(page: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.OPEN_EXCHANGE_TITLE_MENU.value,
-                Field.USER_ID.value: user_id,
-                Field.PAGE.value: page,
-            }
+    def exchange_menu(page: int, user_id: int, cursor: int | None = None) -> str:
+        return encode_payload(
+            Action.OPEN_EXCHANGE_TITLE_MENU,
+            {Field.USER_ID: user_id, Field.PAGE: page, Field.CURSOR: cursor},
         )
 
     @staticmethod
     def exchange_title(title_bag_id: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.EXCHANGE_TITLE.value,
-                Field.USER_ID.value: user_id,
-                Field.TITLE_BAG_ID.value: title_bag_id,
-            }
+        return encode_payload(
+            Action.EXCHANGE_TITLE,
+            {Field.USER_ID: user_id, Field.TITLE_BAG_ID: title_bag_id},
         )
 
     @staticmethod
     def d6(i, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.ROLL_D6.value,
-                Field.USER_ID.value: user_id,
-                Field.DICE_VALUE.value: i,
-            }
+        return encode_payload(
+            Action.ROLL_D6, {Field.USER_ID: user_id, Field.DICE_VALUE: i}
         )
 
     @staticmethod
     def random_d6(user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.ROLL_RANDOM_D6.value,
-                Field.USER_ID.value: user_id,
-            }
-        )
+        return encode_payload(Action.ROLL_RANDOM_D6, {Field.USER_ID: user_id})
 
     @staticmethod
     def rename_menu(user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.OPEN_RENAME_MENU.value,
-                Field.USER_ID.value: user_id,
-            }
-        )
+        return encode_payload(Action.OPEN_RENAME_MENU, {Field.USER_ID: user_id})
 
     @staticmethod
-    def steal_menu(page: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.OPEN_STEAL_MENU.value,
-                Field.USER_ID.value: user_id,
-                Field.PAGE.value: page,
-            }
+    def steal_menu(page: int, user_id: int, cursor: int | None = None) -> str:
+        return encode_payload(
+            Action.OPEN_STEAL_MENU,
+            {Field.USER_ID: user_id, Field.PAGE: page, Field.CURSOR: cursor},
         )
 
     @staticmethod
     def steal_title(title_id: int, target_id: int, user_id: int) -> str:
-        return json.dumps(
+        return encode_payload(
+            Action.STEAL_TITLE,
             {
-                Field.ACTION_TYPE.value: Action.STEAL_TITLE.value,
-                Field.USER_ID.value: user_id,
-                Field.TITLE_BAG_ID.value: title_id,
-                Field.TARGET_USER_ID.value: target_id,
-            }
+                Field.USER_ID: user_id,
+                Field.TITLE_BAG_ID: title_id,
+                Field.TARGET_USER_ID: target_id,
+            },
         )
 
     @staticmethod
     def gift_recipients_menu(page: int, user_id: int) -> str:
-        return json.dumps(
-            {
-                Field.ACTION_TYPE.value: Action.GIFT_RECIPIENTS_MENU.value,
-                Field.USER_ID.value: user_id,
-                Field.PAGE.value: page,
-            }
+        return encode_payload(
+            Action.GIFT_RECIPIENTS_MENU, {Field.USER_ID: user_id, Field.PAGE: page}
         )
 
     @staticmethod
-    def gift_titles_menu(page: int, target_id: int, user_id: int) -> str:
-        return json.dumps(
+    def gift_titles_menu(
+        page: int, target_id: int, user_id: int, cursor: int | None = None
+    ) -> str:
+        return encode_payload(
+            Action.GIFT_TITLE_MENU,
             {
-                Field.ACTION_TYPE.value: Action.GIFT_TITLE_MENU.value,
-                Field.USER_ID.value: user_id,
-                Field.TARGET_USER_ID.value: target_id,
-                Field.PAGE.value: page,
-            }
+                Field.USER_ID: user_id,
+                Field.TARGET_USER_ID: target_id,
+                Field.PAGE: page,
+                Field.CURSOR: cursor,
+            },
         )
 
     @staticmethod
     def give_title(title_id: int, target_id: int, user_id: int):
-        return json.dumps(
+        return encode_payload(
+            Action.GIVE_TITLE,
             {
-                Field.ACTION_TYPE.value: Action.GIVE_TITLE.value,
-                Field.USER_ID.value: user_id,
-                Field.TARGET_USER_ID.value: target_id,
-                Field.TITLE_BAG_ID.value: title_id,
-            }
+                Field.USER_ID: user_id,
+                Field.TARGET_USER_ID: target_id,
+                Field.TITLE_BAG_ID: title_id,
+            },
         )
 
     @staticmethod
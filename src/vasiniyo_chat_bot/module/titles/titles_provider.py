@@ -1,46 +1,79 @@
+from bisect import bisect_right
+import logging
 import random
 
 from vasiniyo_chat_bot.module.titles.dto import CustomTitles
+from vasiniyo_chat_bot.module.titles.dto import NounGroup
+
+logger = logging.getLogger(__name__)
+
+MAX_TITLE_LENGTH = 16
 
 
 class TitlesProvider:
-    def __init__(self, custom_titles: CustomTitles):
-        self._adjectives = custom_titles.adjectives
-        self._nouns = custom_titles.nouns
-
-    def next_title(self):
-        adj_group = random.choice(self._adjectives)
-        adj_base = random.choice(adj_group.base)
-        match random.randint(0, 3):
-            case 0:
-                adj = f"{adj_base}{adj_group.male_ending}"
-                noun_group = random.choice(self._nouns.male)
-                noun_base = random.choice(noun_group.base)
-                noun = f"{noun_base}{noun_group.singular_ending}"
-            case 1:
-                adj = f"{adj_base}{adj_group.female_ending}"
-                noun_group = random.choice(self._nouns.female)
-                noun_base = random.choice(noun_group.base)
-                noun = f"{noun_base}{noun_group.singular_ending}"
-            case 2:
-                adj = f"{adj_base}{adj_group.neuter_ending}"
-                noun_group = random.choice(self._nouns.neuter)
-                noun_base = random.choice(noun_group.base)
-                noun = f"{noun_base}{noun_group.singular_ending}"
-            case _:
-                adj = f"{adj_base}{adj_group.plural_ending}"
-                match random.randint(0, 2):
-                    case 0:
-                        noun_group = random.choice(self._nouns.male)
-                        noun_base = random.choice(noun_group.base)
-                        noun = f"{noun_base}{noun_group.plural_ending}"
-                    case 1:
-                        noun_group = random.choice(self._nouns.female)
-                        noun_base = random.choice(noun_group.base)
-                        noun = f"{noun_base}{noun_group.plural_ending}"
-                    case _:
-                        noun_group = random.choice(self._nouns.neuter)
-                        noun_base = random.choice(noun_group.base)
-                        noun = f"{noun_base}{noun_group.plural_ending}"
-        title = f"{adj} {noun}"
-        return title if len(title) <= 16 else self.next_title()
+    """Draws titles uniformly from every adjective-noun pair that fits.
+
+    The pairs are indexed once. For every grammatical form adjectives are
+    bucketed by length and nouns are sorted by length, so each bucket pairs
+    its adjectives with a prefix of the nouns. A draw picks one pair number,
+    finds its bucket by cumulative size and splits it into the two words.
+    """
+
+    def __init__(self, custom_titles: CustomTitles, max_length: int = MAX_TITLE_LENGTH):
+        self._buckets: list[tuple[list[str], list[str], int]] = []
+        self._bounds: list[int] = []
+        self.size = 0
+        for adjectives, nouns in self._forms(custom_titles):
+            nouns = sorted(nouns, key=len)
+            noun_lengths = [len(noun) for noun in nouns]
+            by_length: dict[int, list[str]] = {}
+            for adjective in adjectives:
+                by_length.setdefault(len(adjective), []).append(adjective)
+            for length, words in sorted(by_length.items()):
+                fitting = bisect_right(noun_lengths, max_length - length - 1)
+                if fitting:
+                    self.size += len(words) * fitting
+                    self._buckets.append((words, nouns, fitting))
+                    self._bounds.append(self.size)
+        logger.info(
+            "titles_space", extra={"size": self.size, "buckets": len(self._buckets)}
+        )
+
+    def next_title(self) -> str:
+        if not self.size:
+            raise ValueError(f"No custom title fits into {MAX_TITLE_LENGTH} chars")
+        number = random.randrange(self.size)
+        bucket = bisect_right(self._bounds, number)
+        adjectives, nouns, fitting = self._buckets[bucket]
+        offset = number - (self._bounds[bucket - 1] if bucket else 0)
+        adjective, noun = divmod(offset, fitting)
+        return f"{adjectives[adjective]} {nouns[noun]}"
+
+    @staticmethod
+    def _forms(custom_titles: CustomTitles) -> list[tuple[list[str], list[str]]]:
+        def adjectives(ending: str) -> list[str]:
+            return [
+                f"{base}{getattr(group, ending)}"
+                for group in custom_titles.adjectives
+                for base in group.base
+            ]
+
+        def nouns(groups: list[NounGroup], ending: str) -> list[str]:
+            return [
+                f"{base}{getattr(group, ending)}"
+                for group in groups
+                for base in group.base
+            ]
+
+        male = custom_titles.nouns.male
+        female = custom_titles.nouns.female
+        neuter = custom_titles.nouns.neuter
+        return [
+            (adjectives("male_ending"), nouns(male, "singular_ending")),
+            (adjectives("female_ending"), nouns(female, "singular_ending")),
+            (adjectives("neuter_ending"), nouns(neuter, "singular_ending")),
+            (
+                adjectives("plural_ending"),
+                nouns(male + female + neuter, "plural_ending"),
+            ),
+        ]
@@ -10,6 +10,22 @@ class TitlesRepository(Protocol):
     def find_user_title(self, chat_id: int, user_id: int) -> str | None: ...
     def get_user_titles(self, chat_id: int) -> list[TitlesBagEntity]: ...
     def get_user_titles_bag(self, chat_id: int, user_id: int) -> Leaderboard: ...
+    def get_inventory_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]: ...
+    def get_steal_page(
+        self,
+        chat_id: int,
+        user_id: int,
+        cursor_id: int | None,
+        forward: bool,
+        limit: int,
+    ) -> list[TitlesBagEntity]: ...
     def get_title_after_touch(self, chat_id: int, user_id: int) -> str | None: ...
     def get_rolls_remaining(self, chat_id: int, user_id: int) -> tuple[bool, int]: ...
     def set_current(
@@ -1,5 +1,7 @@
 from typing import Callable
+from typing import TypeVar
 
+from vasiniyo_chat_bot.database.sqlite.entity import TitlesBagEntity
 from vasiniyo_chat_bot.module.titles.dto import ExchangeTitleMenu
 from vasiniyo_chat_bot.module.titles.dto import GiftRecipientInfo
 from vasiniyo_chat_bot.module.titles.dto import GiftRecipientsMenu
@@ -12,19 +14,23 @@ from vasiniyo_chat_bot.module.titles.dto import TitleExchanged
 from vasiniyo_chat_bot.module.titles.dto import TitleInfo
 from vasiniyo_chat_bot.module.titles.dto import TitlesBagItemView
 from vasiniyo_chat_bot.module.titles.dto import TitlesBagMenu
+from vasiniyo_chat_bot.module.titles.pending_titles_store import PendingTitlesStore
 from vasiniyo_chat_bot.module.titles.titles_provider import TitlesProvider
 from vasiniyo_chat_bot.module.titles.titles_repository import TitlesRepository
-from vasiniyo_chat_bot.safely_bot_utils import daily_hash
 
+T = TypeVar("T")
 
-class TitlesService:
-    _rolling_titles = {}
 
+class TitlesService:
     def __init__(
-        self, titles_provider: TitlesProvider, titles_repository: TitlesRepository
+        self,
+        titles_provider: TitlesProvider,
+        titles_repository: TitlesRepository,
+        pending_titles: PendingTitlesStore | None = None,
     ):
         self._titles_provider = titles_provider
         self._titles_repository = titles_repository
+        self._pending_titles = pending_titles or PendingTitlesStore()
 
     def get_user_title(self, chat_id, user_id):
         return self._titles_repository.find_user_title(chat_id, user_id)
@@ -58,9 +64,8 @@ class TitlesService:
         )
 
     def show_steal_menu(
-        self, chat_id: int, user_id: int, page: int, page_size: int
+        self, chat_id: int, user_id: int, page: int, page_size: int, cursor: int | None
     ) -> StealMenu | RenameMenu:
-        page = page if page > 0 else 0
         if not self.is_roll_remaining(chat_id, user_id):
             return RenameMenu(
                 title=None,
@@ -70,36 +75,28 @@ class TitlesService:
                 exchange_menu=True,
                 titles_bag=True,
             )
-        rows = list(self._titles_repository.get_user_titles(chat_id))
-        counts = {}
-        for r in rows:
-            counts[r.user_id] = counts.get(r.user_id, 0) + 1
-        titles = [
-            TitleInfo(
-                id=row.id,
-                user_id=row.user_id,
-                title=row.user_title,
-                is_inventory=row.is_inventory,
-            )
-            for row in sorted(
-                rows,
-                key=lambda row: (
-                    -counts[row.user_id],
-                    row.user_id,
-                    row.is_inventory,
-                    row.user_title,
-                ),
-            )
-            if row.user_id != user_id
-        ]
-        start_page = page * page_size
-        end_page = start_page + page_size
+        rows, page, has_prev_pages, has_more_pages = self._keyset_page(
+            lambda cursor_id, forward, limit: self._titles_repository.get_steal_page(
+                chat_id, user_id, cursor_id, forward, limit
+            ),
+            page,
+            page_size,
+            cursor,
+        )
         return StealMenu(
             chat_id=chat_id,
-            titles=titles[start_page:end_page],
+            titles=[
+                TitleInfo(
+                    id=row.id,
+                    user_id=row.user_id,
+                    title=row.user_title,
+                    is_inventory=row.is_inventory,
+                )
+                for row in rows
+            ],
             page=page,
-            has_prev_pages=page > 0,
-            has_more_pages=end_page < len(titles),
+            has_prev_pages=has_prev_pages,
+            has_more_pages=has_more_pages,
         )
 
     def handle_steal(
@@ -130,33 +127,27 @@ class TitlesService:
         return TitleChanged(title=title, changed=success)
 
     def handle_show_titles_bag(
-        self, chat_id: int, user_id: int, page: int, page_size: int
+        self, chat_id: int, user_id: int, page: int, page_size: int, cursor: int | None
     ) -> TitlesBagMenu:
-        page = page if page > 0 else 0
-        titles = [
-            row.value
-            for row in self._titles_repository.get_user_titles_bag(
-                chat_id, user_id
-            ).rows
-        ]
-        start_page = page * page_size
-        end_page = start_page + page_size
+        rows, page, has_prev_pages, has_more_pages = self._inventory_page(
+            chat_id, user_id, page, page_size, cursor
+        )
         return TitlesBagMenu(
             items=[
                 TitlesBagItemView(
-                    user_id=user_id, titles_bag_id=title_bag_id, title=title
+                    user_id=row.user_id, titles_bag_id=row.id, title=row.user_title
                 )
-                for title_bag_id, user_id, title in titles[start_page:end_page]
+                for row in rows
             ],
             page=page,
-            has_prev_pages=page > 0,
-            has_more_pages=end_page < len(titles),
+            has_prev_pages=has_prev_pages,
+            has_more_pages=has_more_pages,
         )
 
     def handle_exchange_title(
-        self, chat_id: int, user_id: int, page: int, page_size: int
+        self, chat_id: int, user_id: int, page: int, page_size: int, cursor: int | None
     ) -> ExchangeTitleMenu:
-        menu = self.handle_show_titles_bag(chat_id, user_id, page, page_size)
+        menu = self.handle_show_titles_bag(chat_id, user_id, page, page_size, cursor)
         return ExchangeTitleMenu(
             items=menu.items,
             page=menu.page,
@@ -204,30 +195,32 @@ class TitlesService:
         )
 
     def get_gift_titles(
-        self, chat_id: int, user_id: int, target_id: int, page: int, page_size: int
+        self,
+        chat_id: int,
+        user_id: int,
+        target_id: int,
+        page: int,
+        page_size: int,
+        cursor: int | None,
     ) -> GiftTitlesMenu:
-        page = page if page > 0 else 0
-        titles = [
-            TitleInfo(
-                id=row.value[0],
-                user_id=row.value[1],
-                title=row.value[2],
-                is_inventory=True,
-            )
-            for row in sorted(
-                self._titles_repository.get_user_titles_bag(chat_id, user_id).rows,
-                key=lambda row: row.value[2],
-            )
-        ]
-        start_page = page * page_size
-        end_page = start_page + page_size
+        rows, page, has_prev_pages, has_more_pages = self._inventory_page(
+            chat_id, user_id, page, page_size, cursor
+        )
         return GiftTitlesMenu(
             chat_id=chat_id,
             target_user_id=target_id,
-            titles=titles[start_page:end_page],
+            titles=[
+                TitleInfo(
+                    id=row.id,
+                    user_id=row.user_id,
+                    title=row.user_title,
+                    is_inventory=True,
+                )
+                for row in rows
+            ],
             page=page,
-            has_prev_pages=page > 0,
-            has_more_pages=end_page < len(titles),
+            has_prev_pages=has_prev_pages,
+            has_more_pages=has_more_pages,
         )
 
     def give_title(self, chat_id: int, user_id: int, title_bag_id: int) -> TitleChanged:
@@ -253,11 +246,42 @@ class TitlesService:
         )
         return is_day_passed or extra_rolls > 0
 
+    def _inventory_page(
+        self, chat_id: int, user_id: int, page: int, page_size: int, cursor: int | None
+    ) -> tuple[list[TitlesBagEntity], int, bool, bool]:
+        return self._keyset_page(
+            lambda cursor_id, forward, limit: self._titles_repository.get_inventory_page(
+                chat_id, user_id, cursor_id, forward, limit
+            ),
+            page,
+            page_size,
+            cursor,
+        )
+
+    @staticmethod
+    def _keyset_page(
+        fetch: Callable[[int | None, bool, int], list[T]],
+        page: int,
+        page_size: int,
+        cursor: int | None,
+    ) -> tuple[list[T], int, bool, bool]:
+        # cursor is the id of the title next to the requested page: positive
+        # for the page after it, negative for the page before it
+        if cursor and cursor < 0:
+            rows = fetch(-cursor, False, page_size + 1)
+            if len(rows) > page_size:
+                return rows[:page_size][::-1], max(page, 1), True, True
+            cursor = None
+        if not cursor:
+            rows = fetch(None, True, page_size + 1)
+            return rows[:page_size], 0, False, len(rows) > page_size
+        rows = fetch(cursor, True, page_size + 1)
+        return rows[:page_size], max(page, 1), True, len(rows) > page_size
+
     def _get_next_title(self, chat_id: int, user_id: int):
-        key = daily_hash(chat_id + user_id)
-        if not self._rolling_titles.get(key):
-            self._rolling_titles[key] = self._titles_provider.next_title()
-        return self._rolling_titles[key]
+        return self._pending_titles.get(
+            chat_id, user_id, self._titles_provider.next_title
+        )
 
     def _remove_next_title(self, chat_id: int, user_id: int):
-        self._rolling_titles.pop(daily_hash(chat_id + user_id))
+        self._pending_titles.remove(chat_id, user_id)
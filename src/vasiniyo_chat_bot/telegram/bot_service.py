@@ -1,10 +1,14 @@
 import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from functools import lru_cache
 from io import BytesIO
 import logging
 import threading
 from typing import Callable
 from typing import Literal
+from typing import TypeVar
 import uuid
 
 from telebot import REPLY_MARKUP_TYPES
@@ -13,6 +17,7 @@ from telebot.apihelper import ApiTelegramException
 from telebot.types import ChatMember
 from telebot.types import ChatMemberAdministrator
 from telebot.types import ChatMemberMember
+from telebot.types import ChatMemberUpdated
 from telebot.types import File
 from telebot.types import InlineQueryResultArticle
 from telebot.types import InputFile
@@ -22,22 +27,54 @@ from telebot.types import LinkPreviewOptions
 from telebot.types import Message
 from telebot.types import ReplyParameters
 
+from vasiniyo_chat_bot.module.chat_users_repository import ChatUsersRepository
 from vasiniyo_chat_bot.module.dto import BoldTemplate
 from vasiniyo_chat_bot.module.dto import InlineCodeTemplate
 from vasiniyo_chat_bot.module.dto import ItalicTemplate
+from vasiniyo_chat_bot.module.dto import Priority
 from vasiniyo_chat_bot.module.dto import TextTemplate
 from vasiniyo_chat_bot.module.dto import UserContext
 from vasiniyo_chat_bot.module.dto import UserTemplate
 from vasiniyo_chat_bot.safely_bot_utils import safe_wrapper
+from vasiniyo_chat_bot.telegram.chat_member_cache import ChatMemberCache
+from vasiniyo_chat_bot.telegram.send_queue import SendQueue
 from vasiniyo_chat_bot.telegram.service.markdown_v2_service import MarkdownV2Service
+from vasiniyo_chat_bot.telegram.title_sync_cache import TitleSyncCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_MEMBER_MISSING = (
+    "user not found",
+    "member not found",
+    "participant_id_invalid",
+    "invalid user_id",
+)
+
 
 class BotService:
-    def __init__(self, bot: TeleBot, formatter: MarkdownV2Service):
+    def __init__(
+        self,
+        bot: TeleBot,
+        formatter: MarkdownV2Service,
+        send_queue: SendQueue | None = None,
+        member_cache: ChatMemberCache | None = None,
+        member_workers: int = 8,
+        member_deadline: float = 5,
+        chat_users: ChatUsersRepository | None = None,
+        title_sync: TitleSyncCache | None = None,
+    ):
         self._bot = bot
         self._formatter = formatter
+        self._send_queue = send_queue or SendQueue()
+        self._member_cache = member_cache or ChatMemberCache()
+        self._chat_users = chat_users
+        self._title_sync = title_sync or TitleSyncCache()
+        self._member_pool = ThreadPoolExecutor(
+            member_workers, thread_name_prefix="ChatMemberLookup"
+        )
+        self._member_deadline = member_deadline
         self._loop = asyncio.new_event_loop()
         threading.Thread(target=self._start_loop, daemon=True).start()
 
@@ -47,10 +84,41 @@ class BotService:
         return self._bot.get_me()
 
     def get_chat_member(self, chat_id: int, user_id: int) -> ChatMember | None:
+        try:
+            return self._member_cache.get(chat_id, user_id, self._fetch_chat_member)
+        except Exception as e:
+            logger.warning(
+                "get_chat_member_failed",
+                extra={"chat_id": chat_id, "user_id": user_id, "reason": str(e)},
+            )
+            return None
+
+    def invalidate_chat_member(self, chat_id: int, user_id: int) -> None:
+        self._member_cache.invalidate(chat_id, user_id)
+        self._title_sync.forget(chat_id, user_id)
+
+    def forget_changed_members(self, messages: list[Message]) -> None:
+        for message in messages:
+            users = [message.left_chat_member, *(message.new_chat_members or [])]
+            for user in filter(None, users):
+                self.invalidate_chat_member(message.chat.id, user.id)
+
+    def update_bot_member(self, update: ChatMemberUpdated) -> None:
+        logger.info(
+            "bot_member_updated",
+            extra={"chat_id": update.chat.id, "status": update.new_chat_member.status},
+        )
+        self._title_sync.set_bot_member(update.chat.id, update.new_chat_member)
+
+    def _fetch_chat_member(self, chat_id: int, user_id: int) -> ChatMember | None:
         logger.info("get_chat_member", extra={"chat_id": chat_id, "user_id": user_id})
         try:
             return self._bot.get_chat_member(chat_id, user_id)
-        except:
+        except ApiTelegramException as e:
+            if e.error_code != 400 or not any(
+                reason in e.description.lower() for reason in _MEMBER_MISSING
+            ):
+                raise
             logger.info(
                 "member_not_found", extra={"chat_id": chat_id, "user_id": user_id}
             )
@@ -66,7 +134,10 @@ class BotService:
 
     @safe_wrapper(default=None)
     def get_admin_title(self, ctx: UserContext) -> str | None:
-        member = self.get_chat_member(ctx.chat_id, ctx.user_id)
+        return self._title_sync.title(ctx.chat_id, ctx.user_id, self._fetch_admin_title)
+
+    def _fetch_admin_title(self, chat_id: int, user_id: int) -> str | None:
+        member = self._member_cache.get(chat_id, user_id, self._fetch_chat_member)
         return getattr(member, "tag", getattr(member, "custom_title", None))
 
     @safe_wrapper(default=[])
@@ -89,7 +160,10 @@ class BotService:
         if self.get_admin_title(ctx) == title:
             return title
         member = self.get_chat_member(ctx.chat_id, ctx.user_id)
-        bot_user = self.get_chat_member(ctx.chat_id, self.get_me().id)
+        bot_user = self._title_sync.bot_member(
+            ctx.chat_id,
+            lambda chat_id: self._fetch_chat_member(chat_id, self.get_me().id),
+        )
         if not isinstance(bot_user, ChatMemberAdministrator):
             return None
         if isinstance(member, ChatMemberAdministrator) and member.can_be_edited:
@@ -108,6 +182,8 @@ class BotService:
             self._bot.set_chat_member_tag(ctx.chat_id, ctx.user_id, title)
         else:
             return None
+        self.invalidate_chat_member(ctx.chat_id, ctx.user_id)
+        self._title_sync.confirm(ctx.chat_id, ctx.user_id, title)
         return title
 
     @safe_wrapper(default=None)
@@ -141,6 +217,7 @@ class BotService:
         ctx: UserContext,
         reply_markup: REPLY_MARKUP_TYPES | None = None,
         is_disabled_preview: bool = True,
+        priority: Priority = Priority.NORMAL,
     ) -> None:
         text = self._to_text(text_units)
         logger.info(
@@ -151,14 +228,21 @@ class BotService:
                 "message_text": text,
             },
         )
-        self._bot.edit_message_text(
-            text,
+        self._send(
             ctx.chat_id,
-            message_id=ctx.message_id,
-            inline_message_id=ctx.inline_message_id,
-            parse_mode="MarkdownV2",
-            link_preview_options=LinkPreviewOptions(is_disabled=is_disabled_preview),
-            reply_markup=reply_markup,
+            lambda: self._bot.edit_message_text(
+                text,
+                ctx.chat_id,
+                message_id=ctx.message_id,
+                inline_message_id=ctx.inline_message_id,
+                parse_mode="MarkdownV2",
+                link_preview_options=LinkPreviewOptions(
+                    is_disabled=is_disabled_preview
+                ),
+                reply_markup=reply_markup,
+            ),
+            priority,
+            new_message=False,
         )
 
     @safe_wrapper(default=None)
@@ -168,16 +252,22 @@ class BotService:
         message_id: int,
         caption: str,
         reply_markup: REPLY_MARKUP_TYPES | None = None,
+        priority: Priority = Priority.NORMAL,
     ):
         logger.info(
             "edit_message_caption",
             extra={"chat_id": chat_id, "message_id": message_id, "caption": caption},
         )
-        self._bot.edit_message_caption(
-            chat_id=chat_id,
-            message_id=message_id,
-            caption=caption,
-            reply_markup=reply_markup,
+        self._send(
+            chat_id,
+            lambda: self._bot.edit_message_caption(
+                chat_id=chat_id,
+                message_id=message_id,
+                caption=caption,
+                reply_markup=reply_markup,
+            ),
+            priority,
+            new_message=False,
         )
 
     @safe_wrapper(default=None)
@@ -188,15 +278,21 @@ class BotService:
         message_id: int,
         caption: str | None = None,
         reply_markup: REPLY_MARKUP_TYPES | None = None,
+        priority: Priority = Priority.NORMAL,
     ):
         logger.info(
             "edit_message_media", extra={"chat_id": chat_id, "message_id": message_id}
         )
-        self._bot.edit_message_media(
-            media=InputMediaPhoto(InputFile(photo), caption, "HTML"),
-            chat_id=chat_id,
-            message_id=message_id,
-            reply_markup=reply_markup,
+        self._send(
+            chat_id,
+            lambda: self._bot.edit_message_media(
+                media=InputMediaPhoto(InputFile(photo), caption, "HTML"),
+                chat_id=chat_id,
+                message_id=message_id,
+                reply_markup=reply_markup,
+            ),
+            priority,
+            new_message=False,
         )
 
     @safe_wrapper(default=None)
@@ -205,8 +301,12 @@ class BotService:
             "clear_message_markup",
             extra={"chat_id": ctx.chat_id, "message_id": ctx.message_id},
         )
-        self._bot.edit_message_reply_markup(
-            ctx.chat_id, ctx.message_id, reply_markup=None
+        self._send(
+            ctx.chat_id,
+            lambda: self._bot.edit_message_reply_markup(
+                ctx.chat_id, ctx.message_id, reply_markup=None
+            ),
+            new_message=False,
         )
 
     def send_dice(self, emoji: Literal["🎲", "🎯", "🏀", "⚽", "🎰"], ctx: UserContext):
@@ -218,13 +318,17 @@ class BotService:
                 "emoji": emoji,
             },
         )
-        return self._bot.send_dice(
+        return self._send(
             ctx.chat_id,
-            reply_to_message_id=ctx.message_id,
-            emoji=emoji,
-            reply_parameters=ReplyParameters(
-                message_id=ctx.message_id, allow_sending_without_reply=True
+            lambda: self._bot.send_dice(
+                ctx.chat_id,
+                reply_to_message_id=ctx.message_id,
+                emoji=emoji,
+                reply_parameters=ReplyParameters(
+                    message_id=ctx.message_id, allow_sending_without_reply=True
+                ),
             ),
+            wait=True,
         )
 
     @safe_wrapper(default=None)
@@ -260,7 +364,9 @@ class BotService:
         ctx: UserContext,
         reply_markup: REPLY_MARKUP_TYPES | None = None,
         is_disabled_preview: bool = True,
-    ) -> Message | None:
+        priority: Priority = Priority.NORMAL,
+        wait: bool = True,
+    ) -> Message | Future[Message] | None:
         reply_parameters = (
             ReplyParameters(message_id=ctx.message_id, allow_sending_without_reply=True)
             if ctx.message_id
@@ -275,18 +381,27 @@ class BotService:
                 "message_text": text,
             },
         )
-        return self._bot.send_message(
+        return self._send(
             ctx.chat_id,
-            text,
-            parse_mode="MarkdownV2",
-            disable_notification=True,
-            link_preview_options=LinkPreviewOptions(is_disabled=is_disabled_preview),
-            reply_parameters=reply_parameters,
-            reply_markup=reply_markup,
+            lambda: self._bot.send_message(
+                ctx.chat_id,
+                text,
+                parse_mode="MarkdownV2",
+                disable_notification=True,
+                link_preview_options=LinkPreviewOptions(
+                    is_disabled=is_disabled_preview
+                ),
+                reply_parameters=reply_parameters,
+                reply_markup=reply_markup,
+            ),
+            priority,
+            wait,
         )
 
     @safe_wrapper(default=None)
-    def send_sticker(self, file_id: str, ctx: UserContext) -> None:
+    def send_sticker(
+        self, file_id: str, ctx: UserContext, priority: Priority = Priority.NORMAL
+    ) -> None:
         logger.info(
             "send_sticker",
             extra={
@@ -295,12 +410,16 @@ class BotService:
                 "file_id": file_id,
             },
         )
-        self._bot.send_sticker(
+        self._send(
             ctx.chat_id,
-            file_id,
-            reply_parameters=ReplyParameters(
-                message_id=ctx.message_id, allow_sending_without_reply=True
+            lambda: self._bot.send_sticker(
+                ctx.chat_id,
+                file_id,
+                reply_parameters=ReplyParameters(
+                    message_id=ctx.message_id, allow_sending_without_reply=True
+                ),
             ),
+            priority,
         )
 
     @safe_wrapper(default=None)
@@ -312,7 +431,9 @@ class BotService:
             str | list[str | UserTemplate | BoldTemplate | ItalicTemplate] | None
         ) = None,
         reply_markup: REPLY_MARKUP_TYPES | None = None,
-    ) -> Message:
+        priority: Priority = Priority.NORMAL,
+        wait: bool = True,
+    ) -> Message | Future[Message]:
         logger.info(
             "send_photo", extra={"chat_id": ctx.chat_id, "message_id": ctx.message_id}
         )
@@ -321,14 +442,20 @@ class BotService:
             if ctx.message_id
             else None
         )
-        return self._bot.send_photo(
+        caption = self._to_text(caption) if caption else None
+        return self._send(
             ctx.chat_id,
-            photo=InputFile(photo),
-            caption=self._to_text(caption) if caption else None,
-            parse_mode="MarkdownV2",
-            disable_notification=True,
-            reply_markup=reply_markup,
-            reply_parameters=reply_parameters,
+            lambda: self._bot.send_photo(
+                ctx.chat_id,
+                photo=InputFile(photo),
+                caption=caption,
+                parse_mode="MarkdownV2",
+                disable_notification=True,
+                reply_markup=reply_markup,
+                reply_parameters=reply_parameters,
+            ),
+            priority,
+            wait,
         )
 
     @safe_wrapper(default=None)
@@ -337,7 +464,11 @@ class BotService:
             f"delete_message",
             extra={"chat_id": ctx.chat_id, "message_id": ctx.message_id},
         )
-        self._bot.delete_message(ctx.chat_id, ctx.message_id)
+        self._send(
+            ctx.chat_id,
+            lambda: self._bot.delete_message(ctx.chat_id, ctx.message_id),
+            new_message=False,
+        )
 
     @safe_wrapper(default=None)
     def ban_chat_member(self, ctx: UserContext) -> None:
@@ -346,6 +477,7 @@ class BotService:
         )
         try:
             self._bot.ban_chat_member(ctx.chat_id, ctx.user_id)
+            self.invalidate_chat_member(ctx.chat_id, ctx.user_id)
         except ApiTelegramException as e:
             logger.info(
                 "ban_chat_member_failed",
@@ -356,6 +488,27 @@ class BotService:
                 },
             )
 
+    def _send(
+        self,
+        chat_id: int | None,
+        call: Callable[[], T],
+        priority: Priority = Priority.NORMAL,
+        wait: bool = False,
+        new_message: bool = True,
+    ) -> T | Future[T]:
+        # only callers that use the result block, so a rate-limited chat does
+        # not hold the update shard its handler runs on
+        future = self._send_queue.submit(chat_id, call, priority, new_message)
+        if wait:
+            return future.result()
+        future.add_done_callback(self._log_send_failure)
+        return future
+
+    @staticmethod
+    def _log_send_failure(future: Future) -> None:
+        if error := future.exception():
+            logger.error("send_failed", extra={"reason": str(error)})
+
     def _start_loop(self):
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
@@ -363,14 +516,14 @@ class BotService:
     def _to_text(self, text_units: str | list[str | TextTemplate]) -> str:
         if isinstance(text_units, str):
             return self._formatter.escape(text_units)
+        members = self._resolve_members(
+            {unit for unit in text_units if isinstance(unit, UserTemplate)}
+        )
         text = ""
         for unit in text_units:
             if isinstance(unit, UserTemplate):
-                member = self.get_chat_member(unit.chat_id, unit.user_id)
-                if member:
-                    text += self._formatter.to_link(
-                        member.user.full_name, member.user.username
-                    )
+                if names := members.get(unit):
+                    text += self._formatter.to_link(*names)
                 else:
                     text += self._formatter.to_italic("Неизвестный")
             elif isinstance(unit, BoldTemplate):
@@ -382,3 +535,44 @@ class BotService:
             elif isinstance(unit, str):
                 text += self._formatter.escape(unit)
         return text
+
+    def _resolve_members(
+        self, templates: set[UserTemplate]
+    ) -> dict[UserTemplate, tuple[str, str | None]]:
+        names = {}
+        for template in templates:
+            known = self._chat_users and self._chat_users.find(
+                template.chat_id, template.user_id
+            )
+            if known and known.full_name:
+                names[template] = (known.full_name, known.username)
+        missing = templates - names.keys()
+        if len(missing) <= 1:
+            members = {t: self.get_chat_member(t.chat_id, t.user_id) for t in missing}
+        else:
+            members = self._fetch_members(missing)
+        for template, member in members.items():
+            if member:
+                names[template] = (member.user.full_name, member.user.username)
+        return names
+
+    def _fetch_members(
+        self, templates: set[UserTemplate]
+    ) -> dict[UserTemplate, ChatMember | None]:
+        futures = {
+            template: self._member_pool.submit(
+                self.get_chat_member, template.chat_id, template.user_id
+            )
+            for template in templates
+        }
+        _, pending = wait(futures.values(), timeout=self._member_deadline)
+        if pending:
+            logger.warning(
+                "resolve_members_timeout",
+                extra={"total": len(futures), "pending": len(pending)},
+            )
+        return {
+            template: future.result()
+            for template, future in futures.items()
+            if future not in pending and future.exception() is None
+        }
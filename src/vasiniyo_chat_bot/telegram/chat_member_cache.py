@@ -0,0 +1,88 @@
+from collections import OrderedDict
+import logging
+import threading
+import time
+from typing import Callable
+
+from telebot.types import ChatMember
+
+logger = logging.getLogger(__name__)
+
+
+class ChatMemberCache:
+    """LRU of ``get_chat_member`` results with a ``ttl`` in seconds.
+
+    A load that raises stores nothing. A load that overlaps an
+    ``invalidate`` of its key is returned but not stored, so the cache never
+    keeps a member older than the last invalidation.
+    """
+
+    def __init__(
+        self, ttl: float = 300, max_size: int = 10_000, report_every: int = 1000
+    ) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._report_every = report_every
+        self._entries: OrderedDict[tuple[int, int], tuple[float, ChatMember | None]]
+        self._entries = OrderedDict()
+        self._loads: dict[tuple[int, int], object] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, chat_id: int, user_id: int, load: Callable[[int, int], ChatMember | None]
+    ) -> ChatMember | None:
+        key = (chat_id, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._count(hit=True)
+                return entry[1]
+            self._count(hit=False)
+            self._loads[key] = token = object()
+        try:
+            member = load(chat_id, user_id)
+        except:
+            with self._lock:
+                if self._loads.get(key) is token:
+                    del self._loads[key]
+            raise
+        with self._lock:
+            if self._loads.get(key) is token:
+                del self._loads[key]
+                self._entries[key] = (now + self._ttl, member)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        return member
+
+    def invalidate(self, chat_id: int, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop((chat_id, user_id), None)
+            self._loads.pop((chat_id, user_id), None)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if (self.hits + self.misses) % self._report_every == 0:
+            logger.info(
+                "chat_member_cache_stats",
+                extra={
+                    "hits": self.hits,
+                    "misses": self.misses,
+                    "size": len(self._entries),
+                },
+            )
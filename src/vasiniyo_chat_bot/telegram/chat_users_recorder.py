@@ -0,0 +1,79 @@
+import logging
+import threading
+import time
+
+from telebot.types import CallbackQuery
+from telebot.types import ChatMemberUpdated
+from telebot.types import Message
+from telebot.types import User
+
+from vasiniyo_chat_bot.module.chat_users_repository import ChatUsersRepository
+
+logger = logging.getLogger(__name__)
+
+_MEMBER_STATUSES = {"creator", "administrator", "member", "restricted"}
+
+
+class ChatUsersRecorder:
+    """Feeds the chat users directory from updates the bot receives anyway.
+
+    A user is written again only when the name or membership changes, or
+    when the stored ``last_seen`` is older than ``refresh_after`` seconds.
+    ``chat_member`` updates keep the membership right when no service
+    message arrives, for example when it is hidden or deleted.
+    """
+
+    def __init__(
+        self,
+        repository: ChatUsersRepository,
+        refresh_after: float = 300,
+        max_tracked: int = 100_000,
+    ) -> None:
+        self._repository = repository
+        self._refresh_after = refresh_after
+        self._max_tracked = max_tracked
+        self._written: dict[tuple[int, int], tuple[tuple, float]] = {}
+        self._lock = threading.Lock()
+
+    def record_messages(self, messages: list[Message]) -> None:
+        for message in messages:
+            chat_id = message.chat.id
+            left = message.left_chat_member
+            if left:
+                self._record(chat_id, left, is_member=False)
+            for user in message.new_chat_members or []:
+                self._record(chat_id, user, is_member=True)
+            if message.from_user and (not left or left.id != message.from_user.id):
+                self._record(chat_id, message.from_user, is_member=True)
+
+    def record_callback(self, call: CallbackQuery) -> None:
+        if call.message and hasattr(call.message, "chat"):
+            self._record(call.message.chat.id, call.from_user, is_member=True)
+
+    def record_member_update(self, update: ChatMemberUpdated) -> None:
+        member = update.new_chat_member
+        is_member = member.status in _MEMBER_STATUSES and (
+            member.status != "restricted" or bool(member.is_member)
+        )
+        self._record(update.chat.id, member.user, is_member)
+
+    def _record(self, chat_id: int, user: User, is_member: bool) -> None:
+        if user.is_bot:
+            return
+        key = (chat_id, user.id)
+        state = (user.username, user.full_name, is_member)
+        now = time.monotonic()
+        with self._lock:
+            written = self._written.get(key)
+            if (
+                written
+                and written[0] == state
+                and now - written[1] < self._refresh_after
+            ):
+                return
+            if len(self._written) >= self._max_tracked:
+                self._written.clear()
+            self._written[key] = (state, now)
+        self._repository.save(
+            chat_id, user.id, user.username, user.full_name, is_member
+        )
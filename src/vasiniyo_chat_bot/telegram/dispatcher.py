@@ -1,8 +1,13 @@
 import logging
+from typing import Callable
+
+from telebot.types import ChatMemberUpdated
+from telebot.types import Message
 
 from vasiniyo_chat_bot.config.dto import Config
 from vasiniyo_chat_bot.telegram.feature_factory import FeatureFactory
-from vasiniyo_chat_bot.telegram.handler.command_handler import CommandHandler
+from vasiniyo_chat_bot.telegram.handler.callback_dispatcher import CallbackDispatcher
+from vasiniyo_chat_bot.telegram.handler.command_router import CommandRouter
 from vasiniyo_chat_bot.telegram.handler.inline_query_handler import InlineQueryHandler
 
 logger = logging.getLogger(__name__)
@@ -31,6 +36,12 @@ class BotFeatureRegistry:
             if feature
         ]
         self._renderer = factory.renderer
+        self._bot_username = factory.bot_username
+        self._chat_users_recorder = factory.chat_users_recorder
+        self._update_listeners = factory.update_listeners()
+        self._my_chat_member_handler = factory.my_chat_member_handler()
+        self._chat_member_handler = factory.chat_member_handler()
+        self._allowed_chats = config.bot_settings.allowed_chats
 
     def my_commands(self) -> dict[str, str]:
         commands = {
@@ -43,16 +54,50 @@ class BotFeatureRegistry:
         }
 
     def message_handlers(self):
-        return sorted(
-            [handler for feature in self._features for handler in feature.messages()],
-            key=lambda m: not isinstance(m, CommandHandler),
+        router = CommandRouter(
+            self._bot_username,
+            self._allowed_chats,
+            [
+                command
+                for feature in self._features
+                for command in feature.commands().values()
+            ],
+            next(
+                (
+                    feature.unknown_command()
+                    for feature in self._features
+                    if feature.unknown_command()
+                ),
+                None,
+            ),
         )
+        return [
+            router,
+            *[handler for feature in self._features for handler in feature.messages()],
+        ]
 
     def callback_query_handlers(self):
         return [
-            handler for feature in self._features for handler in feature.callbacks()
+            CallbackDispatcher(
+                self._allowed_chats,
+                [
+                    handler
+                    for feature in self._features
+                    for handler in feature.callbacks()
+                ],
+                self._chat_users_recorder and self._chat_users_recorder.record_callback,
+            )
         ]
 
+    def update_listeners(self) -> list[Callable[[list[Message]], None]]:
+        return self._update_listeners
+
+    def my_chat_member_handler(self) -> Callable[[ChatMemberUpdated], None]:
+        return self._my_chat_member_handler
+
+    def chat_member_handler(self) -> Callable[[ChatMemberUpdated], None]:
+        return self._chat_member_handler
+
     def inline_handler(self):
         return InlineQueryHandler(
             lambda ctx: self._renderer.answer_inline_query(
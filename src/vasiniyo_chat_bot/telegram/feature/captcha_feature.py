@@ -1,9 +1,6 @@
 from typing import Callable
 
 from vasiniyo_chat_bot.module.captcha.captcha_controller import CaptchaController
-from vasiniyo_chat_bot.module.captcha.captcha_payload_factory import (
-    CaptchaPayloadFactory,
-)
 from vasiniyo_chat_bot.module.dto import UserContext
 from vasiniyo_chat_bot.module.user_service import UserService
 from vasiniyo_chat_bot.telegram.feature.feature import Feature
@@ -14,8 +11,6 @@ from vasiniyo_chat_bot.telegram.handler.left_chat_member_handler import (
 )
 from vasiniyo_chat_bot.telegram.handler.message_handler import MessageHandler
 from vasiniyo_chat_bot.telegram.handler.new_member_handler import NewMemberHandler
-from vasiniyo_chat_bot.telegram.handler.query_handler import QueryHandler
-from vasiniyo_chat_bot.telegram.mapper.mapper import call_to_titles_context
 from vasiniyo_chat_bot.telegram.mapper.mapper import message_to_context
 
 
@@ -30,7 +25,9 @@ class CaptchaFeature(Feature):
         self._controller = controller
         self._user_service = user_service
         message_handlers = self._message_handlers(allowed_chats, controller)
-        callback_handlers = self._callback_handlers(allowed_chats)
+        callback_handlers = [
+            CaptchaQueryHandler(controller.handle_captcha_button_press)
+        ]
         super().__init__(
             bot_username,
             allowed_chats,
@@ -67,21 +64,6 @@ class CaptchaFeature(Feature):
             ),
         ]
 
-    def _callback_handlers(self, allowed_chats: list[str]) -> list[QueryHandler]:
-        is_captcha_user = Filter(
-            lambda call: self._controller.is_captcha_user(call_to_titles_context(call))
-        )
-        has_captcha_payload = Filter(
-            lambda call: CaptchaPayloadFactory.has_captcha_payload(call.data)
-        )
-        return [
-            CaptchaQueryHandler(
-                allowed_chats,
-                self._controller.handle_captcha_button_press,
-                is_captcha_user and has_captcha_payload,
-            )
-        ]
-
     def _invalidate_user_cache(
         self, func: Callable[[UserContext], None] = lambda _: None
     ):
@@ -6,7 +6,6 @@ from vasiniyo_chat_bot.module.dto import MessageContext
 from vasiniyo_chat_bot.module.dto import Response
 from vasiniyo_chat_bot.module.help.command_key import CommandKey
 from vasiniyo_chat_bot.telegram.feature.command import Command
-from vasiniyo_chat_bot.telegram.handler.command_handler import CommandHandler
 from vasiniyo_chat_bot.telegram.handler.message_handler import MessageHandler
 from vasiniyo_chat_bot.telegram.handler.query_handler import QueryHandler
 
@@ -25,6 +24,7 @@ class Feature:
         all_commands: dict[
             CommandKey, tuple[CommandInfo, Callable[[MessageContext], None]]
         ] = None,
+        unknown_command: Callable[[MessageContext], None] = None,
     ):
         self._bot_username = bot_username
         self._allowed_chats = allowed_chats
@@ -32,6 +32,7 @@ class Feature:
         self._callback_handlers = callback_handlers or []
         self._inline_handlers = inline_handler or []
         self._all_commands = all_commands or {}
+        self._unknown_command = unknown_command
 
     def commands(self) -> dict[CommandKey, Command]:
         return {
@@ -41,7 +42,10 @@ class Feature:
         }
 
     def messages(self) -> list[MessageHandler]:
-        return [*self._known_commands(), *self._message_handlers]
+        return self._message_handlers
+
+    def unknown_command(self) -> Callable[[MessageContext], None] | None:
+        return self._unknown_command
 
     def callbacks(self) -> list[QueryHandler]:
         return self._callback_handlers
@@ -50,9 +54,3 @@ class Feature:
         self,
     ) -> list[Callable[[InlineCallbackContext], tuple[str, Callable[[], Response]]]]:
         return self._inline_handlers
-
-    def _known_commands(self) -> list[MessageHandler]:
-        return [
-            CommandHandler(self._bot_username, self._allowed_chats, command)
-            for command in self.commands().values()
-        ]
@@ -1,10 +1,7 @@
 from vasiniyo_chat_bot.config.bot_settings_reader import CommandInfo
 from vasiniyo_chat_bot.module.help.command_key import CommandKey
 from vasiniyo_chat_bot.module.titles.titles_controller import TitlesController
-from vasiniyo_chat_bot.module.titles.titles_payload_factory import TitlesPayloadFactory
 from vasiniyo_chat_bot.telegram.feature.feature import Feature
-from vasiniyo_chat_bot.telegram.filter import Filter
-from vasiniyo_chat_bot.telegram.handler.query_handler import QueryHandler
 from vasiniyo_chat_bot.telegram.handler.titles_query_handler import TitlesQueryHandler
 
 
@@ -21,7 +18,9 @@ class TitlesFeature(Feature):
             bot_username,
             allowed_chats,
             all_commands=self._all_commands(commands),
-            callback_handlers=self._callback_handlers(allowed_chats),
+            callback_handlers=[
+                TitlesQueryHandler(self._controller.dispatch_titles_callback)
+            ],
         )
 
     def _all_commands(self, commands: dict[CommandKey, CommandInfo]):
@@ -31,12 +30,3 @@ class TitlesFeature(Feature):
                 self._controller.handle_rename,
             )
         }
-
-    def _callback_handlers(self, allowed_chats: list[str]) -> list[QueryHandler]:
-        return [
-            TitlesQueryHandler(
-                allowed_chats,
-                self._controller.dispatch_titles_callback,
-                Filter(lambda call: TitlesPayloadFactory.has_titles_payload(call.data)),
-            )
-        ]
@@ -1,16 +1,33 @@
+from typing import Callable
+
+from telebot.types import ChatMemberUpdated
+from telebot.types import Message
+
 from vasiniyo_chat_bot.anilist.anilist_anime_provider import AnilistAnimeProvider
 from vasiniyo_chat_bot.config.dto import Config
+from vasiniyo_chat_bot.database.sqlite.dao import CaptchaUsersDao
+from vasiniyo_chat_bot.database.sqlite.dao import ChatUsersDao
 from vasiniyo_chat_bot.database.sqlite.dao import EventsDao
 from vasiniyo_chat_bot.database.sqlite.dao import LikesDao
+from vasiniyo_chat_bot.database.sqlite.dao import PendingTitlesDao
 from vasiniyo_chat_bot.database.sqlite.dao import TitlesBagDAO
 from vasiniyo_chat_bot.database.sqlite.dao import TitlesStatesDAO
 from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_captcha_repository import (
+    SqliteCaptchaRepository,
+)
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_chat_users_repository import (
+    SqliteChatUsersRepository,
+)
 from vasiniyo_chat_bot.database.sqlite.repository.sqlite_events_repository import (
     SqliteEventsRepository,
 )
 from vasiniyo_chat_bot.database.sqlite.repository.sqlite_likes_repository import (
     SqliteLikesRepository,
 )
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_pending_titles_repository import (
+    SqlitePendingTitlesRepository,
+)
 from vasiniyo_chat_bot.database.sqlite.repository.sqlite_titles_repository import (
     SqliteTitlesRepository,
 )
@@ -50,6 +67,10 @@ from vasiniyo_chat_bot.module.renderer import Renderer
 from vasiniyo_chat_bot.module.reply.reply_controller import ReplyController
 from vasiniyo_chat_bot.module.reply.reply_response_factory import ReplyResponseFactory
 from vasiniyo_chat_bot.module.reply.reply_service import ReplyService
+from vasiniyo_chat_bot.module.titles.cached_titles_repository import (
+    CachedTitlesRepository,
+)
+from vasiniyo_chat_bot.module.titles.pending_titles_store import PendingTitlesStore
 from vasiniyo_chat_bot.module.titles.titles_controller import TitlesController
 from vasiniyo_chat_bot.module.titles.titles_payload_factory import TitlesPayloadFactory
 from vasiniyo_chat_bot.module.titles.titles_provider import TitlesProvider
@@ -59,6 +80,7 @@ from vasiniyo_chat_bot.module.titles.titles_response_factory import (
 from vasiniyo_chat_bot.module.titles.titles_service import TitlesService
 from vasiniyo_chat_bot.shikimori.shikimori_anime_provider import ShikimoriAnimeProvider
 from vasiniyo_chat_bot.telegram.bot_service import BotService
+from vasiniyo_chat_bot.telegram.chat_users_recorder import ChatUsersRecorder
 from vasiniyo_chat_bot.telegram.feature.anime_feature import AnimeFeature
 from vasiniyo_chat_bot.telegram.feature.captcha_feature import CaptchaFeature
 from vasiniyo_chat_bot.telegram.feature.daily_size_feature import DailySizeFeature
@@ -89,12 +111,22 @@ from vasiniyo_chat_bot.telegram.telegram_renderer import TelegramRenderer
 
 class FeatureFactory:
     renderer: Renderer
+    chat_users_recorder: ChatUsersRecorder | None
+    bot_username: str
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._bot_service = BotService(config.bot_settings.bot, MarkdownV2Service())
-        self._bot_username = self._bot_service.get_me().username
-        self._user_service = TelegramUserService(self._bot_service)
+        chat_users = (
+            SqliteChatUsersRepository(ChatUsersDao(), config.database)
+            if isinstance(config.database, SqliteDatabaseSettings)
+            else None
+        )
+        self.chat_users_recorder = chat_users and ChatUsersRecorder(chat_users)
+        self._bot_service = BotService(
+            config.bot_settings.bot, MarkdownV2Service(), chat_users=chat_users
+        )
+        self.bot_username = self._bot_service.get_me().username
+        self._user_service = TelegramUserService(self._bot_service, chat_users)
         self.renderer = TelegramRenderer(
             self._bot_service,
             TitlesKeyboardFactory(TitlesPayloadFactory()),
@@ -102,9 +134,28 @@ class FeatureFactory:
             CaptchaKeyboardFactory(CaptchaPayloadFactory()),
         )
 
+    def update_listeners(self) -> list[Callable[[list[Message]], None]]:
+        listeners = [self._bot_service.forget_changed_members]
+        if self.chat_users_recorder:
+            listeners.append(self.chat_users_recorder.record_messages)
+        return listeners
+
+    def my_chat_member_handler(self) -> Callable[[ChatMemberUpdated], None]:
+        return self._bot_service.update_bot_member
+
+    def chat_member_handler(self) -> Callable[[ChatMemberUpdated], None]:
+        def on_chat_member(update: ChatMemberUpdated) -> None:
+            if self.chat_users_recorder:
+                self.chat_users_recorder.record_member_update(update)
+            self._user_service.invalidate_cache(
+                update.chat.id, update.new_chat_member.user.id
+            )
+
+        return on_chat_member
+
     def daily_size_feature(self) -> Feature:
         return DailySizeFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             DailySizeController(
                 DailySizeService(self._config.daily_size_settings),
@@ -116,11 +167,13 @@ class FeatureFactory:
 
     def captcha_feature(self) -> Feature:
         return CaptchaFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             CaptchaController(
                 self._user_service,
-                CaptchaService(self._config.captcha_properties, CaptchaRepository()),
+                CaptchaService(
+                    self._config.captcha_properties, self._captcha_repository()
+                ),
                 CaptchaResponseFactory(self._config.captcha_properties),
                 self.renderer,
             ),
@@ -129,7 +182,7 @@ class FeatureFactory:
 
     def reply_feature(self) -> Feature:
         return ReplyFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             ReplyController(
                 ReplyService(self._config.long_message, self._config.trigger_replies),
@@ -140,7 +193,7 @@ class FeatureFactory:
 
     def like_feature(self) -> Feature:
         return LikeFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             LikeController(
                 LikeService(
@@ -154,7 +207,7 @@ class FeatureFactory:
 
     def drink_feature(self) -> Feature:
         return DrinkFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             DrinkController(
                 DrinkService(self._config.drinks), DrinkResponseFactory(), self.renderer
@@ -164,7 +217,7 @@ class FeatureFactory:
 
     def anime_feature(self) -> Feature:
         return AnimeFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             AnimeController(
                 AnimeService([AnilistAnimeProvider(), ShikimoriAnimeProvider()]),
@@ -176,13 +229,20 @@ class FeatureFactory:
 
     def titles_feature(self) -> Feature:
         return TitlesFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             TitlesController(
                 TitlesService(
                     TitlesProvider(self._config.custom_titles),
-                    SqliteTitlesRepository(
-                        TitlesStatesDAO(), TitlesBagDAO(), self._database_settings()
+                    CachedTitlesRepository(
+                        SqliteTitlesRepository(
+                            TitlesStatesDAO(), TitlesBagDAO(), self._database_settings()
+                        )
+                    ),
+                    PendingTitlesStore(
+                        SqlitePendingTitlesRepository(
+                            PendingTitlesDao(), self._database_settings()
+                        )
                     ),
                 ),
                 TelegramDiceService(self._bot_service),
@@ -195,7 +255,7 @@ class FeatureFactory:
 
     def play_feature(self) -> Feature:
         return PlayFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             PlayController(
                 PlayService(
@@ -217,12 +277,18 @@ class FeatureFactory:
 
     def help_feature(self) -> Feature:
         return HelpFeature(
-            self._bot_username,
+            self.bot_username,
             self._config.bot_settings.allowed_chats,
             HelpController(HelpResponseFactory(), self.renderer),
             self._config.bot_settings.commands,
         )
 
+    def _captcha_repository(self) -> CaptchaRepository:
+        settings = self._config.database
+        if isinstance(settings, SqliteDatabaseSettings) and settings.durable_tasks:
+            return SqliteCaptchaRepository(CaptchaUsersDao(), settings)
+        return CaptchaRepository()
+
     def _database_settings(self) -> SqliteDatabaseSettings:
         settings = self._config.database
         if not isinstance(settings, SqliteDatabaseSettings):
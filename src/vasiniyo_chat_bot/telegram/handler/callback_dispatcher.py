@@ -0,0 +1,49 @@
+import logging
+from typing import Callable
+
+from telebot.types import CallbackQuery
+
+from vasiniyo_chat_bot.module.dto import Action
+from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import decode_payload
+from vasiniyo_chat_bot.telegram.filter import Filter
+from vasiniyo_chat_bot.telegram.handler.query_handler import QueryHandler
+
+logger = logging.getLogger(__name__)
+
+
+class CallbackDispatcher:
+    handler: Callable[[CallbackQuery], None]
+    kwargs: dict
+
+    def __init__(
+        self,
+        allowed_chats: list[str],
+        query_handlers: list[QueryHandler],
+        on_callback: Callable[[CallbackQuery], None] | None = None,
+    ) -> None:
+        in_allowed_chat = Filter(
+            lambda call: "*" in allowed_chats
+            or not hasattr(call.message, "chat")
+            or str(call.message.chat.id) in allowed_chats
+        )
+        self._routes = {
+            action: query_handler.handler
+            for query_handler in query_handlers
+            for action in query_handler.actions
+        }
+        self._on_callback = on_callback
+        self.handler = self._dispatch
+        self.kwargs = {"func": in_allowed_chat}
+
+    def _dispatch(self, call: CallbackQuery):
+        if self._on_callback:
+            self._on_callback(call)
+        payload = decode_payload(call.data)
+        if not isinstance(payload, dict):
+            payload = {}
+        action = Action._value2member_map_.get(payload.get(Field.ACTION_TYPE.value))
+        if not (route := self._routes.get(action)):
+            logger.info("unknown_callback", extra={"tg_call": call})
+            return
+        route(call, payload)
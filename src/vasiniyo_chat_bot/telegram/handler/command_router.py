@@ -0,0 +1,85 @@
+from collections import OrderedDict
+import logging
+import threading
+from typing import Callable
+
+from telebot.types import Message
+
+from vasiniyo_chat_bot.module.dto import MessageContext
+from vasiniyo_chat_bot.telegram.feature.command import Command
+from vasiniyo_chat_bot.telegram.filter import Filter
+from vasiniyo_chat_bot.telegram.handler.message_handler import MessageHandler
+
+logger = logging.getLogger(__name__)
+
+
+def parse_command(text: str | None) -> tuple[str, str] | None:
+    if not text:
+        return None
+    tokens = text.split(maxsplit=1)
+    if not tokens:
+        return None
+    name, _, username = tokens[0].partition("@")
+    return name, username
+
+
+Route = tuple[str, Callable[[MessageContext], None]]
+
+
+class CommandRouter(MessageHandler):
+    """Routes commands addressed to the bot through one dict lookup.
+
+    The filter parses the leading token of a message once and keeps the
+    route for the handler, keyed by ``(chat_id, message_id)``. Routes of
+    messages the handler skips are evicted after ``max_pending`` newer ones.
+    """
+
+    def __init__(
+        self,
+        bot_username: str,
+        allowed_chats: list[str],
+        commands: list[Command],
+        unknown_command: Callable[[MessageContext], None] | None = None,
+        max_pending: int = 1000,
+    ) -> None:
+        self._bot_username = bot_username
+        self._commands = {command.info.name: command for command in commands}
+        self._prefixes = {name[:1] for name in self._commands} | {"/"}
+        self._unknown_command = unknown_command
+        self._max_pending = max_pending
+        self._pending: OrderedDict[tuple[int, int], Route] = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__(allowed_chats, self._dispatch, Filter(self._is_routed))
+
+    def _route(self, text: str | None) -> Route | None:
+        if not text or text.lstrip()[:1] not in self._prefixes:
+            return None
+        name, username = parse_command(text)
+        if username and username != self._bot_username:
+            return None
+        if command := self._commands.get(name):
+            return name, command.handler
+        if username and self._unknown_command:
+            return name, self._unknown_command
+        return None
+
+    def _is_routed(self, message: Message) -> bool:
+        if not (route := self._route(message.text)):
+            return False
+        with self._lock:
+            self._pending[(message.chat.id, message.id)] = route
+            while len(self._pending) > self._max_pending:
+                self._pending.popitem(last=False)
+        return True
+
+    def _dispatch(self, ctx: MessageContext):
+        with self._lock:
+            route = self._pending.pop((ctx.chat_id, ctx.message_id), None)
+        if not (route := route or self._route(ctx.text)):
+            return
+        name, handler = route
+        logger.info(
+            "handle_command",
+            extra={"command": name, "chat_id": ctx.chat_id, "user_id": ctx.user_id},
+        )
+        handler(ctx)
@@ -1,24 +1,17 @@
 from typing import Callable
+from typing import Iterable
 
 from telebot.types import CallbackQuery
 
-from vasiniyo_chat_bot.telegram.filter import Filter
+from vasiniyo_chat_bot.module.dto import Action
 
 
 class QueryHandler:
-    handler: Callable[[CallbackQuery], None]
-    kwargs: dict
+    handler: Callable[[CallbackQuery, dict], None]
+    actions: frozenset[Action]
 
     def __init__(
-        self,
-        allowed_chats: list[str],
-        handler: Callable[[CallbackQuery], None],
-        validator: Filter[CallbackQuery],
+        self, actions: Iterable[Action], handler: Callable[[CallbackQuery, dict], None]
     ) -> None:
-        in_allowed_chat = Filter(
-            lambda call: "*" in allowed_chats
-            or not hasattr(call.message, "chat")
-            or str(call.message.chat.id) in allowed_chats
-        )
         self.handler = handler
-        self.kwargs = {"func": in_allowed_chat & validator}
+        self.actions = frozenset(actions)
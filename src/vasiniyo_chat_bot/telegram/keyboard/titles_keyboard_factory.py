@@ -228,7 +228,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "⬅️",
                     callback_data=self._payload_factory.gift_titles_menu(
-                        menu.page - 1, menu.target_user_id, user_id
+                        menu.page - 1, menu.target_user_id, user_id, -menu.titles[0].id
                     ),
                 )
             )
@@ -237,7 +237,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "➡️",
                     callback_data=self._payload_factory.gift_titles_menu(
-                        menu.page + 1, menu.target_user_id, user_id
+                        menu.page + 1, menu.target_user_id, user_id, menu.titles[-1].id
                     ),
                 )
             )
@@ -252,7 +252,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "⬅️",
                     callback_data=self._payload_factory.steal_menu(
-                        steal_menu.page - 1, user_id
+                        steal_menu.page - 1, user_id, -steal_menu.titles[0].id
                     ),
                 )
             )
@@ -261,7 +261,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "➡️",
                     callback_data=self._payload_factory.steal_menu(
-                        steal_menu.page + 1, user_id
+                        steal_menu.page + 1, user_id, steal_menu.titles[-1].id
                     ),
                 )
             )
@@ -276,7 +276,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "⬅️",
                     callback_data=self._payload_factory.titles_bag_menu(
-                        titles_bag.page - 1, user_id
+                        titles_bag.page - 1, user_id, -titles_bag.items[0].titles_bag_id
                     ),
                 )
             )
@@ -285,7 +285,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "➡️",
                     callback_data=self._payload_factory.titles_bag_menu(
-                        titles_bag.page + 1, user_id
+                        titles_bag.page + 1, user_id, titles_bag.items[-1].titles_bag_id
                     ),
                 )
             )
@@ -300,7 +300,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "⬅️",
                     callback_data=self._payload_factory.exchange_menu(
-                        titles_bag.page - 1, user_id
+                        titles_bag.page - 1, user_id, -titles_bag.items[0].titles_bag_id
                     ),
                 )
             )
@@ -309,7 +309,7 @@ class TitlesKeyboardFactory:
                 InlineKeyboardButton(
                     "➡️",
                     callback_data=self._payload_factory.exchange_menu(
-                        titles_bag.page + 1, user_id
+                        titles_bag.page + 1, user_id, titles_bag.items[-1].titles_bag_id
                     ),
                 )
             )
@@ -41,34 +41,36 @@ def message_to_context(message: Message) -> MessageContext:
     )
 
 
-def call_to_titles_context(call: CallbackQuery) -> TitlesCallbackContext:
+def call_to_titles_context(call: CallbackQuery, payload: dict) -> TitlesCallbackContext:
     return TitlesCallbackContext(
         user_id=call.from_user.id,
         chat_id=call.message.chat.id,
         message_id=call.message.id,
         inline_message_id=None,
         callback_id=call.id,
-        payload=TitlesPayloadFactory.get_payload(call.data),
+        payload=TitlesPayloadFactory.get_payload(payload),
     )
 
 
-def call_to_captcha_context(call: CallbackQuery) -> CaptchaCallbackContext:
+def call_to_captcha_context(
+    call: CallbackQuery, payload: dict
+) -> CaptchaCallbackContext:
     return CaptchaCallbackContext(
         user_id=call.from_user.id,
         chat_id=call.message.chat.id,
         message_id=call.message.id,
         inline_message_id=None,
         callback_id=call.id,
-        payload=CaptchaPayloadFactory.get_payload(call.data),
+        payload=CaptchaPayloadFactory.get_payload(payload),
     )
 
 
-def call_to_anime_context(call: CallbackQuery) -> AnimeCallbackContext:
+def call_to_anime_context(call: CallbackQuery, payload: dict) -> AnimeCallbackContext:
     return AnimeCallbackContext(
         user_id=call.from_user.id,
         chat_id=None,
         message_id=None,
         inline_message_id=call.inline_message_id,
         callback_id=call.id,
-        payload=AnimePayloadFactory.get_payload(call.data),
+        payload=AnimePayloadFactory.get_payload(payload),
     )
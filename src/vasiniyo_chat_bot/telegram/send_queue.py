@@ -0,0 +1,191 @@
+import bisect
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from itertools import count
+import logging
+import threading
+import time
+from typing import Callable
+from typing import TypeVar
+
+from telebot.apihelper import ApiTelegramException
+
+from vasiniyo_chat_bot.module.dto import Priority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def wait_time(self, now: float) -> float:
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+    def is_full(self) -> bool:
+        return self._tokens >= self._capacity
+
+
+@dataclass(order=True)
+class _Job:
+    priority: Priority
+    seq: int
+    chat_id: int | None = field(compare=False)
+    call: Callable[[], object] = field(compare=False)
+    future: Future = field(compare=False)
+    new_message: bool = field(default=True, compare=False)
+    attempts: int = field(default=0, compare=False)
+
+
+class SendQueue:
+    """Outbound queue that keeps the bot within Telegram's flood limits.
+
+    Calls are released by priority while the global and per-chat token
+    buckets allow it, one call per chat at a time. New messages to a group
+    also take from its per-minute bucket; edits and deletes do not. A 429
+    blocks the chat for ``retry_after`` seconds and the call is retried.
+    Calls without a chat (inline message edits) only take from the global
+    bucket and do not wait for each other.
+    """
+
+    def __init__(
+        self,
+        *,
+        global_rate: float = 30,
+        chat_rate: float = 1,
+        chat_burst: float = 3,
+        group_per_minute: float = 20,
+        workers: int = 8,
+        max_attempts: int = 5,
+    ) -> None:
+        self._global = TokenBucket(global_rate, global_rate)
+        self._chat_bucket = lambda: TokenBucket(chat_rate, chat_burst)
+        self._group_bucket = lambda: TokenBucket(
+            group_per_minute / 60, group_per_minute
+        )
+        self._chats: dict[int, TokenBucket] = {}
+        self._groups: dict[int, TokenBucket] = {}
+        self._blocked_until: dict[int | None, float] = {}
+        self._in_flight: set[int] = set()
+        self._jobs: list[_Job] = []
+        self._seq = count()
+        self._max_attempts = max_attempts
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="SendQueue")
+        threading.Thread(target=self._run, name="SendQueue", daemon=True).start()
+
+    def submit(
+        self,
+        chat_id: int | None,
+        call: Callable[[], T],
+        priority: Priority = Priority.NORMAL,
+        new_message: bool = True,
+    ) -> Future:
+        future = Future()
+        job = _Job(priority, next(self._seq), chat_id, call, future, new_message)
+        with self._condition:
+            bisect.insort(self._jobs, job)
+            self._condition.notify()
+        return future
+
+    def depth(self) -> int:
+        with self._condition:
+            return len(self._jobs)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                job, wait = self._next_job(time.monotonic())
+                if job is None:
+                    self._condition.wait(wait)
+                    continue
+            self._executor.submit(self._execute, job)
+
+    def _next_job(self, now: float) -> tuple[_Job | None, float | None]:
+        global_wait = self._global.wait_time(now)
+        if not self._jobs:
+            return None, None
+        if global_wait:
+            return None, global_wait
+        min_wait = None
+        for i, job in enumerate(self._jobs):
+            if job.chat_id is not None and job.chat_id in self._in_flight:
+                continue
+            buckets = self._buckets(job.chat_id, job.new_message)
+            wait = max(
+                self._blocked_until.get(job.chat_id, now) - now,
+                0.0,
+                *(bucket.wait_time(now) for bucket in buckets),
+            )
+            if wait > 0:
+                min_wait = wait if min_wait is None else min(min_wait, wait)
+                continue
+            for bucket in (self._global, *buckets):
+                bucket.take()
+            self._blocked_until.pop(job.chat_id, None)
+            if job.chat_id is not None:
+                self._in_flight.add(job.chat_id)
+            del self._jobs[i]
+            return job, None
+        return None, min_wait
+
+    def _buckets(self, chat_id: int | None, new_message: bool) -> list[TokenBucket]:
+        if chat_id is None:
+            return []
+        if len(self._chats) > 1000:
+            self._prune()
+        buckets = [self._chats.setdefault(chat_id, self._chat_bucket())]
+        if new_message and chat_id < 0:
+            buckets.append(self._groups.setdefault(chat_id, self._group_bucket()))
+        return buckets
+
+    def _prune(self) -> None:
+        for buckets in (self._chats, self._groups):
+            for chat_id in [c for c, bucket in buckets.items() if bucket.is_full()]:
+                del buckets[chat_id]
+
+    def _execute(self, job: _Job) -> None:
+        try:
+            result = job.call()
+        except ApiTelegramException as e:
+            job.attempts += 1
+            if e.error_code != 429 or job.attempts >= self._max_attempts:
+                job.future.set_exception(e)
+            else:
+                self._retry_later(job, e)
+        except Exception as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+        finally:
+            with self._condition:
+                self._in_flight.discard(job.chat_id)
+                self._condition.notify()
+
+    def _retry_later(self, job: _Job, e: ApiTelegramException) -> None:
+        retry_after = (e.result_json or {}).get("parameters", {}).get("retry_after", 1)
+        logger.warning(
+            "send_rate_limited",
+            extra={
+                "chat_id": job.chat_id,
+                "retry_after": retry_after,
+                "attempt": job.attempts,
+            },
+        )
+        with self._condition:
+            self._blocked_until[job.chat_id] = time.monotonic() + retry_after
+            bisect.insort(self._jobs, job)
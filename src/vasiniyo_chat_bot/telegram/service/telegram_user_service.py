@@ -5,14 +5,18 @@ from telebot.types import ChatMemberBanned
 from telebot.types import ChatMemberLeft
 from telebot.types import User
 
+from vasiniyo_chat_bot.module.chat_users_repository import ChatUsersRepository
 from vasiniyo_chat_bot.module.dto import UserContext
 from vasiniyo_chat_bot.module.user_service import UserService
 from vasiniyo_chat_bot.telegram.bot_service import BotService
 
 
 class TelegramUserService(UserService):
-    def __init__(self, client: BotService):
+    def __init__(
+        self, client: BotService, chat_users: ChatUsersRepository | None = None
+    ):
         self._client = client
+        self._chat_users = chat_users
 
     def get_username(
         self, chat_id: int, user_id: int, is_active: bool = None
@@ -21,7 +25,14 @@ class TelegramUserService(UserService):
         value = self._cache.get(key)
         if key in self._cache:
             return value
-        if not is_active:
+        known = self._chat_users and self._chat_users.find(chat_id, user_id)
+        if known and (not is_active or known.is_member is not None):
+            value = (
+                (known.username or known.full_name)
+                if not is_active or known.is_member
+                else None
+            )
+        elif not is_active:
             user = self.get_user(chat_id, user_id)
             value = user and (user.username or user.full_name)
         else:
@@ -53,3 +64,7 @@ class TelegramUserService(UserService):
 
     def ban(self, ctx: UserContext) -> None:
         self._client.ban_chat_member(ctx)
+
+    def invalidate_cache(self, chat_id: int, user_id: int) -> None:
+        super().invalidate_cache(chat_id, user_id)
+        self._client.invalidate_chat_member(chat_id, user_id)
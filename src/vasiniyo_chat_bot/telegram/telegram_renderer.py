@@ -48,17 +48,19 @@ class TelegramRenderer(Renderer):
                 ctx,
                 caption=response.text_units,
                 reply_markup=self._to_markup(response.menu, ctx.user_id),
+                priority=response.priority,
             )
             return message.id
         message = self._bot_service.send_message(
             response.text_units,
             ctx,
             reply_markup=self._to_markup(response.menu, ctx.user_id),
+            priority=response.priority,
         )
         return message.id
 
     def send_sticker(self, response: Response, ctx: UserContext):
-        self._bot_service.send_sticker(response.text_units, ctx)
+        self._bot_service.send_sticker(response.text_units, ctx, response.priority)
 
     def send_photo(self, response: Response, ctx: UserContext):
         message = self._bot_service.send_photo(
@@ -66,6 +68,7 @@ class TelegramRenderer(Renderer):
             ctx,
             caption=response.text_units,
             reply_markup=self._to_markup(response.menu, ctx.user_id),
+            priority=response.priority,
         )
         return message.id
 
@@ -77,6 +80,7 @@ class TelegramRenderer(Renderer):
                 ctx.message_id,
                 caption=response.text_units,
                 reply_markup=self._to_markup(response.menu, ctx.user_id),
+                priority=response.priority,
             )
             return
         self._bot_service.edit_message_text(
@@ -84,6 +88,7 @@ class TelegramRenderer(Renderer):
             ctx,
             reply_markup=self._to_markup(response.menu, ctx.user_id),
             is_disabled_preview=is_disabled_preview,
+            priority=response.priority,
         )
 
     def edit_caption(
@@ -94,6 +99,7 @@ class TelegramRenderer(Renderer):
             ctx.message_id,
             response.text_units,
             reply_markup=self._to_markup(response.menu, ctx.user_id),
+            priority=response.priority,
         )
 
     def edit_later(self, response: Response, delay: int, ctx: UserContext):
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Callable
+
+from telebot.types import ChatMember
+
+
+class TitleSyncCache:
+    """What Telegram is known to show for titles, and the bot's rights per chat.
+
+    ``title`` keeps the title last read from or written to Telegram for
+    ``(chat_id, user_id)`` for ``ttl`` seconds, so a title that is already
+    in sync is confirmed without API calls. The bot's own membership per
+    chat is kept for ``rights_ttl`` seconds unless a ``my_chat_member``
+    update replaces it earlier. A load that raises stores nothing, a load
+    that overlaps a ``forget`` or ``confirm`` of its key is not stored, and a
+    missing bot membership is never stored.
+    """
+
+    def __init__(
+        self, ttl: float = 300, rights_ttl: float = 600, max_size: int = 10_000
+    ) -> None:
+        self._ttl = ttl
+        self._rights_ttl = rights_ttl
+        self._max_size = max_size
+        self._titles: OrderedDict[tuple[int, int], tuple[float, str | None]]
+        self._titles = OrderedDict()
+        self._loads: dict[tuple[int, int], object] = {}
+        self._bot_members: dict[int, tuple[float, ChatMember | None]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def title(
+        self, chat_id: int, user_id: int, load: Callable[[int, int], str | None]
+    ) -> str | None:
+        key = (chat_id, user_id)
+        with self._lock:
+            entry = self._titles.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._titles.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            self._loads[key] = token = object()
+        try:
+            title = load(chat_id, user_id)
+        except:
+            with self._lock:
+                if self._loads.get(key) is token:
+                    del self._loads[key]
+            raise
+        with self._lock:
+            if self._loads.get(key) is token:
+                del self._loads[key]
+                self._store(key, title)
+        return title
+
+    def confirm(self, chat_id: int, user_id: int, title: str | None) -> None:
+        key = (chat_id, user_id)
+        with self._lock:
+            self._loads.pop(key, None)
+            self._store(key, title)
+
+    def forget(self, chat_id: int, user_id: int) -> None:
+        with self._lock:
+            self._titles.pop((chat_id, user_id), None)
+            self._loads.pop((chat_id, user_id), None)
+
+    def bot_member(
+        self, chat_id: int, load: Callable[[int], ChatMember | None]
+    ) -> ChatMember | None:
+        with self._lock:
+            entry = self._bot_members.get(chat_id)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+        member = load(chat_id)
+        if member is not None:
+            self.set_bot_member(chat_id, member)
+        return member
+
+    def set_bot_member(self, chat_id: int, member: ChatMember | None) -> None:
+        with self._lock:
+            self._bot_members[chat_id] = (time.monotonic() + self._rights_ttl, member)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "titles": len(self._titles),
+                "chats": len(self._bot_members),
+            }
+
+    def _store(self, key: tuple[int, int], title: str | None) -> None:
+        self._titles[key] = (time.monotonic() + self._ttl, title)
+        self._titles.move_to_end(key)
+        while len(self._titles) > self._max_size:
+            self._titles.popitem(last=False)
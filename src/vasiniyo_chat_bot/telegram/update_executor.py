@@ -0,0 +1,114 @@
+from itertools import count
+import logging
+from queue import Empty
+from queue import Queue
+import threading
+from typing import Callable
+
+from telebot import TeleBot
+from telebot.types import CallbackQuery
+
+logger = logging.getLogger(__name__)
+
+
+class ChatShardedExecutor:
+    """Drop-in replacement for telebot's worker pool.
+
+    Every update is routed to a shard by its chat id, so updates of one chat are
+    handled strictly in arrival order while different chats run in parallel.
+    Updates without a chat (inline queries) are spread round-robin. A task
+    given a list of updates (update listeners) is split by shard and called
+    once per shard with the updates of that shard, so listeners run in order
+    with the handlers of each chat.
+    """
+
+    def __init__(self, bot: TeleBot, workers: int) -> None:
+        self._bot = bot
+        self._queues = [Queue() for _ in range(max(1, workers))]
+        self._round_robin = count()
+        self._running = True
+        self.exception_event = threading.Event()
+        self.exception_info: Exception | None = None
+        self._threads = [
+            threading.Thread(
+                target=self._work, args=(queue,), name=f"UpdateShard{i}", daemon=True
+            )
+            for i, queue in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    _backlog_warning = 100
+
+    def put(self, task: Callable, *args, **kwargs) -> None:
+        if args and isinstance(args[0], list) and args[0]:
+            shards = {}
+            for update in args[0]:
+                shards.setdefault(self.shard_of(update), []).append(update)
+            for shard, updates in shards.items():
+                self._enqueue(shard, task, (updates, *args[1:]), kwargs)
+        else:
+            self._enqueue(self.shard_of(args[0] if args else None), task, args, kwargs)
+
+    def shard_of(self, update) -> int:
+        chat_id = self._chat_id(update)
+        if chat_id is None:
+            return next(self._round_robin) % len(self._queues)
+        return hash(chat_id) % len(self._queues)
+
+    def queue_depths(self) -> list[int]:
+        return [queue.qsize() for queue in self._queues]
+
+    def raise_exceptions(self) -> None:
+        if self.exception_event.is_set():
+            raise self.exception_info
+
+    def clear_exceptions(self) -> None:
+        self.exception_event.clear()
+
+    def close(self) -> None:
+        self._running = False
+        for queue in self._queues:
+            queue.put(None)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+
+    def _enqueue(self, shard: int, task: Callable, args: tuple, kwargs: dict) -> None:
+        queue = self._queues[shard]
+        queue.put((task, args, kwargs))
+        if (depth := queue.qsize()) and depth % self._backlog_warning == 0:
+            logger.warning(
+                "update_shard_backlog", extra={"shard": shard, "depth": depth}
+            )
+
+    def _work(self, queue: Queue) -> None:
+        while self._running:
+            try:
+                job = queue.get(timeout=0.5)
+            except Empty:
+                continue
+            if job is None:
+                break
+            task, args, kwargs = job
+            try:
+                task(*args, **kwargs)
+            except Exception as e:
+                self._on_exception(e)
+
+    def _on_exception(self, e: Exception) -> None:
+        handler = self._bot.exception_handler
+        if handler is not None and handler.handle(e):
+            return
+        logger.exception(
+            "update_task_failed", extra={"queue_depths": self.queue_depths()}
+        )
+        self.exception_info = e
+        self.exception_event.set()
+
+    @staticmethod
+    def _chat_id(update) -> int | None:
+        if isinstance(update, CallbackQuery):
+            update = update.message
+        chat = getattr(update, "chat", None)
+        return chat.id if chat else None
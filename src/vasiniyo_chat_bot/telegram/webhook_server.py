@@ -0,0 +1,89 @@
+import hmac
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import logging
+
+from telebot import TeleBot
+from telebot.types import Update
+
+from vasiniyo_chat_bot.config.webhook_reader import WebhookSettings
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookServer:
+    def __init__(self, bot: TeleBot, settings: WebhookSettings) -> None:
+        self._bot = bot
+        self._settings = settings
+        self._server = ThreadingHTTPServer(
+            (settings.host, settings.port), self._request_handler()
+        )
+        self._server.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def serve_forever(self) -> None:
+        logger.info(
+            "start_webhook", extra={"host": self._settings.host, "port": self.port}
+        )
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _request_handler(self) -> type[BaseHTTPRequestHandler]:
+        bot, settings = self._bot, self._settings
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != settings.path:
+                    return self._reply(HTTPStatus.NOT_FOUND)
+                secret_token = self.headers.get(SECRET_TOKEN_HEADER, "")
+                if not hmac.compare_digest(secret_token, settings.secret_token):
+                    logger.warning(
+                        "webhook_rejected", extra={"reason": "invalid secret token"}
+                    )
+                    return self._reply(HTTPStatus.FORBIDDEN)
+                length = int(self.headers.get("Content-Length") or 0)
+                if length > settings.max_body_size:
+                    return self._reply(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                try:
+                    update = Update.de_json(self.rfile.read(length).decode("utf-8"))
+                except (ValueError, TypeError, KeyError):
+                    logger.warning(
+                        "webhook_rejected", extra={"reason": "malformed update"}
+                    )
+                    return self._reply(HTTPStatus.BAD_REQUEST)
+                if update is None:
+                    return self._reply(HTTPStatus.BAD_REQUEST)
+                # Telegram redelivers on non-2xx, so handler failures are only logged
+                try:
+                    bot.process_new_updates([update])
+                except Exception:
+                    logger.exception(
+                        "webhook_update_failed", extra={"update_id": update.update_id}
+                    )
+                self._reply(HTTPStatus.OK)
+
+            def do_GET(self):
+                self._reply(HTTPStatus.METHOD_NOT_ALLOWED)
+
+            def _reply(self, status: HTTPStatus):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                body = json.dumps({"ok": status == HTTPStatus.OK}).encode()
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("webhook_request", extra={"details": format % args})
+
+        return _Handler
@@ -0,0 +1,16 @@
+from pathlib import Path
+import tempfile
+import unittest
+
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
+from vasiniyo_chat_bot.migration import sqlite_migration
+
+
+def migrated_database(testcase: unittest.TestCase) -> str:
+    """Create a migrated database that lives until the test is cleaned up."""
+    directory = tempfile.TemporaryDirectory()
+    testcase.addCleanup(directory.cleanup)
+    testcase.addCleanup(SqliteConnectionManager.close_all)
+    database_path = str(Path(directory.name) / "test.db")
+    sqlite_migration.apply_migrations(database_path)
+    return database_path
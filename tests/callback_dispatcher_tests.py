@@ -0,0 +1,103 @@
+import json
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+from vasiniyo_chat_bot.module.dto import Action
+from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
+from vasiniyo_chat_bot.telegram.handler import callback_dispatcher
+from vasiniyo_chat_bot.telegram.handler.callback_dispatcher import CallbackDispatcher
+from vasiniyo_chat_bot.telegram.handler.query_handler import QueryHandler
+
+CHAT_ID = -100500
+LOGGER = callback_dispatcher.__name__
+
+
+def call(data: str, chat_id: int = CHAT_ID) -> SimpleNamespace:
+    return SimpleNamespace(
+        data=data, message=SimpleNamespace(chat=SimpleNamespace(id=chat_id))
+    )
+
+
+class TestCallbackDispatcher(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.handled = []
+        self.seen = []
+        self.dispatcher = CallbackDispatcher(
+            [str(CHAT_ID)],
+            [
+                QueryHandler(
+                    [Action.ROLL_D6, Action.ROLL_RANDOM_D6],
+                    lambda c, payload: self.handled.append(("dice", payload)),
+                ),
+                QueryHandler(
+                    [Action.OPEN_RENAME_MENU],
+                    lambda c, payload: self.handled.append(("rename", payload)),
+                ),
+            ],
+            self.seen.append,
+        )
+
+    # ---------- tests ----------------------------------------------------
+    def test_payload_is_decoded_once_and_passed_to_the_handler(self):
+        data = encode_payload(Action.ROLL_D6, {Field.USER_ID: 7, Field.DICE_VALUE: 3})
+
+        with mock.patch.object(
+            callback_dispatcher,
+            "decode_payload",
+            wraps=callback_dispatcher.decode_payload,
+        ) as decode:
+            self.dispatcher.handler(call(data))
+
+        decode.assert_called_once_with(data)
+        self.assertEqual(
+            self.handled,
+            [
+                (
+                    "dice",
+                    {
+                        Field.ACTION_TYPE.value: Action.ROLL_D6.value,
+                        Field.USER_ID.value: 7,
+                        Field.DICE_VALUE.value: 3,
+                    },
+                )
+            ],
+        )
+
+    def test_callbacks_are_routed_by_action(self):
+        self.dispatcher.handler(call(encode_payload(Action.OPEN_RENAME_MENU, {})))
+        self.dispatcher.handler(call(encode_payload(Action.ROLL_RANDOM_D6, {})))
+        self.dispatcher.handler(
+            call(json.dumps({Field.ACTION_TYPE.value: Action.ROLL_D6.value}))
+        )
+
+        self.assertEqual(
+            [route for route, _ in self.handled], ["rename", "dice", "dice"]
+        )
+        self.assertEqual(len(self.seen), 3)
+
+    def test_unknown_action_is_logged(self):
+        with self.assertLogs(LOGGER, "INFO") as logs:
+            self.dispatcher.handler(call(encode_payload(Action.ANIME, {})))
+
+        self.assertEqual(self.handled, [])
+        self.assertEqual([r.getMessage() for r in logs.records], ["unknown_callback"])
+
+    def test_undecodable_payload_is_logged(self):
+        for data in ("", "not base64!", "AAA", "[1, 2]"):
+            with self.subTest(data=data), self.assertLogs(level="INFO") as logs:
+                self.dispatcher.handler(call(data))
+
+            self.assertIn("unknown_callback", [r.getMessage() for r in logs.records])
+        self.assertEqual(self.handled, [])
+
+    def test_callbacks_from_other_chats_are_filtered(self):
+        self.assertTrue(self.dispatcher.kwargs["func"](call("", CHAT_ID)))
+        self.assertFalse(self.dispatcher.kwargs["func"](call("", 1)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
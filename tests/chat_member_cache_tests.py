@@ -0,0 +1,170 @@
+import time
+from types import SimpleNamespace
+import unittest
+
+from telebot import TeleBot
+from telebot.apihelper import ApiTelegramException
+
+from vasiniyo_chat_bot.module.dto import UserTemplate
+from vasiniyo_chat_bot.telegram.bot_service import BotService
+from vasiniyo_chat_bot.telegram.chat_member_cache import ChatMemberCache
+from vasiniyo_chat_bot.telegram.service.markdown_v2_service import MarkdownV2Service
+
+CHAT_ID = -100500
+
+
+class TestChatMemberCache(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.calls = []
+
+    def _load(self, chat_id: int, user_id: int):
+        self.calls.append((chat_id, user_id))
+        return f"member-{user_id}-{len(self.calls)}"
+
+    # ---------- tests ----------------------------------------------------
+    def test_repeated_lookups_hit_the_cache(self):
+        cache = ChatMemberCache()
+
+        first = cache.get(CHAT_ID, 1, self._load)
+        second = cache.get(CHAT_ID, 1, self._load)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [(CHAT_ID, 1)])
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_invalidate_forces_reload(self):
+        cache = ChatMemberCache()
+        cache.get(CHAT_ID, 1, self._load)
+
+        cache.invalidate(CHAT_ID, 1)
+
+        self.assertEqual(cache.get(CHAT_ID, 1, self._load), "member-1-2")
+
+    def test_expired_entries_are_reloaded(self):
+        cache = ChatMemberCache(ttl=0)
+        cache.get(CHAT_ID, 1, self._load)
+        cache.get(CHAT_ID, 1, self._load)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ChatMemberCache(max_size=2)
+        cache.get(CHAT_ID, 1, self._load)
+        cache.get(CHAT_ID, 2, self._load)
+        cache.get(CHAT_ID, 1, self._load)
+        cache.get(CHAT_ID, 3, self._load)
+
+        cache.get(CHAT_ID, 1, self._load)
+        cache.get(CHAT_ID, 2, self._load)
+
+        self.assertEqual([user_id for _, user_id in self.calls], [1, 2, 3, 2])
+
+    def test_failed_loads_are_not_cached(self):
+        cache = ChatMemberCache()
+
+        def fail(chat_id: int, user_id: int):
+            raise ConnectionError("timeout")
+
+        with self.assertRaises(ConnectionError):
+            cache.get(CHAT_ID, 1, fail)
+
+        self.assertEqual(cache.get(CHAT_ID, 1, self._load), "member-1-1")
+
+    def test_load_overlapping_invalidate_is_not_stored(self):
+        cache = ChatMemberCache()
+
+        def load(chat_id: int, user_id: int):
+            cache.invalidate(chat_id, user_id)
+            return self._load(chat_id, user_id)
+
+        self.assertEqual(cache.get(CHAT_ID, 1, load), "member-1-1")
+        self.assertEqual(cache.get(CHAT_ID, 1, self._load), "member-1-2")
+
+
+class TestMemberLookupErrors(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def _bot_service(self, *errors: Exception) -> BotService:
+        bot = TeleBot("123:TEST", threaded=False)
+        self.calls = 0
+        responses = list(errors)
+
+        def get_chat_member(chat_id: int, user_id: int):
+            self.calls += 1
+            if responses:
+                raise responses.pop(0)
+            return SimpleNamespace(user=SimpleNamespace(id=user_id))
+
+        bot.get_chat_member = get_chat_member
+        return BotService(bot, MarkdownV2Service())
+
+    @staticmethod
+    def _api_error(code: int, description: str) -> ApiTelegramException:
+        return ApiTelegramException(
+            "getChatMember", None, {"error_code": code, "description": description}
+        )
+
+    # ---------- tests ----------------------------------------------------
+    def test_missing_member_is_cached(self):
+        service = self._bot_service(self._api_error(400, "Bad Request: user not found"))
+
+        self.assertIsNone(service.get_chat_member(CHAT_ID, 1))
+        self.assertIsNone(service.get_chat_member(CHAT_ID, 1))
+        self.assertEqual(self.calls, 1)
+
+    def test_transient_errors_are_not_cached(self):
+        service = self._bot_service(
+            self._api_error(429, "Too Many Requests: retry after 5"),
+            ConnectionError("timeout"),
+        )
+
+        self.assertIsNone(service.get_chat_member(CHAT_ID, 1))
+        self.assertIsNone(service.get_chat_member(CHAT_ID, 1))
+        self.assertIsNotNone(service.get_chat_member(CHAT_ID, 1))
+        self.assertEqual(self.calls, 3)
+
+
+class TestMemberResolution(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def _bot_service(self, delays: dict[int, float], deadline: float) -> BotService:
+        service = BotService(
+            TeleBot("123:TEST", threaded=False),
+            MarkdownV2Service(),
+            member_deadline=deadline,
+        )
+
+        def get_chat_member(chat_id: int, user_id: int):
+            time.sleep(delays[user_id])
+            return SimpleNamespace(
+                user=SimpleNamespace(full_name=f"user{user_id}", username=None)
+            )
+
+        service.get_chat_member = get_chat_member
+        return service
+
+    # ---------- tests ----------------------------------------------------
+    def test_members_are_resolved_concurrently(self):
+        service = self._bot_service({i: 0.2 for i in range(5)}, deadline=5)
+        units = [UserTemplate(CHAT_ID, i % 5) for i in range(10)]
+
+        started = time.monotonic()
+        text = service._to_text(units)
+
+        self.assertLess(time.monotonic() - started, 0.6)
+        self.assertEqual(text, "".join(f"user{i % 5}" for i in range(10)))
+
+    def test_stragglers_fall_back_to_unknown(self):
+        service = self._bot_service({1: 0, 2: 1}, deadline=0.2)
+
+        text = service._to_text(
+            [UserTemplate(CHAT_ID, 1), ", ", UserTemplate(CHAT_ID, 2)]
+        )
+
+        self.assertEqual(text, "user1, _Неизвестный_")
+
+
+if __name__ == "__main__":
+    unittest.main()
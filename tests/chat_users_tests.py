@@ -0,0 +1,167 @@
+import unittest
+
+from telebot import TeleBot
+from telebot.types import ChatMemberUpdated
+from telebot.types import Message
+
+from tests import migrated_database
+from vasiniyo_chat_bot.database.sqlite.dao import ChatUsersDao
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_chat_users_repository import (
+    SqliteChatUsersRepository,
+)
+from vasiniyo_chat_bot.module.dto import UserTemplate
+from vasiniyo_chat_bot.telegram.bot_service import BotService
+from vasiniyo_chat_bot.telegram.chat_users_recorder import ChatUsersRecorder
+from vasiniyo_chat_bot.telegram.service.markdown_v2_service import MarkdownV2Service
+from vasiniyo_chat_bot.telegram.service.telegram_user_service import TelegramUserService
+
+CHAT_ID = -100500
+
+
+def user(user_id: int, username: str | None = None) -> dict:
+    return {
+        "id": user_id,
+        "is_bot": False,
+        "first_name": f"user{user_id}",
+        **({"username": username} if username else {}),
+    }
+
+
+def message(from_user: dict, **fields) -> Message:
+    return Message.de_json(
+        {
+            "message_id": 1,
+            "date": 1700000000,
+            "chat": {"id": CHAT_ID, "type": "supergroup", "title": "chat"},
+            "from": from_user,
+            **fields,
+        }
+    )
+
+
+def member_update(user_id: int, status: str, **fields) -> ChatMemberUpdated:
+    member = {"user": user(user_id), "status": status, **fields}
+    return ChatMemberUpdated.de_json(
+        {
+            "chat": {"id": CHAT_ID, "type": "supergroup", "title": "chat"},
+            "from": user(user_id),
+            "date": 1700000000,
+            "old_chat_member": {"user": user(user_id), "status": "member"},
+            "new_chat_member": member,
+        }
+    )
+
+
+class TestChatUsers(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        database_path = migrated_database(self)
+        self.repository = SqliteChatUsersRepository(
+            ChatUsersDao(), SqliteDatabaseSettings(database_path, write_executor=False)
+        )
+        self.recorder = ChatUsersRecorder(self.repository)
+
+    def _offline_bot_service(self) -> BotService:
+        service = BotService(
+            TeleBot("123:TEST", threaded=False),
+            MarkdownV2Service(),
+            chat_users=self.repository,
+        )
+        service.get_chat_member = lambda chat_id, user_id: self.fail(
+            f"unexpected get_chat_member for {user_id}"
+        )
+        return service
+
+    # ---------- tests ----------------------------------------------------
+    def test_updates_maintain_directory(self):
+        self.recorder.record_messages(
+            [
+                message(user(1), new_chat_members=[user(1), user(2, "second")]),
+                message(user(1, "first"), text="hello"),
+                message(user(2, "second"), left_chat_member=user(2, "second")),
+            ]
+        )
+
+        first = self.repository.find(CHAT_ID, 1)
+        second = self.repository.find(CHAT_ID, 2)
+        self.assertEqual((first.username, first.is_member), ("first", True))
+        self.assertEqual((second.username, second.is_member), ("second", False))
+        self.assertIsNone(self.repository.find(CHAT_ID, 3))
+
+    def test_names_are_served_without_api_calls(self):
+        self.recorder.record_messages(
+            [message(user(1, "first"), text="hi"), message(user(2), text="hi")]
+        )
+        service = self._offline_bot_service()
+        user_service = TelegramUserService(service, self.repository)
+        user_service._cache.clear()
+
+        self.assertEqual(user_service.get_username(CHAT_ID, 1, True), "first")
+        self.assertEqual(user_service.get_username(CHAT_ID, 2), "user2")
+        self.assertIn(
+            "user2",
+            service._to_text([UserTemplate(CHAT_ID, 1), UserTemplate(CHAT_ID, 2)]),
+        )
+
+    def test_member_updates_record_membership(self):
+        restricted = dict.fromkeys(
+            [
+                "can_send_messages",
+                "can_send_audios",
+                "can_send_documents",
+                "can_send_photos",
+                "can_send_videos",
+                "can_send_video_notes",
+                "can_send_voice_notes",
+                "can_send_polls",
+                "can_send_other_messages",
+                "can_add_web_page_previews",
+                "can_change_info",
+                "can_invite_users",
+                "can_pin_messages",
+                "can_manage_topics",
+            ],
+            False,
+        )
+        administrator = dict.fromkeys(
+            [
+                "can_be_edited",
+                "is_anonymous",
+                "can_manage_chat",
+                "can_delete_messages",
+                "can_manage_video_chats",
+                "can_restrict_members",
+                "can_promote_members",
+                "can_change_info",
+                "can_invite_users",
+                "can_post_stories",
+                "can_edit_stories",
+                "can_delete_stories",
+            ],
+            False,
+        )
+        self.recorder.record_messages([message(user(u), text="hi") for u in range(5)])
+
+        for update in (
+            member_update(0, "kicked", until_date=0),
+            member_update(1, "left"),
+            member_update(2, "restricted", is_member=False, **restricted),
+            member_update(3, "restricted", is_member=True, **restricted),
+            member_update(4, "administrator", **administrator),
+        ):
+            self.recorder.record_member_update(update)
+
+        self.assertEqual(
+            [self.repository.find(CHAT_ID, u).is_member for u in range(5)],
+            [False, False, False, True, True],
+        )
+        user_service = TelegramUserService(self._offline_bot_service(), self.repository)
+        user_service._cache.clear()
+        self.assertIsNone(user_service.get_username(CHAT_ID, 0, True))
+        self.assertEqual(user_service.get_username(CHAT_ID, 3, True), "user3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from unittest import mock
+
+from telebot.types import Message
+
+from vasiniyo_chat_bot.config.bot_settings_reader import CommandInfo
+from vasiniyo_chat_bot.telegram.feature.command import Command
+from vasiniyo_chat_bot.telegram.handler import command_router
+from vasiniyo_chat_bot.telegram.handler.command_router import CommandRouter
+
+CHAT_ID = -100500
+BOT_USERNAME = "vasiniyo_bot"
+
+
+def message(text: str, message_id: int = 1) -> Message:
+    return Message.de_json(
+        {
+            "message_id": message_id,
+            "date": 0,
+            "chat": {"id": CHAT_ID, "type": "supergroup"},
+            "from": {"id": 1, "is_bot": False, "first_name": "user"},
+            "text": text,
+        }
+    )
+
+
+class TestCommandRouter(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.handled = []
+        self.router = CommandRouter(
+            BOT_USERNAME,
+            ["*"],
+            [
+                Command(
+                    CommandInfo(name, "", is_inline=False),
+                    lambda ctx, name=name: self.handled.append((name, ctx.text)),
+                )
+                for name in ("/help", "/rename")
+            ],
+            lambda ctx: self.handled.append(("unknown", ctx.text)),
+        )
+
+    def _send(self, text: str, message_id: int = 1) -> bool:
+        update = message(text, message_id)
+        if not self.router.kwargs["func"](update):
+            return False
+        self.router.handler(update)
+        return True
+
+    # ---------- tests ----------------------------------------------------
+    def test_command_is_routed_by_name(self):
+        self.assertTrue(self._send("/rename новый титул"))
+
+        self.assertEqual(self.handled, [("/rename", "/rename новый титул")])
+
+    def test_command_addressed_to_the_bot_is_routed(self):
+        self.assertTrue(self._send(f"/help@{BOT_USERNAME}"))
+
+        self.assertEqual(self.handled, [("/help", f"/help@{BOT_USERNAME}")])
+
+    def test_command_addressed_to_another_bot_is_not_routed(self):
+        self.assertFalse(self._send("/help@other_bot"))
+        self.assertFalse(self._send("/missing@other_bot"))
+
+        self.assertEqual(self.handled, [])
+
+    def test_unknown_command_falls_back_only_when_addressed_to_the_bot(self):
+        self.assertTrue(self._send(f"/missing@{BOT_USERNAME}"))
+        self.assertFalse(self._send("/missing"))
+
+        self.assertEqual(self.handled, [("unknown", f"/missing@{BOT_USERNAME}")])
+
+    def test_text_without_command_prefix_is_not_parsed(self):
+        with mock.patch.object(
+            command_router, "parse_command", wraps=command_router.parse_command
+        ) as parse:
+            self.assertFalse(self._send("help"))
+            self.assertFalse(self._send("  ну /help"))
+
+        parse.assert_not_called()
+
+    def test_command_is_parsed_once(self):
+        with mock.patch.object(
+            command_router, "parse_command", wraps=command_router.parse_command
+        ) as parse:
+            self.assertTrue(self._send("/help"))
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(self.handled, [("/help", "/help")])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
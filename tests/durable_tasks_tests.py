@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import patch
+
+from tests import migrated_database
+from vasiniyo_chat_bot import event_queue
+from vasiniyo_chat_bot.database.sqlite.dao import CaptchaUsersDao
+from vasiniyo_chat_bot.database.sqlite.dao import ScheduledTasksDao
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_captcha_repository import (
+    SqliteCaptchaRepository,
+)
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_scheduled_tasks_repository import (
+    SqliteScheduledTasksRepository,
+)
+from vasiniyo_chat_bot.module.captcha.captcha_repository import CaptchaRepository
+from vasiniyo_chat_bot.module.captcha.dto import CaptchaUser
+
+CHAT_ID = -100500
+
+
+class TestDurableTasks(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        database_path = migrated_database(self)
+        self.settings = SqliteDatabaseSettings(database_path, write_executor=False)
+        self.store = SqliteScheduledTasksRepository(ScheduledTasksDao(), self.settings)
+        patcher = patch.object(event_queue, "start_ticking_if_needed", lambda: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._restart)
+        self.addCleanup(event_queue.use_store, None)
+        event_queue.use_store(self.store)
+        self.result = []
+        event_queue.register_kind("probe", self._build)
+
+    def _build(self, task_id: str, args: list):
+        name = args[0]
+        return lambda: self.result.append((name, "default")), {
+            "on_success": lambda: self.result.append((name, "success"))
+        }
+
+    def _add(self, name: str) -> str:
+        default, conditional_funcs = self._build("", [name])
+        return event_queue.add_task(
+            [10, 20, 30, 40], default, conditional_funcs, descriptor=("probe", [name])
+        )
+
+    def _restart(self, downtime: float = 0):
+        event_queue.EVENTS.clear()
+        event_queue.DEADLINES.clear()
+        self.store.transaction(
+            lambda conn: conn.execute(
+                "update scheduled_tasks set started_at = started_at - ?", (downtime,)
+            )
+        )
+
+    # ---------- tests ----------------------------------------------------
+    def test_recovery_fast_forwards_missed_actions(self):
+        running = self._add("running")
+        expired = self._add("expired")
+        self._restart(downtime=25)
+        self.store.transaction(
+            lambda conn: conn.execute(
+                "update scheduled_tasks set started_at = started_at - 100"
+                " where task_id = ?",
+                (expired,),
+            )
+        )
+
+        self.assertEqual(event_queue.recover(), 2)
+        event_queue.tick()
+
+        self.assertEqual(
+            sorted(self.result), [("expired", "success"), ("running", "default")]
+        )
+        self.assertEqual(
+            [e["timestamp"] for e in event_queue.EVENTS[running]["sub_events"]],
+            [30, 40],
+        )
+        self.assertEqual([t.task_id for t in self.store.find_all()], [running])
+
+    def test_cancelled_task_is_not_recovered(self):
+        event_queue.cancel_task(self._add("cancelled"), silently=True)
+        self._restart()
+
+        self.assertEqual(event_queue.recover(), 0)
+
+    def test_captcha_users_survive_restart(self):
+        user = CaptchaUser(CHAT_ID, 1, 1, 30, "answer")
+        SqliteCaptchaRepository(CaptchaUsersDao(), self.settings).save(CHAT_ID, 1, user)
+        CaptchaRepository._captcha_users.clear()
+
+        repository = SqliteCaptchaRepository(CaptchaUsersDao(), self.settings)
+
+        self.assertEqual(repository.find(CHAT_ID, 1), user)
+        repository.remove(CHAT_ID, 1)
+        CaptchaRepository._captcha_users.clear()
+        self.assertIsNone(repository.find(CHAT_ID, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 import threading
 import time
 import unittest
 from unittest.mock import patch
 
+from vasiniyo_chat_bot import event_queue
+from vasiniyo_chat_bot.event_queue import DEADLINES
 from vasiniyo_chat_bot.event_queue import EVENTS
+from vasiniyo_chat_bot.event_queue import LAG
 from vasiniyo_chat_bot.event_queue import add_task
 from vasiniyo_chat_bot.event_queue import cancel_task
+from vasiniyo_chat_bot.event_queue import lag_metrics
 from vasiniyo_chat_bot.event_queue import tick
 
 
@@ -19,6 +24,14 @@ def log_tick_results(result, current_tick):
 class TestEventQueueSync(unittest.TestCase):
 
     # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.current_tick = {"i": 0}
+        patcher = patch(
+            "vasiniyo_chat_bot.event_queue.clock", lambda: self.current_tick["i"]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _drive_ticks(self, total, current_tick):
         for _ in range(total + 1):
             tick()
@@ -28,7 +41,7 @@ class TestEventQueueSync(unittest.TestCase):
     @patch("vasiniyo_chat_bot.event_queue.start_ticking_if_needed", lambda: None)
     def test_start_middle_success(self):
         EVENTS.clear()
-        result, current_tick = [], {"i": 0}
+        result, current_tick = [], self.current_tick
         record = log_tick_results(result, current_tick)
 
         total, freq = 10, 2
@@ -61,7 +74,7 @@ class TestEventQueueSync(unittest.TestCase):
     @patch("vasiniyo_chat_bot.event_queue.start_ticking_if_needed", lambda: None)
     def test_silent_success(self):
         EVENTS.clear()
-        result, current_tick = [], {"i": 0}
+        result, current_tick = [], self.current_tick
         record = log_tick_results(result, current_tick)
 
         total = 10
@@ -94,7 +107,7 @@ class TestEventQueueSync(unittest.TestCase):
     @patch("vasiniyo_chat_bot.event_queue.start_ticking_if_needed", lambda: None)
     def test_success_runs_on_final_tick(self):
         EVENTS.clear()
-        result, current_tick = [], {"i": 0}
+        result, current_tick = [], self.current_tick
         record = log_tick_results(result, current_tick)
 
         total = 4
@@ -115,5 +128,129 @@ class TestEventQueueSync(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestEventQueueTiming(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        EVENTS.clear()
+        LAG.update(actions=0, total=0.0, max=0.0)
+        self.now = 0.0
+        for target, value in (
+            ("clock", lambda: self.now),
+            ("start_ticking_if_needed", lambda: None),
+        ):
+            patcher = patch(f"vasiniyo_chat_bot.event_queue.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self._cancel_all)
+
+    def _cancel_all(self):
+        for key in list(EVENTS):
+            cancel_task(key, silently=True)
+
+    def _advance(self, seconds):
+        self.now += seconds
+
+    def _wait_until(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    # ---------- drift ---------------------------------------------------
+    def test_no_drift_under_load(self):
+        step, steps = 0.1, 20
+        timestamps = [step * i for i in range(1, steps + 1)]
+        for _ in range(5000):
+            add_task(timestamps=[3600], default=lambda: None)
+        for _ in range(200):
+            add_task(timestamps=timestamps, default=lambda: sum(range(100)))
+        add_task(timestamps=timestamps, default=lambda: self._advance(step / 2))
+        fired = []
+        probe = add_task(timestamps=timestamps, default=lambda: fired.append(self.now))
+
+        while probe in EVENTS:
+            self.now = max(self.now, tick())
+
+        lags = [at - ts for at, ts in zip(fired, timestamps)]
+        self.assertEqual(len(lags), steps)
+        for lag in lags:
+            self.assertAlmostEqual(lag, step / 2, msg="lag must not accumulate")
+
+    # ---------- workers -------------------------------------------------
+    def test_slow_actions_run_serialized_off_the_timer(self):
+        step = 0.05
+        release = threading.Event()
+        running, overlaps = set(), []
+        workers = ThreadPoolExecutor(8)
+        self.addCleanup(workers.shutdown)
+        self.addCleanup(release.set)
+
+        def slow(task):
+            if task in running:
+                overlaps.append(task)
+            running.add(task)
+            release.wait(5)
+            running.discard(task)
+
+        slow_tasks = [
+            add_task(
+                timestamps=[step, step * 2, step * 3],
+                default=lambda task=task: slow(task),
+            )
+            for task in range(4)
+        ]
+        fired = []
+        add_task(
+            timestamps=[step, step * 2, step * 3],
+            default=lambda: fired.append(self.now),
+        )
+        scheduled = lambda key: any(entry[2] == key for entry in DEADLINES)
+
+        for ticks in (1, 2):
+            self.now = step * ticks
+            tick(workers)
+            self._wait_until(lambda: len(fired) == ticks and len(running) == 4)
+
+        self.assertEqual(fired, [step, step * 2], "the timer is not blocked")
+        self.assertFalse(any(scheduled(key) for key in slow_tasks))
+
+        release.set()
+        self._wait_until(lambda: all(scheduled(key) for key in slow_tasks))
+        self.now = step * 3
+        tick(workers)
+        self._wait_until(lambda: not EVENTS)
+
+        self.assertEqual(overlaps, [])
+        self.assertEqual(fired, [step, step * 2, step * 3])
+        self.assertAlmostEqual(lag_metrics()["max_lag_ms"], step * 1000)
+
+    def test_cancelling_a_running_task_leaves_no_stale_deadline(self):
+        started, release = threading.Event(), threading.Event()
+        workers = ThreadPoolExecutor(1)
+        self.addCleanup(workers.shutdown)
+        self.addCleanup(release.set)
+
+        def slow():
+            started.set()
+            release.wait(5)
+
+        running = add_task(timestamps=[1, 2], default=slow)
+        waiting = add_task(timestamps=[5], default=lambda: None)
+        stale = event_queue._STALE_DEADLINES
+        self.now = 1
+        tick(workers)
+        self.assertTrue(started.wait(5))
+
+        cancel_task(running, silently=True)
+        self.assertEqual(event_queue._STALE_DEADLINES, stale, "no heap entry to skip")
+        cancel_task(waiting, silently=True)
+        self.assertEqual(event_queue._STALE_DEADLINES, stale + 1)
+
+        release.set()
+        workers.shutdown()
+        self.assertFalse(any(entry[2] == running for entry in DEADLINES))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
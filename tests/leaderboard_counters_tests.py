@@ -0,0 +1,76 @@
+from pathlib import Path
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from vasiniyo_chat_bot.database.sqlite.dao import EventsDao
+from vasiniyo_chat_bot.database.sqlite.dao import LikesDao
+from vasiniyo_chat_bot.migration import sqlite_migration
+
+CHAT_ID = -100500
+EVENT_ID = 1
+
+
+def like_counts_from_history(conn: sqlite3.Connection) -> dict[int, int]:
+    rows = conn.execute(
+        "select to_user_id, count(*) from likes where chat_id = ? group by 1",
+        (CHAT_ID,),
+    )
+    return dict(rows.fetchall())
+
+
+def win_counts_from_history(conn: sqlite3.Connection) -> dict[int, int]:
+    rows = conn.execute(
+        """
+        select winner_user_id, count(*) from events
+        where chat_id = ? and event_id = ? group by 1
+        """,
+        (CHAT_ID, EVENT_ID),
+    )
+    return dict(rows.fetchall())
+
+
+class TestLeaderboardCounters(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.database_path = str(self.directory / "test.db")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.database_path)
+        self.addCleanup(conn.close)
+        return conn
+
+    # ---------- tests ----------------------------------------------------
+    def test_counters_follow_likes_and_events(self):
+        sqlite_migration.apply_migrations(self.database_path)
+        conn = self._connect()
+        rnd = random.Random(7)
+        for played in range(300):
+            LikesDao.save(conn, CHAT_ID, rnd.randrange(40), rnd.randrange(10))
+            conn.execute(
+                "insert into events values (?, ?, ?, ?)",
+                (CHAT_ID, rnd.randrange(10), EVENT_ID, played),
+            )
+        for winner, played in conn.execute(
+            "select winner_user_id, last_played from events where last_played % 3 = 0"
+        ).fetchall():
+            EventsDao.remove(conn, CHAT_ID, winner, EVENT_ID, played)
+        conn.execute("delete from likes where from_user_id < 5")
+
+        likes = like_counts_from_history(conn)
+        wins = win_counts_from_history(conn)
+
+        self.assertEqual(dict(LikesDao.get_leaderboard(conn, CHAT_ID, 100)), likes)
+        self.assertEqual(dict(EventsDao.fetch_top(conn, CHAT_ID, EVENT_ID, 100)), wins)
+        self.assertEqual(LikesDao.count_by_chat_and_to_user(conn, CHAT_ID, 99), 0)
+        top = LikesDao.get_leaderboard(conn, CHAT_ID, 3)
+        self.assertEqual([n for _, n in top], sorted(likes.values())[::-1][:3])
+
+
+if __name__ == "__main__":
+    unittest.main()
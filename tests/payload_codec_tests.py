@@ -0,0 +1,96 @@
+import json
+import unittest
+
+from vasiniyo_chat_bot.module.anime.anime_payload_factory import AnimePayloadFactory
+from vasiniyo_chat_bot.module.anime.dto import AnimeGenre
+from vasiniyo_chat_bot.module.captcha.captcha_payload_factory import (
+    CaptchaPayloadFactory,
+)
+from vasiniyo_chat_bot.module.dto import Action
+from vasiniyo_chat_bot.module.dto import Field
+from vasiniyo_chat_bot.module.payload_codec import decode_payload
+from vasiniyo_chat_bot.module.payload_codec import encode_payload
+from vasiniyo_chat_bot.module.titles.titles_payload_factory import TitlesPayload
+from vasiniyo_chat_bot.module.titles.titles_payload_factory import TitlesPayloadFactory
+
+USER_ID = 7_123_456_789
+TARGET_ID = 6_987_654_321
+
+
+def json_payload(action: Action, fields: dict[Field, int]) -> str:
+    return json.dumps(
+        {Field.ACTION_TYPE.value: action.value}
+        | {field.value: value for field, value in fields.items()}
+    )
+
+
+SAMPLES = [
+    (Action.ROLL_RANDOM_D6, {Field.USER_ID: USER_ID}),
+    (Action.ROLL_D6, {Field.USER_ID: USER_ID, Field.DICE_VALUE: 6}),
+    (Action.OPEN_STEAL_MENU, {Field.USER_ID: USER_ID, Field.PAGE: 12}),
+    (
+        Action.STEAL_TITLE,
+        {Field.USER_ID: USER_ID, Field.TITLE_BAG_ID: 99_999, Field.TARGET_USER_ID: 1},
+    ),
+    (
+        Action.GIFT_TITLE_MENU,
+        {Field.USER_ID: USER_ID, Field.TARGET_USER_ID: TARGET_ID, Field.PAGE: 300},
+    ),
+    (Action.CAPTCHA_UPDATE, {Field.USER_ID: USER_ID}),
+    (Action.ANIME, {Field.USER_ID: USER_ID, Field.ANIME_GENRE: 12}),
+    (Action.EXCHANGE_TITLE, {Field.USER_ID: -1, Field.TITLE_BAG_ID: 0}),
+]
+
+
+class TestPayloadCodec(unittest.TestCase):
+
+    # ---------- tests ----------------------------------------------------
+    def test_round_trip(self):
+        for action, fields in SAMPLES:
+            with self.subTest(action=action):
+                decoded = decode_payload(encode_payload(action, fields))
+                self.assertEqual(decoded, json.loads(json_payload(action, fields)))
+
+    def test_encoded_payload_is_smaller_than_json(self):
+        for action, fields in SAMPLES:
+            with self.subTest(action=action):
+                encoded = encode_payload(action, fields)
+                self.assertLess(len(encoded), len(json_payload(action, fields)))
+                self.assertLessEqual(len(encoded.encode()), 64)
+
+    def test_legacy_json_buttons_are_decoded(self):
+        legacy = json_payload(Action.OPEN_STEAL_MENU, {Field.USER_ID: 5, Field.PAGE: 2})
+
+        payload = TitlesPayloadFactory.get_payload(decode_payload(legacy))
+
+        self.assertEqual(payload, TitlesPayload(Action.OPEN_STEAL_MENU, 5, page=2))
+
+    def test_factories_round_trip(self):
+        titles = TitlesPayloadFactory.get_payload(
+            decode_payload(TitlesPayloadFactory.give_title(42, TARGET_ID, USER_ID))
+        )
+        captcha = CaptchaPayloadFactory.get_payload(
+            decode_payload(CaptchaPayloadFactory.update_captcha(USER_ID))
+        )
+        anime = AnimePayloadFactory.get_payload(
+            decode_payload(AnimePayloadFactory.anime_genre(USER_ID, AnimeGenre.DRAMA))
+        )
+
+        self.assertEqual(
+            titles,
+            TitlesPayload(
+                Action.GIVE_TITLE, USER_ID, target_id=TARGET_ID, title_bag_id=42
+            ),
+        )
+        self.assertEqual(
+            (captcha.action, captcha.user_id), (Action.CAPTCHA_UPDATE, USER_ID)
+        )
+        self.assertEqual(anime.genre, AnimeGenre.DRAMA)
+
+    def test_garbage_is_decoded_to_empty_payload(self):
+        self.assertEqual(decode_payload("not-a-payload"), {})
+        self.assertEqual(decode_payload("{broken"), {})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+
+from tests import migrated_database
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
+from vasiniyo_chat_bot.database.sqlite.dao import PendingTitlesDao
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_pending_titles_repository import (
+    SqlitePendingTitlesRepository,
+)
+from vasiniyo_chat_bot.module.titles import pending_titles_store
+from vasiniyo_chat_bot.module.titles.pending_titles_store import PendingTitlesStore
+
+CHAT_ID = -100500
+
+
+class TestPendingTitlesStore(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.database_path = migrated_database(self)
+        self.repository = SqlitePendingTitlesRepository(
+            PendingTitlesDao(),
+            SqliteDatabaseSettings(self.database_path, write_executor=False),
+        )
+        self.generated = 0
+        self.day = 1000
+        patcher = mock.patch.object(pending_titles_store, "datetime")
+        self.addCleanup(patcher.stop)
+        patcher.start().date.today.side_effect = lambda: mock.Mock(
+            toordinal=lambda: self.day
+        )
+
+    def _generate(self) -> str:
+        self.generated += 1
+        return f"title{self.generated}"
+
+    def _persisted(self) -> int:
+        return self.repository.transaction(
+            lambda conn: conn.execute("select count(*) from pending_titles").fetchone()
+        )[0]
+
+    # ---------- tests ----------------------------------------------------
+    def test_preview_survives_restart(self):
+        title = PendingTitlesStore(self.repository).get(CHAT_ID, 1, self._generate)
+
+        restarted = PendingTitlesStore(self.repository)
+
+        self.assertEqual(restarted.get(CHAT_ID, 1, self._generate), title)
+        self.assertEqual(self.generated, 1)
+
+    def test_past_days_are_evicted(self):
+        store = PendingTitlesStore(self.repository)
+        for user_id in range(5):
+            store.get(CHAT_ID, user_id, self._generate)
+
+        self.day += 1
+        title = store.get(CHAT_ID, 0, self._generate)
+
+        self.assertEqual(title, "title6")
+        self.assertEqual(len(store), 1)
+        self.assertEqual(self._persisted(), 1)
+
+    def test_memory_is_capped_and_removed_titles_are_regenerated(self):
+        store = PendingTitlesStore(max_size=3)
+        first = store.get(CHAT_ID, 0, self._generate)
+        for user_id in range(1, 10):
+            store.get(CHAT_ID, user_id, self._generate)
+        self.assertEqual(len(store), 3)
+
+        store.remove(CHAT_ID, 9)
+
+        self.assertNotEqual(store.get(CHAT_ID, 0, self._generate), first)
+        self.assertEqual(store.get(CHAT_ID, 9, self._generate), "title12")
+
+    def test_removed_title_is_not_read_back_from_pending_write(self):
+        SqliteConnectionManager.close_all()
+        repository = SqlitePendingTitlesRepository(
+            PendingTitlesDao(),
+            SqliteDatabaseSettings(self.database_path, write_batch_window_ms=100),
+        )
+        store = PendingTitlesStore(repository, max_size=1)
+        first = store.get(CHAT_ID, 1, self._generate)
+        store.get(CHAT_ID, 2, self._generate)
+        repository.write(lambda conn: None)
+
+        store.remove(CHAT_ID, 1)
+
+        self.assertNotEqual(store.get(CHAT_ID, 1, self._generate), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import inspect
+import re
+import sqlite3
+import unittest
+
+from tests import migrated_database
+from vasiniyo_chat_bot.database.sqlite import dao
+from vasiniyo_chat_bot.database.sqlite.entity import CaptchaUserEntity
+from vasiniyo_chat_bot.database.sqlite.entity import ScheduledTaskEntity
+from vasiniyo_chat_bot.database.sqlite.entity.title_bag_entity import TitlesBagEntity
+
+CHAT_ID = -100500
+
+ARGUMENTS = {
+    "chat_id": CHAT_ID,
+    "user_id": 1,
+    "from_user_id": 1,
+    "to_user_id": 2,
+    "event_id": 1,
+    "limit": 10,
+    "last_played": 0,
+    "titles_bag_id": 1,
+    "is_inventory": True,
+    "entity": TitlesBagEntity(CHAT_ID, 1, "title", True),
+    "exclude_user_id": 2,
+    "cursor": None,
+    "forward": True,
+    "username": "user",
+    "full_name": "User",
+    "is_member": True,
+    "day": 1,
+    "title": "title",
+    "task_id": "task",
+    "task": ScheduledTaskEntity("task", "captcha", [1, CHAT_ID], [5, 10], 0.0),
+    "captcha_user": CaptchaUserEntity(CHAT_ID, 1, 0, 60, "answer"),
+}
+
+KEYSET_CURSORS = {
+    "page_inventory": ("title", 1),
+    "page_user_titles": (True, "title", 1),
+    "page_title_counts": (3, 1),
+}
+
+# Statements that read a whole table on purpose, e.g. recovery at startup.
+FULL_SCANS = {"ScheduledTasksDao.find_all"}
+
+
+class PlanRecordingConnection:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self.statement = ""
+        self.plans: list[tuple[str, str, list[str]]] = []
+
+    def execute(self, query: str, args: tuple = ()) -> sqlite3.Cursor:
+        plan = self._conn.execute(f"explain query plan {query}", args).fetchall()
+        self.plans.append((self.statement, query, [row[3] for row in plan]))
+        return self._conn.execute(query, args)
+
+
+class TestQueryPlans(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        database_path = migrated_database(self)
+        self.conn = sqlite3.connect(database_path)
+        self.addCleanup(self.conn.close)
+        tables = [
+            name
+            for (name,) in self.conn.execute(
+                "select name from sqlite_master where type = 'table'"
+            )
+        ]
+        self.table_scan = re.compile(rf"^SCAN ({'|'.join(map(re.escape, tables))})\b")
+        self.conn.execute("analyze")
+
+    def _run_every_statement(self) -> list[tuple[str, str, list[str]]]:
+        recorder = PlanRecordingConnection(self.conn)
+        for dao_name in dir(dao):
+            dao_class = getattr(dao, dao_name)
+            if not inspect.isclass(dao_class):
+                continue
+            for name, method in inspect.getmembers(dao_class, inspect.isfunction):
+                if name.startswith("_"):
+                    continue
+                parameters = list(inspect.signature(method).parameters)[1:]
+                variants = [{}]
+                if name in KEYSET_CURSORS:
+                    variants += [
+                        {"cursor": KEYSET_CURSORS[name], "forward": forward}
+                        for forward in (True, False)
+                    ]
+                recorder.statement = f"{dao_name}.{name}"
+                for variant in variants:
+                    arguments = ARGUMENTS | variant
+                    with self.subTest(statement=recorder.statement, **variant):
+                        method(recorder, *(arguments[p] for p in parameters))
+        return recorder.plans
+
+    # ---------- tests ----------------------------------------------------
+    def test_no_statement_scans_a_table(self):
+        plans = self._run_every_statement()
+
+        self.assertGreater(len(plans), 15)
+        for statement, query, details in plans:
+            scans = [detail for detail in details if self.table_scan.match(detail)]
+            with self.subTest(query=" ".join(query.split())):
+                if statement in FULL_SCANS:
+                    self.assertTrue(scans, f"{statement} no longer scans, drop it")
+                else:
+                    self.assertFalse(scans, details)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from vasiniyo_chat_bot.config import ReplyReader
+
+CATEGORIES = {"good": ["хороший", "отличный"], "pet": ["кот", "пёс", "хомяк"]}
+
+
+class TestReplyReader(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def _requests(self, text_to_text: dict[str, str]) -> list[str]:
+        section = {"categories": CATEGORIES, "text_to_text": text_to_text}
+        replies = ReplyReader(section, {}).load()
+        return [trigger.request for trigger in replies.text_replies]
+
+    # ---------- tests ----------------------------------------------------
+    def test_template_without_placeholders_is_kept_once(self):
+        self.assertEqual(self._requests({"привет": "и тебе"}), ["привет"])
+
+    def test_only_referenced_categories_are_expanded(self):
+        self.assertEqual(
+            self._requests({"{good} бот": "спасибо"}), ["хороший бот", "отличный бот"]
+        )
+
+    def test_several_categories_expand_to_their_product(self):
+        requests = self._requests({"{good} {pet}, {good}!": "да"})
+
+        self.assertEqual(len(requests), 6)
+        self.assertIn("отличный хомяк, отличный!", requests)
+        self.assertFalse(any("{" in request for request in requests))
+
+    def test_equal_requests_are_deduplicated(self):
+        requests = self._requests({"{good} кот": "мяу", "хороший кот": "мур"})
+
+        self.assertEqual(sorted(requests), ["отличный кот", "хороший кот"])
+
+    def test_unknown_placeholders_are_left_as_is(self):
+        self.assertEqual(self._requests({"{bad} бот": "нет"}), ["{bad} бот"])
+
+
+if __name__ == "__main__":
+    unittest.main()
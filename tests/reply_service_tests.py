@@ -0,0 +1,136 @@
+import random
+import unittest
+from unittest import mock
+
+from vasiniyo_chat_bot.module.reply.dto import LongMessage
+from vasiniyo_chat_bot.module.reply.dto import MessageType
+from vasiniyo_chat_bot.module.reply.dto import StickerResult
+from vasiniyo_chat_bot.module.reply.dto import StickerTrigger
+from vasiniyo_chat_bot.module.reply.dto import TextResult
+from vasiniyo_chat_bot.module.reply.dto import TextTrigger
+from vasiniyo_chat_bot.module.reply.dto import TriggerReplies
+from vasiniyo_chat_bot.module.reply.fuzzy_match import fuzzy_match
+from vasiniyo_chat_bot.module.reply.fuzzy_match.fuzzy_index import FuzzyIndex
+from vasiniyo_chat_bot.module.reply.reply_service import ReplyService
+
+WORDS = ["привет", "пока", "кот", "собака", "бот", "ghbdtn", "hello", "мир", "чай"]
+
+
+def text_trigger(request: str, response: str, **overrides) -> TextTrigger:
+    fields = dict(
+        response_type=MessageType.TEXT,
+        request=request,
+        responses=[response],
+        chance=1.0,
+        to_target=False,
+        fuzzy=True,
+        exact_match=False,
+    )
+    return TextTrigger(**(fields | overrides))
+
+
+def sticker_trigger(file_id: str, response: str, **overrides) -> StickerTrigger:
+    fields = dict(
+        response_type=MessageType.STICKER,
+        request=file_id,
+        responses=[response],
+        chance=1.0,
+        to_target=False,
+        fuzzy=False,
+        exact_match=False,
+    )
+    return StickerTrigger(**(fields | overrides))
+
+
+def random_keys(rnd: random.Random, count: int) -> list[str]:
+    return [
+        " ".join(rnd.choice(WORDS) + rnd.choice(["", "а", "ы"]) for _ in range(n))
+        for n in (rnd.randint(1, 3) for _ in range(count))
+    ]
+
+
+class TestReplyService(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def _service(self, *triggers: TextTrigger) -> ReplyService:
+        return ReplyService(LongMessage([], 4096), TriggerReplies(list(triggers), []))
+
+    # ---------- tests ----------------------------------------------------
+    def test_index_matches_like_per_key_matching(self):
+        rnd = random.Random(23)
+        keys = random_keys(rnd, 300)
+        index = FuzzyIndex(keys)
+        for message in random_keys(rnd, 200):
+            expected = {
+                matched
+                for key in keys
+                for matched, _ in fuzzy_match.test_match(message, [key])
+                if matched is not None
+            }
+
+            self.assertEqual(index.match(message).keys(), expected)
+
+    def test_fuzzy_reply_in_wrong_layout_is_prefixed(self):
+        service = self._service(text_trigger("привет", "и тебе"))
+
+        self.assertEqual(
+            service.handle_text_replies("ну ghbdtn"),
+            TextResult(text="привет?\nи тебе", to_reply=False),
+        )
+        self.assertEqual(
+            service.handle_text_replies("ну привет"),
+            TextResult(text="и тебе", to_reply=False),
+        )
+        self.assertIsNone(service.handle_text_replies("ну пока"))
+
+    def test_exact_match_triggers_do_not_fuzzy_match(self):
+        service = self._service(
+            text_trigger("да", "пизда", exact_match=True, fuzzy=False)
+        )
+
+        self.assertIsNotNone(service.handle_text_replies("да"))
+        self.assertIsNone(service.handle_text_replies("ну да"))
+
+    def test_non_fuzzy_triggers_match_only_equal_text(self):
+        service = self._service(text_trigger("привет", "и тебе", fuzzy=False))
+
+        self.assertEqual(
+            service.handle_text_replies("привет"),
+            TextResult(text="и тебе", to_reply=False),
+        )
+        self.assertIsNone(service.handle_text_replies("ну привет"))
+        self.assertIsNone(service.handle_text_replies("привет!"))
+
+    def test_sticker_replies_match_only_equal_file_id(self):
+        service = ReplyService(
+            LongMessage([], 4096),
+            TriggerReplies([], [sticker_trigger("AgADBAAD", "reply-sticker")]),
+        )
+
+        self.assertEqual(
+            service.handle_sticker_replies("AgADBAAD"),
+            StickerResult(file_id="reply-sticker", to_reply=False),
+        )
+        self.assertIsNone(service.handle_sticker_replies("AgADBAAE"))
+
+    def test_chance_is_rolled_only_for_matching_triggers(self):
+        service = ReplyService(
+            LongMessage([], 4096),
+            TriggerReplies(
+                [],
+                [
+                    sticker_trigger(f"sticker-{i}", "reply", chance=0.5)
+                    for i in range(100)
+                ],
+            ),
+        )
+
+        with mock.patch("random.random", return_value=0.0) as roll:
+            self.assertIsNotNone(service.handle_sticker_replies("sticker-42"))
+            self.assertEqual(roll.call_count, 1)
+            self.assertIsNone(service.handle_sticker_replies("sticker-100"))
+            self.assertEqual(roll.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
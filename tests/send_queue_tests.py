@@ -0,0 +1,157 @@
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+import json
+import threading
+import time
+import unittest
+
+from telebot import TeleBot
+from telebot import apihelper
+
+from vasiniyo_chat_bot.module.dto import Priority
+from vasiniyo_chat_bot.module.dto import UserContext
+from vasiniyo_chat_bot.telegram.bot_service import BotService
+from vasiniyo_chat_bot.telegram.send_queue import SendQueue
+from vasiniyo_chat_bot.telegram.service.markdown_v2_service import MarkdownV2Service
+
+CHAT_ID = -100500
+
+SENT_MESSAGE = {
+    "message_id": 1,
+    "date": 1700000000,
+    "chat": {"id": CHAT_ID, "type": "supergroup", "title": "chat"},
+    "text": "hello",
+}
+
+FLOOD = {
+    "ok": False,
+    "error_code": 429,
+    "description": "Too Many Requests: retry after 1",
+    "parameters": {"retry_after": 1},
+}
+
+
+class FakeBotApi:
+    def __init__(self, responses: list[tuple[int, dict]]):
+        self.requests = []
+        self._responses = responses
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                method = self.path.split("?")[0].rsplit("/", 1)[-1]
+                fake.requests.append((method, time.monotonic()))
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, body = (
+                    fake._responses.pop(0)
+                    if fake._responses
+                    else (200, {"ok": True, "result": SENT_MESSAGE})
+                )
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/bot{{0}}/{{1}}"
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestSendQueue(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self._api_url = apihelper.API_URL
+
+    def tearDown(self):
+        apihelper.API_URL = self._api_url
+
+    def _bot_service(self, fake_api: FakeBotApi) -> BotService:
+        apihelper.API_URL = fake_api.url
+        self.addCleanup(fake_api.shutdown)
+        bot = TeleBot("123:TEST", threaded=False)
+        return BotService(bot, MarkdownV2Service(), SendQueue())
+
+    # ---------- tests ----------------------------------------------------
+    def test_message_is_retried_after_flood_wait(self):
+        fake_api = FakeBotApi([(429, FLOOD)])
+        service = self._bot_service(fake_api)
+
+        message = service.send_message("hello", UserContext(1, CHAT_ID, None, None))
+
+        self.assertEqual(message.message_id, 1)
+        self.assertEqual(
+            [method for method, _ in fake_api.requests], ["sendMessage"] * 2
+        )
+        self.assertGreaterEqual(fake_api.requests[1][1] - fake_api.requests[0][1], 1)
+
+    def test_future_resolves_to_sent_message(self):
+        service = self._bot_service(FakeBotApi([]))
+
+        future = service.send_message(
+            "hello", UserContext(1, CHAT_ID, None, None), wait=False
+        )
+
+        self.assertEqual(future.result(timeout=5).text, "hello")
+
+    def test_high_priority_overtakes_queued_low_priority(self):
+        queue = SendQueue()
+        release = threading.Event()
+        order = []
+        queue.submit(CHAT_ID, release.wait)
+        low = queue.submit(CHAT_ID, lambda: order.append("low"), Priority.LOW)
+        high = queue.submit(CHAT_ID, lambda: order.append("high"), Priority.HIGH)
+
+        release.set()
+        low.result(timeout=5)
+        high.result(timeout=5)
+
+        self.assertEqual(order, ["high", "low"])
+
+    def test_calls_without_chat_are_not_serialized(self):
+        queue = SendQueue()
+        barrier = threading.Barrier(3, timeout=5)
+
+        futures = [queue.submit(None, barrier.wait) for _ in range(3)]
+
+        self.assertEqual(sorted(f.result(timeout=5) for f in futures), [0, 1, 2])
+
+    def test_edits_do_not_take_from_the_group_minute_bucket(self):
+        queue = SendQueue(chat_rate=100, chat_burst=100, group_per_minute=1)
+        queue.submit(CHAT_ID, lambda: "sent").result(timeout=5)
+
+        edits = [
+            queue.submit(CHAT_ID, lambda: "edited", new_message=False) for _ in range(3)
+        ]
+        second = queue.submit(CHAT_ID, lambda: "sent")
+
+        self.assertEqual([f.result(timeout=2) for f in edits], ["edited"] * 3)
+        self.assertFalse(second.done())
+
+    def test_deletes_and_edits_do_not_block_the_handler(self):
+        queue = SendQueue()
+        bot = TeleBot("123:TEST", threaded=False)
+        deleted = threading.Event()
+        bot.delete_message = lambda chat_id, message_id: deleted.set()
+        service = BotService(bot, MarkdownV2Service(), queue)
+        release = threading.Event()
+        queue.submit(CHAT_ID, release.wait)
+
+        service.delete_message(UserContext(1, CHAT_ID, 10, None))
+
+        self.assertFalse(deleted.is_set())
+        release.set()
+        self.assertTrue(deleted.wait(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+from pathlib import Path
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from vasiniyo_chat_bot.database.sqlite.connection_manager import SqliteConnectionManager
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_repository import (
+    SqliteRepository,
+)
+
+
+def insert(conn: sqlite3.Connection, value: int):
+    conn.execute("insert into items (value) values (?)", (value,))
+
+
+def count(conn: sqlite3.Connection) -> int:
+    return conn.execute("select count(*) from items").fetchone()[0]
+
+
+class TestSqliteRepository(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(SqliteConnectionManager.close_all)
+        self.database_path = str(Path(directory.name) / "test.db")
+        with sqlite3.connect(self.database_path) as conn:
+            conn.execute("create table items (value integer)")
+        self.repository = SqliteRepository(SqliteDatabaseSettings(self.database_path))
+
+    # ---------- tests ----------------------------------------------------
+    def test_connection_is_reused_by_the_same_thread(self):
+        first = self.repository.transaction(lambda conn: conn)
+        second = self.repository.transaction(lambda conn: conn)
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(self.repository.transaction(lambda c: c))
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other[0])
+
+    def test_nested_transactions_commit_together(self):
+        another = SqliteRepository(SqliteDatabaseSettings(self.database_path))
+
+        def _tx(conn):
+            insert(conn, 1)
+            another.transaction(lambda inner: insert(inner, 2))
+            raise RuntimeError("rollback")
+
+        with self.assertRaises(RuntimeError):
+            self.repository.transaction(_tx)
+
+        self.assertEqual(self.repository.transaction(count), 0)
+
+    def test_broken_connection_is_reopened(self):
+        manager = SqliteConnectionManager(
+            SqliteDatabaseSettings(self.database_path), health_check_after=0
+        )
+        broken = manager.connection()
+        broken.close()
+
+        conn = manager.connection()
+
+        self.assertIsNot(conn, broken)
+        self.assertEqual(manager.transaction(count), 0)
+        manager.close()
+
+    def test_pragma_profile_is_applied(self):
+        settings = SqliteDatabaseSettings(
+            self.database_path, synchronous="full", cache_size=-2000
+        )
+        manager = SqliteConnectionManager(settings)
+
+        effective = manager.report()
+        manager.close()
+
+        self.assertEqual(effective["journal_mode"], "wal")
+        self.assertEqual(effective["synchronous"], 2)
+        self.assertEqual(effective["cache_size"], -2000)
+        self.assertEqual(effective["temp_store"], 2)
+        self.assertEqual(effective["busy_timeout"], 5000)
+
+    def test_concurrent_writes_are_group_committed(self):
+        settings = SqliteDatabaseSettings(self.database_path, write_batch_window_ms=50)
+        manager = SqliteConnectionManager(settings)
+        self.addCleanup(manager.close)
+        futures = [
+            manager.submit_write(lambda conn, i=i: insert(conn, i)) for i in range(20)
+        ]
+
+        for future in futures:
+            future.result(timeout=5)
+
+        self.assertEqual(manager.transaction(count), 20)
+        self.assertEqual(manager._writer.writes, 20)
+        self.assertLess(manager._writer.batches, 20)
+
+    def test_failed_write_is_rolled_back_alone(self):
+        settings = SqliteDatabaseSettings(self.database_path, write_batch_window_ms=50)
+        manager = SqliteConnectionManager(settings)
+        self.addCleanup(manager.close)
+
+        def _failing(conn):
+            insert(conn, 1)
+            raise ValueError("broken write")
+
+        first = manager.submit_write(lambda conn: insert(conn, 0))
+        failing = manager.submit_write(_failing)
+        last = manager.submit_write(lambda conn: (insert(conn, 2), count(conn))[1])
+
+        first.result(timeout=5)
+        self.assertRaises(ValueError, failing.result, timeout=5)
+        self.assertEqual(last.result(timeout=5), 2)
+        self.assertEqual(manager.transaction(count), 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
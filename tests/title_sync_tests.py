@@ -0,0 +1,174 @@
+from types import SimpleNamespace
+import unittest
+
+from telebot.apihelper import ApiTelegramException
+from telebot.types import ChatMemberAdministrator
+from telebot.types import ChatMemberMember
+from telebot.types import ChatMemberUpdated
+from telebot.types import User
+
+from vasiniyo_chat_bot.module.dto import UserContext
+from vasiniyo_chat_bot.telegram.bot_service import BotService
+from vasiniyo_chat_bot.telegram.service.markdown_v2_service import MarkdownV2Service
+from vasiniyo_chat_bot.telegram.title_sync_cache import TitleSyncCache
+
+CHAT_ID = -100500
+BOT_ID = 42
+
+
+def administrator(user_id: int, can_manage_tags: bool) -> ChatMemberAdministrator:
+    return ChatMemberAdministrator(
+        User(user_id, True, "bot"),
+        "administrator",
+        False,
+        False,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+        True,
+        can_manage_tags=can_manage_tags,
+    )
+
+
+class FakeBot:
+    def __init__(self):
+        self.calls = []
+        self.bot_member = administrator(BOT_ID, can_manage_tags=True)
+        self.tags = {}
+        self.failures = 0
+
+    def get_me(self):
+        self.calls.append("getMe")
+        return User(BOT_ID, True, "bot")
+
+    def get_chat_member(self, chat_id: int, user_id: int):
+        self.calls.append("getChatMember")
+        if self.failures:
+            self.failures -= 1
+            raise ApiTelegramException(
+                "getChatMember",
+                None,
+                {"error_code": 429, "description": "Too Many Requests: retry after 1"},
+            )
+        if user_id == BOT_ID:
+            return self.bot_member
+        member = ChatMemberMember(User(user_id, False, f"user{user_id}"), "member")
+        member.tag = self.tags.get(user_id)
+        return member
+
+    def set_chat_member_tag(self, chat_id: int, user_id: int, tag: str):
+        self.calls.append("setChatMemberTag")
+        self.tags[user_id] = tag
+
+
+class TestTitleSync(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.bot = FakeBot()
+        self.service = BotService(self.bot, MarkdownV2Service())
+
+    def _sync(self, user_id: int, title: str) -> str | None:
+        ctx = UserContext(user_id, CHAT_ID, None, None)
+        if self.service.get_admin_title(ctx) == title:
+            return title
+        return self.service.set_title(ctx, title)
+
+    # ---------- tests ----------------------------------------------------
+    def test_synced_title_is_confirmed_without_api_calls(self):
+        self.assertEqual(self._sync(1, "title"), "title")
+        self.bot.calls.clear()
+
+        self.assertEqual(self._sync(1, "title"), "title")
+
+        self.assertEqual(self.bot.calls, [])
+
+    def test_bot_rights_are_fetched_once_per_chat(self):
+        self._sync(1, "first")
+        self._sync(2, "second")
+
+        self.assertEqual(self.bot.calls.count("getMe"), 1)
+        self.assertEqual(
+            self.bot.calls.count("getChatMember"), 2 + 1, "two users and the bot"
+        )
+
+    def test_member_updates_invalidate_cached_state(self):
+        self._sync(1, "title")
+        self.service.update_bot_member(
+            SimpleNamespace(
+                chat=SimpleNamespace(id=CHAT_ID),
+                new_chat_member=administrator(BOT_ID, can_manage_tags=False),
+            )
+        )
+        self.service.forget_changed_members(
+            [
+                SimpleNamespace(
+                    chat=SimpleNamespace(id=CHAT_ID),
+                    left_chat_member=User(1, False, "user1"),
+                    new_chat_members=None,
+                )
+            ]
+        )
+        self.bot.calls.clear()
+
+        self.assertIsNone(self._sync(1, "another"))
+        self.assertEqual(self.bot.calls, ["getChatMember"])
+
+    def test_failed_lookups_are_not_cached(self):
+        self.service.get_admin_title(UserContext(2, CHAT_ID, None, None))
+        self.bot.failures = 1
+
+        self.assertIsNone(self._sync(2, "title"), "bot rights lookup failed")
+        self.assertEqual(self._sync(2, "title"), "title")
+
+        self.bot.failures = 1
+        self.assertIsNone(
+            self.service.get_admin_title(UserContext(3, CHAT_ID, None, None))
+        )
+        self.bot.tags[3] = "tag"
+        self.assertEqual(
+            self.service.get_admin_title(UserContext(3, CHAT_ID, None, None)), "tag"
+        )
+
+    def test_invalidated_member_title_is_read_again(self):
+        self._sync(1, "title")
+        self.bot.tags[1] = "edited by admin"
+        self.service.invalidate_chat_member(CHAT_ID, 1)
+
+        self.assertEqual(self._sync(1, "title"), "title")
+        self.assertEqual(self.bot.calls[-1], "setChatMemberTag")
+
+
+class TestTitleSyncCache(unittest.TestCase):
+
+    # ---------- tests ----------------------------------------------------
+    def test_load_overlapping_forget_is_not_stored(self):
+        cache = TitleSyncCache()
+
+        def load(chat_id: int, user_id: int):
+            cache.forget(chat_id, user_id)
+            return "stale"
+
+        self.assertEqual(cache.title(CHAT_ID, 1, load), "stale")
+        self.assertEqual(cache.title(CHAT_ID, 1, lambda *_: "fresh"), "fresh")
+
+    def test_load_overlapping_confirm_keeps_the_confirmed_title(self):
+        cache = TitleSyncCache()
+
+        def load(chat_id: int, user_id: int):
+            cache.confirm(chat_id, user_id, "written")
+            return "stale"
+
+        cache.title(CHAT_ID, 1, load)
+
+        self.assertEqual(cache.title(CHAT_ID, 1, lambda *_: "reloaded"), "written")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from tests import migrated_database
+from vasiniyo_chat_bot.database.sqlite.dao import TitlesBagDAO
+from vasiniyo_chat_bot.database.sqlite.dao import TitlesStatesDAO
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_titles_repository import (
+    SqliteTitlesRepository,
+)
+from vasiniyo_chat_bot.module.titles.cached_titles_repository import (
+    CachedTitlesRepository,
+)
+
+CHAT_ID = -100500
+ACTOR_ID = 1
+TARGET_ID = 2
+
+
+class TestCachedTitlesRepository(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        database_path = migrated_database(self)
+        self.repository = CachedTitlesRepository(
+            SqliteTitlesRepository(
+                TitlesStatesDAO(), TitlesBagDAO(), SqliteDatabaseSettings(database_path)
+            )
+        )
+        self.repository.init_title(CHAT_ID, ACTOR_ID, "actor")
+        self.repository.init_title(CHAT_ID, TARGET_ID, "target")
+
+    # ---------- tests ----------------------------------------------------
+    def test_repeated_reads_are_served_from_cache(self):
+        for _ in range(3):
+            self.repository.find_user_title(CHAT_ID, ACTOR_ID)
+            self.repository.get_rolls_remaining(CHAT_ID, ACTOR_ID)
+
+        stats = self.repository.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (4, 2))
+
+    def test_mutation_invalidates_cached_state(self):
+        self.assertEqual(self.repository.find_user_title(CHAT_ID, ACTOR_ID), "actor")
+        self.assertEqual(
+            self.repository.get_rolls_remaining(CHAT_ID, ACTOR_ID), (True, 0)
+        )
+
+        self.repository.rotate_title(CHAT_ID, ACTOR_ID, "rotated")
+
+        self.assertEqual(self.repository.find_user_title(CHAT_ID, ACTOR_ID), "rotated")
+        self.assertEqual(
+            self.repository.get_rolls_remaining(CHAT_ID, ACTOR_ID), (False, 0)
+        )
+        self.assertEqual(
+            [
+                row.value[2]
+                for row in self.repository.get_user_titles_bag(CHAT_ID, ACTOR_ID).rows
+            ],
+            ["actor"],
+        )
+
+    def test_steal_invalidates_actor_and_target(self):
+        target_title = self.repository.find_user_title(CHAT_ID, TARGET_ID)
+        self.repository.find_user_title(CHAT_ID, ACTOR_ID)
+        title_id = next(
+            entity.id
+            for entity in self.repository.get_user_titles(CHAT_ID)
+            if entity.user_title == target_title
+        )
+
+        self.repository.steal_logic(CHAT_ID, ACTOR_ID, title_id)
+
+        self.assertEqual(self.repository.find_user_title(CHAT_ID, ACTOR_ID), "target")
+        self.assertIsNone(self.repository.find_user_title(CHAT_ID, TARGET_ID))
+
+
+if __name__ == "__main__":
+    unittest.main()
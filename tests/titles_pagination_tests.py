@@ -0,0 +1,115 @@
+import random
+import unittest
+
+from tests import migrated_database
+from vasiniyo_chat_bot.database.sqlite.dao import TitlesBagDAO
+from vasiniyo_chat_bot.database.sqlite.dao import TitlesStatesDAO
+from vasiniyo_chat_bot.database.sqlite.entity import TitlesBagEntity
+from vasiniyo_chat_bot.database.sqlite.repository.dto import SqliteDatabaseSettings
+from vasiniyo_chat_bot.database.sqlite.repository.sqlite_titles_repository import (
+    SqliteTitlesRepository,
+)
+from vasiniyo_chat_bot.module.titles.titles_service import TitlesService
+
+CHAT_ID = -100500
+ACTOR_ID = 1
+PAGE_SIZE = 7
+
+
+class TestTitlesPagination(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        database_path = migrated_database(self)
+        self.repository = SqliteTitlesRepository(
+            TitlesStatesDAO(), TitlesBagDAO(), SqliteDatabaseSettings(database_path)
+        )
+        self.service = TitlesService(None, self.repository)
+        rnd = random.Random(3)
+
+        def _fill(conn):
+            TitlesStatesDAO.save(conn, CHAT_ID, ACTOR_ID)
+            for user_id in range(1, 6):
+                TitlesBagDAO.save(
+                    conn, TitlesBagEntity(CHAT_ID, user_id, f"current {user_id}", False)
+                )
+            for _ in range(60):
+                TitlesBagDAO.save(
+                    conn,
+                    TitlesBagEntity(
+                        CHAT_ID,
+                        rnd.randrange(1, 6),
+                        f"title {rnd.randrange(20):02}",
+                        True,
+                    ),
+                )
+
+        self.repository.transaction(_fill)
+
+    def _steal_menu(self, page: int, cursor: int | None):
+        return self.service.show_steal_menu(CHAT_ID, ACTOR_ID, page, PAGE_SIZE, cursor)
+
+    def _walk(self, show) -> list[list[int]]:
+        pages, cursor, page = [], None, 0
+        while True:
+            menu = show(page, cursor)
+            pages.append(menu)
+            if not menu.has_more_pages:
+                return pages
+            page, cursor = menu.page + 1, self._ids(menu)[-1]
+
+    @staticmethod
+    def _ids(menu) -> list[int]:
+        if hasattr(menu, "titles"):
+            return [title.id for title in menu.titles]
+        return [item.titles_bag_id for item in menu.items]
+
+    # ---------- tests ----------------------------------------------------
+    def test_steal_menu_pages_follow_the_full_ordering(self):
+        rows = self.repository.get_user_titles(CHAT_ID)
+        counts = {}
+        for row in rows:
+            counts[row.user_id] = counts.get(row.user_id, 0) + 1
+        expected = [
+            row.id
+            for row in sorted(
+                rows,
+                key=lambda row: (
+                    -counts[row.user_id],
+                    row.user_id,
+                    row.is_inventory,
+                    row.user_title,
+                    row.id,
+                ),
+            )
+            if row.user_id != ACTOR_ID
+        ]
+
+        pages = self._walk(self._steal_menu)
+
+        self.assertEqual([i for menu in pages for i in self._ids(menu)], expected)
+        self.assertTrue(all(len(self._ids(menu)) == PAGE_SIZE for menu in pages[:-1]))
+
+    def test_previous_page_cursor_returns_the_same_page(self):
+        pages = self._walk(self._steal_menu)
+
+        for page, menu in enumerate(pages[1:], start=1):
+            previous = self._steal_menu(page - 1, -self._ids(menu)[0])
+            self.assertEqual(self._ids(previous), self._ids(pages[page - 1]))
+            self.assertEqual(previous.has_prev_pages, page > 1)
+
+    def test_titles_bag_pages_are_sorted_by_title(self):
+        bag = self.repository.get_user_titles_bag(CHAT_ID, 2).rows
+        expected = [row.value[0] for row in sorted(bag, key=lambda r: r.value[::-1])]
+
+        pages = self._walk(
+            lambda page, cursor: self.service.handle_show_titles_bag(
+                CHAT_ID, 2, page, 3, cursor
+            )
+        )
+
+        self.assertEqual([i for menu in pages for i in self._ids(menu)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
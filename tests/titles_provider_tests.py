@@ -0,0 +1,75 @@
+from collections import Counter
+import random
+import unittest
+
+from vasiniyo_chat_bot.module.titles.dto import AdjectiveGroup
+from vasiniyo_chat_bot.module.titles.dto import CustomTitles
+from vasiniyo_chat_bot.module.titles.dto import NounGroup
+from vasiniyo_chat_bot.module.titles.dto import Nouns
+from vasiniyo_chat_bot.module.titles.titles_provider import TitlesProvider
+
+CUSTOM_TITLES = CustomTitles(
+    adjectives=[
+        AdjectiveGroup(["зл", "воинственн"], "ой", "ая", "ое", "ые"),
+        AdjectiveGroup(["тих", "скользк"], "ий", "ая", "ое", "ие"),
+    ],
+    nouns=Nouns(
+        male=[NounGroup(["кот", "бегемотик"], "", "ы")],
+        female=[NounGroup(["мышк", "черепашк"], "а", "и")],
+        neuter=[NounGroup(["сол", "облак"], "нце", "а")],
+    ),
+)
+
+
+def all_titles(custom_titles: CustomTitles) -> Counter:
+    titles = Counter()
+    for adjectives, nouns in TitlesProvider._forms(custom_titles):
+        for adjective in adjectives:
+            for noun in nouns:
+                if len(title := f"{adjective} {noun}") <= 16:
+                    titles[title] += 1
+    return titles
+
+
+class TestTitlesProvider(unittest.TestCase):
+
+    # ---------- tests ----------------------------------------------------
+    def test_space_contains_exactly_the_fitting_pairs(self):
+        provider = TitlesProvider(CUSTOM_TITLES)
+
+        self.assertEqual(provider.size, sum(all_titles(CUSTOM_TITLES).values()))
+
+    def test_titles_are_drawn_uniformly(self):
+        expected = all_titles(CUSTOM_TITLES)
+        provider = TitlesProvider(CUSTOM_TITLES)
+        random.seed(18)
+        draws = 400 * provider.size
+
+        drawn = Counter(provider.next_title() for _ in range(draws))
+
+        self.assertEqual(drawn.keys(), expected.keys())
+        chi_square = sum(
+            (drawn[title] - draws * n / provider.size) ** 2
+            / (draws * n / provider.size)
+            for title, n in expected.items()
+        )
+        # 99.9th percentile of chi-square with len(expected) - 1 <= 40 dof
+        self.assertLess(chi_square, 73.4)
+
+    def test_empty_space_is_reported(self):
+        provider = TitlesProvider(
+            CustomTitles(
+                adjectives=[AdjectiveGroup(["оченьдлинн"], "ый", "ая", "ое", "ые")],
+                nouns=Nouns(
+                    male=[NounGroup(["длиннослов"], "о", "а")], female=[], neuter=[]
+                ),
+            )
+        )
+
+        self.assertEqual(provider.size, 0)
+        with self.assertRaises(ValueError):
+            provider.next_title()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
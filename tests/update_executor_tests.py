@@ -0,0 +1,116 @@
+import threading
+from types import SimpleNamespace
+import unittest
+
+from telebot import ExceptionHandler
+from telebot import TeleBot
+from telebot.types import CallbackQuery
+from telebot.types import User
+
+from vasiniyo_chat_bot.telegram.update_executor import ChatShardedExecutor
+
+TIMEOUT = 5
+
+
+def message(chat_id: int, text: str = "") -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(id=chat_id), text=text)
+
+
+class Handled(ExceptionHandler):
+    def handle(self, exception):
+        return True
+
+
+class TestChatShardedExecutor(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.bot = TeleBot("123:TEST", threaded=False)
+        self.executor = ChatShardedExecutor(self.bot, workers=2)
+        self.addCleanup(self.executor.close)
+
+    def _drain(self) -> None:
+        done = [threading.Event() for _ in range(2)]
+        for chat_id, event in enumerate(done):
+            self.executor.put(lambda _, event=event: event.set(), message(chat_id))
+        for event in done:
+            self.assertTrue(event.wait(TIMEOUT))
+
+    # ---------- tests ----------------------------------------------------
+    def test_updates_of_one_chat_run_in_arrival_order(self):
+        handled = []
+        executor = ChatShardedExecutor(self.bot, workers=8)
+        self.addCleanup(executor.close)
+        for i in range(200):
+            executor.put(lambda m: handled.append(m.text), message(7, str(i)))
+        done = threading.Event()
+        executor.put(lambda _: done.set(), message(7))
+
+        self.assertTrue(done.wait(TIMEOUT))
+        self.assertEqual(handled, [str(i) for i in range(200)])
+
+    def test_different_chats_run_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=TIMEOUT)
+        passed = []
+
+        for chat_id in (0, 1):
+            self.executor.put(lambda _: passed.append(barrier.wait()), message(chat_id))
+        self._drain()
+
+        self.assertEqual(sorted(passed), [0, 1])
+
+    def test_callback_query_is_routed_by_its_message_chat(self):
+        for chat_id in range(10):
+            call = CallbackQuery(
+                1, User(1, False, "user"), "data", "instance", None, message(chat_id)
+            )
+
+            self.assertEqual(
+                self.executor.shard_of(call), self.executor.shard_of(message(chat_id))
+            )
+
+    def test_listener_batches_are_split_by_chat(self):
+        calls = []
+        self.executor.put(
+            lambda messages: calls.append([m.chat.id for m in messages]),
+            [message(0), message(1), message(2), message(3)],
+        )
+        self._drain()
+
+        self.assertEqual(sorted(calls), [[0, 2], [1, 3]])
+
+    def test_unhandled_exception_is_reported_to_polling(self):
+        error = ValueError("boom")
+
+        def fail(_):
+            raise error
+
+        self.executor.put(fail, message(0))
+
+        self.assertTrue(self.executor.exception_event.wait(TIMEOUT))
+        with self.assertRaises(ValueError) as raised:
+            self.executor.raise_exceptions()
+        self.assertIs(raised.exception, error)
+        self.executor.clear_exceptions()
+        self.executor.raise_exceptions()
+
+    def test_exception_handled_by_bot_is_not_reported(self):
+        self.bot.exception_handler = Handled()
+
+        self.executor.put(lambda _: 1 / 0, message(0))
+        self._drain()
+
+        self.assertFalse(self.executor.exception_event.is_set())
+
+    def test_close_stops_workers(self):
+        self._drain()
+
+        self.executor.close()
+
+        self.assertFalse(
+            [t for t in threading.enumerate() if t.name.startswith("UpdateShard")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+import json
+import threading
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request
+from urllib.request import urlopen
+
+from vasiniyo_chat_bot.config.webhook_reader import WebhookSettings
+from vasiniyo_chat_bot.telegram.webhook_server import SECRET_TOKEN_HEADER
+from vasiniyo_chat_bot.telegram.webhook_server import WebhookServer
+
+RECORDED_UPDATE = {
+    "update_id": 1001,
+    "message": {
+        "message_id": 42,
+        "date": 1700000000,
+        "chat": {"id": -100123, "type": "supergroup", "title": "chat"},
+        "from": {"id": 7, "is_bot": False, "first_name": "user"},
+        "text": "/help",
+    },
+}
+
+
+class RecordingBot:
+    def __init__(self):
+        self.updates = []
+
+    def process_new_updates(self, updates):
+        self.updates.extend(updates)
+
+
+class TestWebhookServer(unittest.TestCase):
+
+    # ---------- helpers --------------------------------------------------
+    def setUp(self):
+        self.bot = RecordingBot()
+        settings = WebhookSettings(
+            url="https://example.org/webhook",
+            path="/webhook",
+            host="127.0.0.1",
+            port=0,
+            secret_token="secret",
+            max_body_size=1 << 16,
+        )
+        self.server = WebhookServer(self.bot, settings)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def _post(self, body, *, path="/webhook", secret="secret"):
+        request = Request(
+            f"http://127.0.0.1:{self.server.port}{path}",
+            data=body,
+            headers={"Content-Type": "application/json", SECRET_TOKEN_HEADER: secret},
+            method="POST",
+        )
+        try:
+            with urlopen(request, timeout=5) as response:
+                return response.status
+        except HTTPError as e:
+            return e.code
+
+    # ---------- tests ----------------------------------------------------
+    def test_recorded_update_is_processed(self):
+        status = self._post(json.dumps(RECORDED_UPDATE).encode())
+
+        self.assertEqual(status, 200)
+        self.assertEqual(len(self.bot.updates), 1)
+        self.assertEqual(self.bot.updates[0].update_id, 1001)
+        self.assertEqual(self.bot.updates[0].message.text, "/help")
+
+    def test_invalid_secret_is_rejected(self):
+        status = self._post(json.dumps(RECORDED_UPDATE).encode(), secret="wrong")
+
+        self.assertEqual(status, 403)
+        self.assertEqual(self.bot.updates, [])
+
+    def test_unknown_path_and_malformed_body(self):
+        self.assertEqual(self._post(b"{}", path="/other"), 404)
+        self.assertEqual(self._post(b"not json"), 400)
+        self.assertEqual(self.bot.updates, [])
+
+
+if __name__ == "__main__":
+    unittest.main()